@@ -4,6 +4,9 @@ Benchmark attrs using CodSpeed.
 
 from __future__ import annotations
 
+import importlib
+import sys
+
 import pytest
 
 import attrs
@@ -14,6 +17,26 @@ pytestmark = pytest.mark.benchmark()
 ROUNDS = 1_000
 
 
+def test_import_attrs():
+    """
+    Benchmark importing attrs from scratch, like a short-lived process does.
+    """
+    saved = {
+        name: mod
+        for name, mod in sys.modules.items()
+        if name.partition(".")[0] in ("attr", "attrs")
+    }
+    try:
+        for _ in range(10):
+            for name in list(sys.modules):
+                if name.partition(".")[0] in ("attr", "attrs"):
+                    del sys.modules[name]
+
+            importlib.import_module("attrs")
+    finally:
+        sys.modules.update(saved)
+
+
 def test_create_simple_class():
     """
     Benchmark creating  a simple class without any extras.
@@ -42,6 +65,20 @@ def test_create_frozen_class():
         LocalC(1, "2", {})
 
 
+def test_create_lazy_class():
+    """
+    Benchmark creating a frozen, ordered class whose methods are generated on
+    first use.
+    """
+    for _ in range(ROUNDS):
+
+        @attrs.frozen(order=True, lazy_methods=True)
+        class LocalC:
+            x: int
+            y: str
+            z: dict[str, int]
+
+
 def test_create_simple_class_make_class():
     """
     Benchmark creating a simple class using attrs.make_class().
@@ -59,6 +96,36 @@ def test_create_simple_class_make_class():
         LocalC(1, "2", {})
 
 
+def test_create_same_class_make_class():
+    """
+    Benchmark creating the same class over and over using attrs.make_class().
+    """
+    for _ in range(ROUNDS):
+        LocalC = attrs.make_class(
+            "LocalC",
+            {
+                "x": attrs.field(type=int),
+                "y": attrs.field(type=str),
+                "z": attrs.field(type=dict[str, int]),
+            },
+        )
+
+        LocalC(1, "2", {})
+
+
+@pytest.mark.parametrize("depth", [1, 5, 10, 25, 50])
+def test_create_deep_hierarchy(depth):
+    """
+    Benchmark creating a hierarchy of *depth* classes that add a field each.
+    """
+    for _ in range(10):
+        base = object
+        for i in range(depth):
+            base = attrs.make_class(
+                f"LocalC{i}", {f"x{i}": attrs.field(default=i)}, bases=(base,)
+            )
+
+
 @attrs.define
 class C:
     x: int = 0
@@ -82,6 +149,262 @@ def test_instantiate_with_defaults():
         C()
 
 
+@attrs.define
+class ValidatedC:
+    x: int = attrs.field(validator=attrs.validators.instance_of(int))
+    y: str = attrs.field(
+        validator=[
+            attrs.validators.instance_of(str),
+            attrs.validators.max_len(10),
+        ]
+    )
+    z: int | None = attrs.field(
+        default=None,
+        validator=attrs.validators.optional(
+            [attrs.validators.ge(0), attrs.validators.lt(100)]
+        ),
+    )
+
+
+def test_instantiate_validated():
+    """
+    Benchmark instantiating a class with built-in validators.
+    """
+    for _ in range(ROUNDS):
+        ValidatedC(1, "2", 3)
+
+
+def test_setattr_validated():
+    """
+    Benchmark setting an attribute that is validated on_setattr.
+    """
+    c = ValidatedC(1, "2", 3)
+
+    for _ in range(ROUNDS):
+        c.z = 42
+
+
+@attrs.define
+class ConvertedC:
+    x: int | None = attrs.field(converter=attrs.converters.optional(int))
+    y: bool = attrs.field(converter=attrs.converters.to_bool)
+    z: list = attrs.field(
+        default=None,
+        converter=attrs.converters.default_if_none(factory=list),
+    )
+
+
+def test_instantiate_converted():
+    """
+    Benchmark instantiating a class with built-in converters.
+    """
+    for _ in range(ROUNDS):
+        ConvertedC(1, "yes", None)
+
+
+def test_setattr_converted():
+    """
+    Benchmark setting an attribute that is converted on_setattr.
+    """
+    c = ConvertedC(1, "yes")
+
+    for _ in range(ROUNDS):
+        c.y = "no"
+
+
+def test_from_rows():
+    """
+    Benchmark instantiating a class with converters and validators from rows
+    in bulk.
+    """
+    attrs.from_rows(ValidatedC, [(1, "2", 3)] * ROUNDS)
+
+
+@attrs.define
+class NumericC:
+    x: int = attrs.field(
+        validator=[attrs.validators.instance_of(int), attrs.validators.ge(0)]
+    )
+    y: float = attrs.field(validator=attrs.validators.instance_of(float))
+
+
+def test_from_columns():
+    """
+    Benchmark instantiating a class with validators from NumPy columns in
+    bulk.
+    """
+    np = pytest.importorskip("numpy")
+
+    attrs.from_columns(
+        NumericC, {"x": np.arange(ROUNDS), "y": np.zeros(ROUNDS)}
+    )
+
+
+def test_instantiate_trusted():
+    """
+    Benchmark instantiating a class with converters and validators using its
+    trusted constructor.
+    """
+    ctor = attrs.trusted(ValidatedC)
+
+    for _ in range(ROUNDS):
+        ctor(1, "2", 3)
+
+
+@attrs.define
+class FlatC:
+    a: int = 1
+    b: str = "b"
+    c: float = 3.0
+    d: bool = True
+    e: int | None = None
+    f: str = "f"
+
+
+@attrs.define
+class NestedC:
+    flat: FlatC = attrs.Factory(FlatC)
+    flats: list[FlatC] = attrs.Factory(lambda: [FlatC(), FlatC()])
+    tags: dict[str, int] = attrs.Factory(lambda: {"a": 1, "b": 2})
+
+
+def test_asdict_flat():
+    """
+    Benchmark converting a flat instance into a dict.
+    """
+    inst = FlatC()
+
+    for _ in range(ROUNDS):
+        attrs.asdict(inst)
+
+
+def test_asdict_nested():
+    """
+    Benchmark converting an instance with nested instances and collections
+    into a dict.
+    """
+    inst = NestedC()
+
+    for _ in range(ROUNDS):
+        attrs.asdict(inst)
+
+
+def test_as_mapping():
+    """
+    Benchmark creating a mapping view of a flat instance and reading a key.
+    """
+    inst = FlatC()
+
+    for _ in range(ROUNDS):
+        attrs.as_mapping(inst)["a"]
+
+
+def test_asdict_nested_filtered():
+    """
+    Benchmark converting an instance with nested instances and collections
+    into a dict, leaving out some attributes.
+    """
+    inst = NestedC()
+    flt = attrs.filters.exclude("b", "tags")
+
+    for _ in range(ROUNDS):
+        attrs.asdict(inst, filter=flt)
+
+
+def test_asdict_nested_serialized():
+    """
+    Benchmark converting an instance with nested instances and collections
+    into a dict, serializing values by type.
+    """
+    inst = NestedC()
+    ser = attrs.serializers.by_type({float: repr, bool: int})
+
+    for _ in range(ROUNDS):
+        attrs.asdict(inst, value_serializer=ser)
+
+
+def test_asdict_map():
+    """
+    Benchmark converting a list of flat instances by calling asdict on each
+    of them, as a baseline for asdict_many.
+    """
+    insts = [FlatC() for _ in range(ROUNDS)]
+
+    list(map(attrs.asdict, insts))
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_asdict_many(columnar):
+    """
+    Benchmark converting a list of flat instances at once, into rows or
+    columns.
+    """
+    insts = [FlatC() for _ in range(ROUNDS)]
+
+    attrs.asdict_many(insts, columnar=columnar)
+
+
+@attrs.define
+class TreeC:
+    children: list[TreeC] = attrs.Factory(list)
+
+
+def test_asdict_deep():
+    """
+    Benchmark converting an instance that is nested deeper than the
+    recursion limit into a dict.
+    """
+    inst = TreeC()
+    for _ in range(sys.getrecursionlimit() * 2):
+        inst = TreeC([inst])
+
+    attrs.asdict(inst)
+
+
+def test_from_dict_nested():
+    """
+    Benchmark creating an instance with nested instances and collections
+    from a dict.
+    """
+    data = attrs.asdict(NestedC())
+
+    for _ in range(ROUNDS):
+        attrs.from_dict(NestedC, data)
+
+
+def test_astuple_flat():
+    """
+    Benchmark converting a flat instance into a tuple of its values without
+    recursing, like for DB-API parameters.
+    """
+    inst = FlatC()
+
+    for _ in range(ROUNDS):
+        attrs.astuple(inst, recurse=False)
+
+
+def test_astuple_nested():
+    """
+    Benchmark converting an instance with nested instances and collections
+    into a tuple.
+    """
+    inst = NestedC()
+
+    for _ in range(ROUNDS):
+        attrs.astuple(inst)
+
+
+def test_iter_json_nested():
+    """
+    Benchmark encoding a list of instances with nested instances and
+    collections as JSON.
+    """
+    insts = [NestedC() for _ in range(ROUNDS)]
+
+    for _ in attrs.iter_json(insts):
+        pass
+
+
 def test_eq_equal():
     """
     Benchmark comparing two equal instances for equality.
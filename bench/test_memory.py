@@ -0,0 +1,82 @@
+"""
+Measure the memory that generated source code keeps alive in linecache.
+
+Run with ``pytest -s bench/test_memory.py`` to see the numbers.
+"""
+
+from __future__ import annotations
+
+import linecache
+import sys
+
+import pytest
+
+import attrs
+
+from attr import codegen
+
+
+ROUNDS = 1_000
+
+
+def deep_size(objs):
+    """
+    Return the size of *objs* and everything they contain, counting shared
+    objects only once.
+    """
+    seen = set()
+    size = 0
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return size
+
+
+def linecache_bytes(mode):
+    """
+    Create ROUNDS identically shaped classes using *mode* and return the
+    number of bytes held by the linecache entries they add.
+    """
+    old_mode = codegen.get_linecache_mode()
+    codegen.set_linecache_mode(mode)
+    before = set(linecache.cache)
+    try:
+        for i in range(ROUNDS):
+            attrs.make_class(
+                f"LocalC{i}",
+                {
+                    "x": attrs.field(type=int),
+                    "y": attrs.field(type=str, default=""),
+                    "z": attrs.field(type=dict[str, int], factory=dict),
+                },
+                order=True,
+            )
+
+        new = set(linecache.cache) - before
+        return deep_size(linecache.cache[name] for name in new)
+    finally:
+        for name in set(linecache.cache) - before:
+            del linecache.cache[name]
+        codegen.set_linecache_mode(old_mode)
+
+
+@pytest.mark.parametrize("mode", ["eager", "shared", "off"])
+def test_linecache_memory(mode):
+    """
+    Report the linecache memory per class for each mode.
+    """
+    size = linecache_bytes(mode)
+
+    print(f"\n{mode}: {size / ROUNDS:.0f} bytes per class")  # noqa: T201
+
+    if mode == "off":
+        assert 0 == size
+    elif mode == "shared":
+        assert size < linecache_bytes("eager") / 2
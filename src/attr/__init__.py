@@ -4,13 +4,30 @@
 Classes Without Boilerplate
 """
 
+from __future__ import annotations
+
+import importlib
+import sys
+
 from functools import partial
-from typing import Callable, Protocol
+from typing import Any, Callable, Protocol
 
-from . import converters, exceptions, filters, setters, validators
-from ._cmp import cmp_using
+from . import codegen, exceptions, setters
 from ._config import get_run_validators, set_run_validators
-from ._funcs import asdict, assoc, astuple, evolve, has, resolve_types
+from ._funcs import (
+    as_mapping,
+    asdict,
+    asdict_many,
+    assoc,
+    astuple,
+    evolve,
+    from_columns,
+    from_dict,
+    from_rows,
+    has,
+    resolve_types,
+    trusted,
+)
 from ._make import (
     NOTHING,
     Attribute,
@@ -24,7 +41,6 @@ from ._make import (
     validate,
 )
 from ._next_gen import define, field, frozen, mutable
-from ._version_info import VersionInfo
 
 
 s = attributes = attrs
@@ -42,7 +58,9 @@ __all__ = [
     "Converter",
     "Factory",
     "NOTHING",
+    "as_mapping",
     "asdict",
+    "asdict_many",
     "assoc",
     "astuple",
     "attr",
@@ -50,36 +68,74 @@ __all__ = [
     "attributes",
     "attrs",
     "cmp_using",
+    "codegen",
     "converters",
     "define",
+    "dump_json",
     "evolve",
     "exceptions",
     "field",
     "fields",
     "fields_dict",
     "filters",
+    "from_columns",
+    "from_dict",
+    "from_rows",
     "frozen",
     "get_run_validators",
     "has",
     "ib",
+    "iter_json",
     "make_class",
     "mutable",
+    "profiling",
     "resolve_types",
     "s",
+    "serializers",
     "set_run_validators",
     "setters",
+    "trusted",
     "validate",
     "validators",
 ]
 
 
-def _make_getattr(mod_name: str) -> Callable:
+# Rarely used names that are only imported on first access to keep the
+# import of attr and attrs cheap: name -> (module, attribute or None for the
+# module itself).
+_LAZY = {
+    "cmp_using": ("attr._cmp", "cmp_using"),
+    "converters": ("attr.converters", None),
+    "dump_json": ("attr._json", "dump_json"),
+    "filters": ("attr.filters", None),
+    "iter_json": ("attr._json", "iter_json"),
+    "profiling": ("attr.profiling", None),
+    "serializers": ("attr.serializers", None),
+    "validators": ("attr.validators", None),
+    "VersionInfo": ("attr._version_info", "VersionInfo"),
+}
+
+
+def _make_getattr(mod_name: str, lazy: dict | None = None) -> Callable:
     """
     Create a metadata proxy for packaging information that uses *mod_name* in
     its warnings and errors.
+
+    Names in *lazy* are imported on first access and stored in the module
+    *mod_name*, such that later accesses don't go through ``__getattr__``.
     """
+    lazy = lazy or {}
+
+    def __getattr__(name: str) -> Any:
+        if name in lazy:
+            module, attr = lazy[name]
+            value = importlib.import_module(module)
+            if attr is not None:
+                value = getattr(value, attr)
+            setattr(sys.modules[mod_name], name, value)
+
+            return value
 
-    def __getattr__(name: str) -> str:
         if name not in ("__version__", "__version_info__"):
             msg = f"module {mod_name} has no attribute {name}"
             raise AttributeError(msg)
@@ -89,6 +145,8 @@ def _make_getattr(mod_name: str) -> Callable:
         meta = metadata("attrs")
 
         if name == "__version_info__":
+            from ._version_info import VersionInfo
+
             return VersionInfo._from_version_string(meta["version"])
 
         return meta["version"]
@@ -96,4 +154,4 @@ def _make_getattr(mod_name: str) -> Callable:
     return __getattr__
 
 
-__getattr__ = _make_getattr(__name__)
+__getattr__ = _make_getattr(__name__, _LAZY)
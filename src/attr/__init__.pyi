@@ -5,6 +5,8 @@ from typing import (
     Any,
     Callable,
     Generic,
+    Iterable,
+    Iterator,
     Mapping,
     Protocol,
     Sequence,
@@ -13,12 +15,17 @@ from typing import (
 )
 
 # `import X as X` is required to make these public
+from . import codegen as codegen
+from . import profiling as profiling
 from . import converters as converters
 from . import exceptions as exceptions
 from . import filters as filters
+from . import serializers as serializers
 from . import setters as setters
 from . import validators as validators
 from ._cmp import cmp_using as cmp_using
+from ._json import dump_json as dump_json
+from ._json import iter_json as iter_json
 from ._typing_compat import AttrsInstance_
 from ._version_info import VersionInfo
 from attrs import (
@@ -269,6 +276,7 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    lazy_methods: bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(order_default=True, field_specifiers=(attrib, field))
@@ -297,6 +305,7 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    lazy_methods: bool | None = ...,
 ) -> Callable[[_C], _C]: ...
 def fields(cls: type[AttrsInstance]) -> Any: ...
 def fields_dict(cls: type[AttrsInstance]) -> dict[str, Attribute[Any]]: ...
@@ -354,6 +363,31 @@ def asdict(
     value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
     tuple_keys: bool | None = ...,
 ) -> dict[str, Any]: ...
+def as_mapping(
+    inst: AttrsInstance, *, recurse: bool = ...
+) -> Mapping[str, Any]: ...
+@overload
+def asdict_many(
+    instances: Iterable[AttrsInstance],
+    *,
+    recurse: bool = ...,
+    filter: _FilterType[Any] | None = ...,
+    dict_factory: type[Mapping[Any, Any]] = ...,
+    retain_collection_types: bool = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    columnar: Literal[False] = ...,
+) -> list[dict[str, Any]]: ...
+@overload
+def asdict_many(
+    instances: Iterable[AttrsInstance],
+    *,
+    recurse: bool = ...,
+    filter: _FilterType[Any] | None = ...,
+    dict_factory: type[Mapping[Any, Any]] = ...,
+    retain_collection_types: bool = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    columnar: Literal[True],
+) -> dict[str, list[Any]]: ...
 
 # TODO: add support for returning NamedTuple from the mypy plugin
 def astuple(
@@ -366,6 +400,40 @@ def astuple(
 def has(cls: type) -> TypeGuard[type[AttrsInstance]]: ...
 def assoc(inst: _T, **changes: Any) -> _T: ...
 def evolve(inst: _T, **changes: Any) -> _T: ...
+@overload
+def from_columns(
+    cls: type[_T],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    validate: bool = ...,
+    lazy: Literal[False] = ...,
+) -> list[_T]: ...
+@overload
+def from_columns(
+    cls: type[_T],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    validate: bool = ...,
+    lazy: Literal[True],
+) -> Iterator[_T]: ...
+def from_dict(cls: type[_T], data: Mapping[str, Any]) -> _T: ...
+@overload
+def from_rows(
+    cls: type[_T],
+    rows: Iterable[Sequence[Any]],
+    *,
+    validate: bool = ...,
+    lazy: Literal[False] = ...,
+) -> list[_T]: ...
+@overload
+def from_rows(
+    cls: type[_T],
+    rows: Iterable[Sequence[Any]],
+    *,
+    validate: bool = ...,
+    lazy: Literal[True],
+) -> Iterator[_T]: ...
+def trusted(cls: type[_T], *, post_init: bool = ...) -> Callable[..., _T]: ...
 
 # _config --
 
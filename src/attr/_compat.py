@@ -1,7 +1,5 @@
 # SPDX-License-Identifier: MIT
 
-import inspect
-import platform
 import sys
 import threading
 
@@ -9,7 +7,7 @@ from collections.abc import Mapping, Sequence  # noqa: F401
 from typing import _GenericAlias
 
 
-PYPY = platform.python_implementation() == "PyPy"
+PYPY = sys.implementation.name == "pypy"
 PY_3_9_PLUS = sys.version_info[:2] >= (3, 9)
 PY_3_10_PLUS = sys.version_info[:2] >= (3, 10)
 PY_3_11_PLUS = sys.version_info[:2] >= (3, 11)
@@ -41,6 +39,10 @@ class _AnnotationExtractor:
     __slots__ = ["sig"]
 
     def __init__(self, callable):
+        # inspect is expensive to import and only needed for converters and
+        # validators that are inspected while creating a class.
+        import inspect
+
         try:
             self.sig = inspect.signature(callable)
         except (ValueError, TypeError):  # inspect failed
@@ -54,7 +56,7 @@ class _AnnotationExtractor:
             return None
 
         params = list(self.sig.parameters.values())
-        if params and params[0].annotation is not inspect.Parameter.empty:
+        if params and params[0].annotation is not params[0].empty:
             return params[0].annotation
 
         return None
@@ -63,10 +65,7 @@ class _AnnotationExtractor:
         """
         Return the return type if it's not empty.
         """
-        if (
-            self.sig
-            and self.sig.return_annotation is not inspect.Signature.empty
-        ):
+        if self.sig and self.sig.return_annotation is not self.sig.empty:
             return self.sig.return_annotation
 
         return None
@@ -2,10 +2,14 @@
 # SPDX-License-Identifier: MIT
 
 
+import collections
 import copy
+import functools
+import sys
 
-from ._compat import PY_3_9_PLUS, get_generic_base
-from ._make import _OBJ_SETATTR, NOTHING, fields
+from . import _make
+from ._compat import PY_3_9_PLUS, Mapping, get_generic_base
+from ._make import _OBJ_SETATTR, NOTHING, Factory, fields
 from .exceptions import AttrsAttributeNotFoundError
 
 
@@ -51,6 +55,86 @@ def asdict(
     ..  versionadded:: 20.3.0 *value_serializer*
     ..  versionadded:: 21.3.0
         如果字典中有一个键的集合，则将其序列化为元组。
+    ..  versionchanged:: 24.3.0
+        如果没有传递 *filter* 和 *value_serializer*，则使用为每个类生成一次并缓存在类上的函数。
+    ..  versionchanged:: 24.3.0
+        嵌套得太深以至于递归会引发 `RecursionError` 的实例，会使用显式栈而不是递归重新转换，结果相同。
+        在这种情况下，*filter* 和 *value_serializer* 可能会对某些值被调用两次。
+        循环引用仍然会引发 `RecursionError`。
+    ..  versionchanged:: 24.3.0
+        由 `attrs.filters.include` 和 `attrs.filters.exclude` 创建的 *filter* 也使用生成的函数，
+        它们为每个类只被求值一次，而不是针对每个属性被调用。
+        这些函数只在相等的 *filter* 被再次使用时才生成，并且每个类只缓存最近生成的一些。
+    ..  versionchanged:: 24.3.0
+        由 `attrs.serializers.by_type` 创建的 *value_serializer* 也使用生成的函数，
+        对于值的类是字段声明的类型且不在其表中的字段，不会调用它。
+    """
+    try:
+        return _asdict_recursive(
+            inst,
+            recurse,
+            filter,
+            dict_factory,
+            retain_collection_types,
+            value_serializer,
+        )
+    except RecursionError:
+        return _asdict_iterative(
+            inst,
+            recurse,
+            filter,
+            dict_factory,
+            retain_collection_types,
+            value_serializer,
+        )
+
+
+def _asdict_recursive(
+    inst,
+    recurse,
+    filter,
+    dict_factory,
+    retain_collection_types,
+    value_serializer,
+):
+    """
+    The implementation of `asdict` that recurses into nested values.
+    """
+    if _is_planned(filter, value_serializer):
+        recurse = recurse is True
+        return _serializer(
+            (
+                inst.__class__,
+                "asdict",
+                recurse,
+                recurse and retain_collection_types is True,
+                dict_factory is dict,
+                filter,
+                value_serializer,
+            ),
+        )(inst, dict_factory)
+
+    return _asdict_with_hooks(
+        inst,
+        recurse,
+        filter,
+        dict_factory,
+        retain_collection_types,
+        value_serializer,
+    )
+
+
+def _asdict_with_hooks(
+    inst,
+    recurse,
+    filter,
+    dict_factory,
+    retain_collection_types,
+    value_serializer,
+):
+    """
+    Convert *inst* like `asdict` does by calling *filter* and
+    *value_serializer* for every value.
     """
     attrs = fields(inst.__class__)
     rv = dict_factory()
@@ -64,7 +148,7 @@ def asdict(
 
         if recurse is True:
             if has(v.__class__):
-                rv[a.name] = asdict(
+                rv[a.name] = _asdict_recursive(
                     v,
                     recurse=True,
                     filter=filter,
@@ -123,6 +207,258 @@ def asdict(
     return rv
 
 
+def _is_planned(filter, value_serializer):
+    """
+    Return whether `asdict` can use a generated function with *filter* and
+    *value_serializer*.
+    """
+    return (filter is None or _make._is_planned_filter(filter)) and (
+        value_serializer is None
+        or _make._is_planned_serializer(value_serializer)
+    )
+
+
+# Keys with filters or value serializers that have been asked for once.
+# Their functions are only generated when they're asked for again, so that
+# filters and value serializers that are created for every call don't
+# generate a function each time.
+_asked_once = collections.OrderedDict()
+_ASKED_ONCE_MAXSIZE = 256
+
+# How many functions for filters and value serializers are cached per class.
+_HOOKED_MAXSIZE = 32
+
+
+def _serializer(key):
+    """
+    Return the function generated for *key*.
+
+    *key* is a tuple of the class whose instances the function is for, the
+    name of the function that uses it -- "asdict", "asdict_columns",
+    "astuple", "from_dict", "from_rows", "json", or "trusted" -- and the
+    remaining arguments of the respective ``_make_`` function in `attr._make`
+    or `attr._json`.
+
+    Generated functions are cached in the ``__attrs_serializers__`` dict of
+    the class, such that each one is only created once.  Subclasses find the
+    dict of their base class at first but the class is part of the key.
+
+    If *key* contains a filter or a value serializer, the first time returns
+    a function from `_with_hooks` instead, and only the most recently
+    generated of such functions are cached.
+    """
+    try:
+        return key[0].__attrs_serializers__[key]
+    except (AttributeError, KeyError):
+        pass
+
+    cls, kind, *args = key
+    fields(cls)
+
+    hooked = _has_hooks(key)
+    if hooked and _asked_once.pop(key, None) is None:
+        _asked_once[key] = True
+        if len(_asked_once) > _ASKED_ONCE_MAXSIZE:
+            _asked_once.popitem(last=False)
+
+        return _with_hooks(kind, *args)
+
+    if kind == "asdict":
+        fn = _make._make_asdict(cls, *args, _asdict_value)
+    elif kind == "asdict_columns":
+        fn = _make._make_asdict_columns(cls, *args, _asdict_value)
+    elif kind == "astuple":
+        fn = _make._make_astuple(cls, *args, _astuple_value)
+    elif kind == "from_rows":
+        fn = _make._make_from_rows(cls, *args)
+    elif kind == "trusted":
+        fn = _make._make_trusted(cls, *args)
+    elif kind == "json":
+        from ._json import _make_emitter
+
+        fn = _make_emitter(cls, *args)
+    else:
+        resolve_types(cls)
+        _structuring.add(cls)
+        try:
+            fn = _make._make_from_dict(cls, _structurer)
+        finally:
+            _structuring.discard(cls)
+
+    cache = cls.__dict__.get(_make._SERIALIZERS_NAME)
+    if cache is None:
+        cache = {}
+        setattr(cls, _make._SERIALIZERS_NAME, cache)
+    cache[key] = fn
+
+    if hooked:
+        for old in [k for k in list(cache) if _has_hooks(k)][
+            :-_HOOKED_MAXSIZE
+        ]:
+            cache.pop(old, None)
+
+    return fn
+
+
+def _has_hooks(key):
+    """
+    Return whether the arguments in the `_serializer` *key* include a filter
+    or a value serializer.
+    """
+    return any(
+        _make._is_planned_filter(arg) or _make._is_planned_serializer(arg)
+        for arg in key[2:]
+    )
+
+
+def _with_hooks(kind, *args):
+    """
+    Return a function that works like the one generated for the *kind* and
+    *args* of a `_serializer` key, but calls the filter and the value
+    serializer for every value.  Return None if the caller can do without.
+    """
+    if kind == "asdict":
+        recurse, retain, _, filter, value_serializer = args
+
+        return lambda inst, dict_factory: _asdict_with_hooks(
+            inst, recurse, filter, dict_factory, retain, value_serializer
+        )
+
+    if kind == "astuple":
+        recurse, retain, _, filter = args
+
+        return lambda inst, tuple_factory: _astuple_with_hooks(
+            inst, recurse, filter, tuple_factory, retain
+        )
+
+    return None
+
+
+def _asdict_value(
+    val, retain, dict_factory, filter=None, value_serializer=None
+):
+    """
+    Convert the value of a field like `asdict` does if its *filter* and
+    *value_serializer* can be planned.
+    """
+    cls = val.__class__
+    if getattr(cls, "__attrs_attrs__", None) is not None:
+        return _serializer(
+            (
+                cls,
+                "asdict",
+                True,
+                retain,
+                dict_factory is dict,
+                filter,
+                value_serializer,
+            )
+        )(val, dict_factory)
+
+    if isinstance(val, (tuple, list, set, frozenset)):
+        cf = cls if retain is True else list
+        items = [
+            _asdict_item(
+                i, False, retain, dict_factory, filter, value_serializer
+            )
+            for i in val
+        ]
+        try:
+            return cf(items)
+        except TypeError:
+            if not issubclass(cf, tuple):
+                raise
+            # Workaround for TypeError: cf.__new__() missing 1 required
+            # positional argument (which appears, for a namedturle)
+            return cf(*items)
+
+    if isinstance(val, dict):
+        return dict_factory(
+            (
+                _asdict_item(
+                    kk, True, retain, dict_factory, filter, value_serializer
+                ),
+                _asdict_item(
+                    vv, False, retain, dict_factory, filter, value_serializer
+                ),
+            )
+            for kk, vv in val.items()
+        )
+
+    return val
+
+
+def _asdict_item(val, is_key, retain, dict_factory, filter, value_serializer):
+    """
+    `_asdict_anything` with a *filter* and a *value_serializer* that can be
+    planned.
+    """
+    cls = val.__class__
+    if cls not in _make._SCALAR_TYPES:
+        if getattr(cls, "__attrs_attrs__", None) is not None:
+            return _serializer(
+                (
+                    cls,
+                    "asdict",
+                    True,
+                    retain,
+                    dict_factory is dict,
+                    filter,
+                    value_serializer,
+                )
+            )(val, dict_factory)
+
+        if isinstance(val, (tuple, list, set, frozenset)):
+            if retain is True:
+                cf = cls
+            elif is_key:
+                cf = tuple
+            else:
+                cf = list
+
+            return cf(
+                [
+                    _asdict_item(
+                        i,
+                        False,
+                        retain,
+                        dict_factory,
+                        filter,
+                        value_serializer,
+                    )
+                    for i in val
+                ]
+            )
+
+        if isinstance(val, dict):
+            return dict_factory(
+                (
+                    _asdict_item(
+                        kk,
+                        True,
+                        retain,
+                        dict_factory,
+                        filter,
+                        value_serializer,
+                    ),
+                    _asdict_item(
+                        vv,
+                        False,
+                        retain,
+                        dict_factory,
+                        filter,
+                        value_serializer,
+                    ),
+                )
+                for kk, vv in val.items()
+            )
+
+    if value_serializer is not None:
+        return value_serializer(None, None, val)
+
+    return val
+
+
 def _asdict_anything(
     val,
     is_key,
@@ -136,7 +472,7 @@ def _asdict_anything(
     """
     if getattr(val.__class__, "__attrs_attrs__", None) is not None:
         # Attrs class.
-        rv = asdict(
+        rv = _asdict_recursive(
             val,
             recurse=True,
             filter=filter,
@@ -196,6 +532,326 @@ def _asdict_anything(
     return rv
 
 
+def _asdict_iterative(
+    inst,
+    recurse,
+    filter,
+    dict_factory,
+    retain_collection_types,
+    value_serializer,
+):
+    """
+    The implementation of `asdict` that uses an explicit stack instead of
+    recursion, for instances that are nested too deeply.
+
+    The counterparts of `_asdict_recursive` and `_asdict_anything` are
+    generators that yield the nested values they need converted -- along
+    with the generator function that does it -- and are sent the results.
+    Therefore, the values are converted in the very same order.
+    """
+    retain = retain_collection_types
+
+    def convert_inst(inst, recurse):
+        rv = dict_factory()
+        for a in fields(inst.__class__):
+            v = getattr(inst, a.name)
+            if filter is not None and not filter(a, v):
+                continue
+
+            if value_serializer is not None:
+                v = value_serializer(inst, a, v)
+
+            if recurse is True:
+                if has(v.__class__):
+                    v = yield convert_inst, v, True
+                elif isinstance(v, (tuple, list, set, frozenset)):
+                    cf = v.__class__ if retain is True else list
+                    items = yield from convert_items(v)
+                    try:
+                        v = cf(items)
+                    except TypeError:
+                        if not issubclass(cf, tuple):
+                            raise
+                        v = cf(*items)
+                elif isinstance(v, dict):
+                    v = yield from convert_dict(v)
+
+            rv[a.name] = v
+
+        return rv
+
+    def convert_items(val):
+        # Comprehensions can't yield.
+        items = [None] * len(val)
+        for n, i in enumerate(val):
+            items[n] = yield convert_anything, i, False
+
+        return items
+
+    def convert_dict(val):
+        items = []
+        for kk, vv in val.items():
+            k = yield convert_anything, kk, True
+            items.append((k, (yield convert_anything, vv, False)))
+
+        return dict_factory(items)
+
+    def convert_anything(val, is_key):
+        if getattr(val.__class__, "__attrs_attrs__", None) is not None:
+            return (yield from convert_inst(val, True))
+
+        if isinstance(val, (tuple, list, set, frozenset)):
+            if retain is True:
+                cf = val.__class__
+            elif is_key:
+                cf = tuple
+            else:
+                cf = list
+
+            return cf((yield from convert_items(val)))
+
+        if isinstance(val, dict):
+            return (yield from convert_dict(val))
+
+        if value_serializer is not None:
+            return value_serializer(None, None, val)
+
+        return val
+
+    # The generators that are running and the ids of the values they
+    # convert.  A value that's converted within itself is a cycle.
+    stack = [convert_inst(inst, recurse)]
+    path = [id(inst)]
+    on_path = {id(inst)}
+    result = None
+    while True:
+        try:
+            convert, val, arg = stack[-1].send(result)
+        except StopIteration as e:
+            stack.pop()
+            on_path.discard(path.pop())
+            if not stack:
+                return e.value
+            result = e.value
+            continue
+
+        if id(val) in on_path:
+            msg = f"Circular reference detected in {val.__class__.__name__}."
+            raise RecursionError(msg)
+
+        stack.append(convert(val, arg))
+        path.append(id(val))
+        on_path.add(id(val))
+        result = None
+
+
+def asdict_many(
+    instances,
+    *,
+    recurse=True,
+    filter=None,
+    dict_factory=dict,
+    retain_collection_types=False,
+    value_serializer=None,
+    columnar=False,
+):
+    """
+    与对 *instances* 的每个元素调用 `attr.asdict` 相同，但只为每个类查找一次转换方式。
+
+    *instances* 通常是同一个类的实例，但也允许混合多个类。
+    除 *instances* 和 *columnar* 之外的参数与 `attr.asdict` 相同。
+
+    Args:
+        instances (~collections.abc.Iterable): *attrs* 实例的可迭代对象。
+
+        columnar (bool):
+            如果为 `True`，则返回一个按列组织的字典：每个属性名称映射到一个包含所有实例的该属性值的列表，
+            例如 ``{"x": [1, 2], "y": [3, 4]}``。这种形式可以直接交给 CSV 或 Parquet 的写入器。
+            如果所有实例属于同一个类，*value_serializer* 为 `None` 或由 `attrs.serializers.by_type` 创建，并且 *filter* 不会因值的类型而包含或丢弃属性，
+            则直接按列收集值，而不创建中间的字典。
+
+    Returns:
+        list | dict: 每个实例的字典的列表，或者如果 *columnar* 为 `True`，则是 *dict_factory* 类型的按列字典。
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果某个元素不是 *attrs* 类的实例。
+
+        ValueError:
+            如果 *columnar* 为 `True`，但各实例的字典的键不相同。
+
+    .. versionadded:: 24.3.0
+    """
+    hooks = not _is_planned(filter, value_serializer)
+    recurse = recurse is True
+    retain = recurse and retain_collection_types is True
+    plain_dict = dict_factory is dict
+
+    if columnar and not hooks:
+        if not isinstance(instances, (list, tuple)):
+            instances = list(instances)
+        if instances:
+            cls = instances[0].__class__
+            if all(inst.__class__ is cls for inst in instances):
+                fn = _serializer(
+                    (
+                        cls,
+                        "asdict_columns",
+                        recurse,
+                        retain,
+                        filter,
+                        value_serializer,
+                    )
+                )
+                try:
+                    if fn is not None:
+                        return dict_factory(zip(*fn(instances, dict_factory)))
+                except RecursionError:
+                    pass
+
+    rows = []
+    append = rows.append
+    cls = None
+    for inst in instances:
+        if not hooks and inst.__class__ is not cls:
+            cls = inst.__class__
+            fn = _serializer(
+                (
+                    cls,
+                    "asdict",
+                    recurse,
+                    retain,
+                    plain_dict,
+                    filter,
+                    value_serializer,
+                )
+            )
+
+        try:
+            if not hooks:
+                append(fn(inst, dict_factory))
+            else:
+                append(
+                    _asdict_recursive(
+                        inst,
+                        recurse,
+                        filter,
+                        dict_factory,
+                        retain_collection_types,
+                        value_serializer,
+                    )
+                )
+        except RecursionError:
+            append(
+                _asdict_iterative(
+                    inst,
+                    recurse,
+                    filter,
+                    dict_factory,
+                    retain_collection_types,
+                    value_serializer,
+                )
+            )
+
+    if not columnar:
+        return rows
+
+    return _columns(rows, dict_factory)
+
+
+def _columns(rows, dict_factory):
+    """
+    Turn the list of dicts *rows* into a *dict_factory* of lists.
+    """
+    if not rows:
+        return dict_factory()
+
+    keys = rows[0].keys()
+    for i, row in enumerate(rows):
+        if row.keys() != keys:
+            msg = (
+                f"Instance {i} has the keys {list(row)} but instance 0 has "
+                f"{list(keys)}."
+            )
+            raise ValueError(msg)
+
+    return dict_factory((k, [row[k] for row in rows]) for k in keys)
+
+
+def as_mapping(inst, *, recurse=False):
+    """
+    返回 *inst* 的 *attrs* 属性的只读 `collections.abc.Mapping` 视图。
+
+    与 ``attrs.asdict(inst, recurse=False)`` 不同，它不会复制任何值：
+    视图只引用实例，键是类的属性名称，值在访问时通过 `getattr` 读取。
+    因此创建视图的开销与属性的数量无关，并且视图始终反映实例的当前状态。
+
+    Args:
+        inst: 一个 *attrs* 装饰类的实例。
+
+        recurse (bool):
+            如果为 `True`，则将同样是 *attrs* 实例的值在访问时包装在相同类型的视图中。
+            集合中的值保持不变。
+
+    Returns:
+        collections.abc.Mapping[str, typing.Any]
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果 *inst* 不是 *attrs* 类的实例。
+
+    .. versionadded:: 24.3.0
+    """
+    attrs = getattr(inst.__class__, "__attrs_attrs__", None)
+    if attrs is None:
+        attrs = fields(inst.__class__)
+
+    return _InstanceMapping(inst, attrs, recurse)
+
+
+class _InstanceMapping(Mapping):
+    """
+    The view returned by `as_mapping`.
+
+    Keys are looked up as properties of the class's tuple of Attributes,
+    so nothing needs to be built per class or per view.
+    """
+
+    __slots__ = ("_attrs", "_inst", "_recurse")
+
+    def __init__(self, inst, attrs, recurse):
+        self._inst = inst
+        self._attrs = attrs
+        self._recurse = recurse
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+
+        v = getattr(self._inst, key)
+        if (
+            self._recurse
+            and getattr(v.__class__, "__attrs_attrs__", None) is not None
+        ):
+            return _InstanceMapping(v, v.__class__.__attrs_attrs__, True)
+
+        return v
+
+    def __contains__(self, key):
+        return key.__class__ is str and isinstance(
+            getattr(self._attrs, key, None), _make.Attribute
+        )
+
+    def __iter__(self):
+        return (a.name for a in self._attrs)
+
+    def __len__(self):
+        return len(self._attrs)
+
+    def __repr__(self):
+        return f"as_mapping({self._inst!r})"
+
+
 def astuple(
     inst,
     recurse=True,
@@ -231,6 +887,37 @@ def astuple(
             如果 *cls* 不是一个 *attrs* 类。
 
     .. versionadded:: 16.2.0
+    .. versionchanged:: 24.3.0
+        如果没有传递 *filter*，则使用为每个类生成一次并缓存在类上的函数。
+        如果 *recurse* 为 `False`，它直接返回由属性值组成的元组。
+    .. versionchanged:: 24.3.0
+        由 `attrs.filters.include` 和 `attrs.filters.exclude` 创建的 *filter* 也使用生成的函数，
+        它们为每个类只被求值一次，而不是针对每个属性被调用。
+        这些函数只在相等的 *filter* 被再次使用时才生成，并且每个类只缓存最近生成的一些。
+    """
+    if filter is None or _make._is_planned_filter(filter):
+        recurse = recurse is True
+        return _serializer(
+            (
+                inst.__class__,
+                "astuple",
+                recurse,
+                recurse and retain_collection_types is True,
+                _tuple_factory_key(tuple_factory),
+                filter,
+            ),
+        )(inst, tuple_factory)
+
+    return _astuple_with_hooks(
+        inst, recurse, filter, tuple_factory, retain_collection_types
+    )
+
+
+def _astuple_with_hooks(
+    inst, recurse, filter, tuple_factory, retain_collection_types
+):
+    """
+    Convert *inst* like `astuple` does by calling *filter* for every value.
     """
     attrs = fields(inst.__class__)
     rv = []
@@ -309,6 +996,71 @@ def astuple(
     return rv if tuple_factory is list else tuple_factory(rv)
 
 
+def _tuple_factory_key(tuple_factory):
+    """
+    Return the key `_make._make_astuple` is specialized for *tuple_factory*.
+    """
+    return tuple_factory if tuple_factory in (tuple, list) else None
+
+
+def _astuple_value(val, retain, tuple_factory, filter=None):
+    """
+    Convert the value of a field like `astuple` does if it's called with a
+    *filter* that can be planned or None.
+
+    Like `astuple`, instances in dicts are converted without *filter*.
+    """
+    cls = val.__class__
+    if getattr(cls, "__attrs_attrs__", None) is not None:
+        return _astuple_instance(val, retain, tuple_factory, filter)
+
+    if isinstance(val, (tuple, list, set, frozenset)):
+        cf = cls if retain is True else list
+        items = [
+            _astuple_instance(j, retain, tuple_factory, filter)
+            if getattr(j.__class__, "__attrs_attrs__", None) is not None
+            else j
+            for j in val
+        ]
+        try:
+            return cf(items)
+        except TypeError:
+            if not issubclass(cf, tuple):
+                raise
+            # Workaround for TypeError: cf.__new__() missing 1 required
+            # positional argument (which appears, for a namedturle)
+            return cf(*items)
+
+    if isinstance(val, dict):
+        df = cls if retain is True else dict
+        return df(
+            (
+                _astuple_instance(kk, retain, tuple_factory, None)
+                if getattr(kk.__class__, "__attrs_attrs__", None) is not None
+                else kk,
+                _astuple_instance(vv, retain, tuple_factory, None)
+                if getattr(vv.__class__, "__attrs_attrs__", None) is not None
+                else vv,
+            )
+            for kk, vv in val.items()
+        )
+
+    return val
+
+
+def _astuple_instance(inst, retain, tuple_factory, filter):
+    return _serializer(
+        (
+            inst.__class__,
+            "astuple",
+            True,
+            retain,
+            _tuple_factory_key(tuple_factory),
+            filter,
+        )
+    )(inst, tuple_factory)
+
+
 def has(cls):
     """
     检查 *cls* 是否是具有 *attrs* 属性的类。
@@ -425,6 +1177,286 @@ def evolve(*args, **changes):
     return cls(**changes)
 
 
+def from_rows(cls, rows, *, validate=True, lazy=False):
+    """
+    从 *rows* 批量创建 *cls* 的实例。
+
+    每一行都像 ``cls(*row)`` 一样被解包为 ``__init__`` 的位置参数，并且工厂、转换器、验证器以及
+    ``__attrs_pre_init__`` / ``__attrs_post_init__`` 的行为与 ``__init__`` 完全相同。
+    但循环是为每个类专门生成的，并内联了 ``__init__`` 的主体，从而节省了每个实例的调用开销。
+
+    行可以是任意可迭代对象。比位置参数短的行对缺少的参数使用其默认值，仅限关键字的参数总是使用其默认值。
+    如果 ``__init__`` 不是由 *attrs* 编写的，则每一行都通过调用 ``cls(*row)`` 创建。
+
+    Args:
+        cls (type): 一个 *attrs* 类。
+
+        rows (~collections.abc.Iterable): 位置参数的序列的可迭代对象。
+
+        validate (bool): 如果为 `False`，则不运行验证器。
+
+        lazy (bool):
+            如果为 `True`，则返回一个按需创建实例的生成器，而不是一个列表。
+            这使得处理巨大的输入时内存占用保持平稳。
+
+    Returns:
+        list | ~collections.abc.Iterator: *cls* 的实例。
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果 *cls* 不是一个 *attrs* 类。
+
+        TypeError:
+            如果某行的值太多或太少，或者 ``__init__`` 有没有默认值的仅限关键字的参数。
+
+        ValueError:
+            如果 *validate* 为 `False`，但 ``__init__`` 不是由 *attrs* 编写的，因此无法跳过验证器。
+
+    .. versionadded:: 24.3.0
+    """
+    fn = _serializer((cls, "from_rows", ()))
+    if fn is not None:
+        return fn(cls, rows, validate, lazy)
+
+    if not validate:
+        msg = f"validate=False needs an __init__ written by attrs, which {cls.__name__} doesn't have."
+        raise ValueError(msg)
+
+    instances = (cls(*row) for row in rows)
+
+    return instances if lazy else list(instances)
+
+
+def from_dict(cls, data):
+    """
+    从 *data* 创建 *cls* 的实例，*data* 是一个由 `attrs.asdict` 或 JSON 解码等方式产生的字典。
+
+    这是 `attrs.asdict` 的逆操作：*data* 的键是属性名称，并以对应的别名传递给 ``__init__``。
+    缺少的键使用属性的默认值，不属于 ``__init__`` 所接受的属性的键会被忽略。
+
+    没有转换器的属性的值根据其类型进行结构化：
+
+    - 嵌套的 *attrs* 类从字典递归创建。
+    - ``list[T]``、``set[T]``、``frozenset[T]``、``tuple[T, ...]``、``tuple[A, B]``
+      和 ``dict[K, V]``（以及它们在 `typing` 和 `collections.abc` 中的对应项）被构建为相应的容器，
+      并根据 ``T``、``K`` 和 ``V`` 结构化其元素。
+    - ``Optional[T]`` 保留 `None`，并将其他值结构化为 ``T``。
+    - 其他所有值保持不变。
+
+    有转换器的属性的值直接传递给转换器。
+
+    第一次调用时，使用 `attrs.resolve_types` 解析 *cls* 的类型，并为 *cls* 生成一个函数并将其缓存在类上。
+
+    Args:
+        cls (type): 一个 *attrs* 类。
+
+        data (~collections.abc.Mapping): 属性名称到值的映射。
+
+    Returns:
+        *cls* 的一个实例。
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果 *cls* 不是一个 *attrs* 类。
+
+        NameError: 如果 *cls* 的类型无法解析。
+
+    .. versionadded:: 24.3.0
+    """
+    return _serializer((cls, "from_dict"))(data)
+
+
+# Classes whose from_dict() functions are being generated right now.
+_structuring = set()
+
+
+def _structurer(cls):
+    """
+    Return the function that creates instances of the nested *attrs* class
+    *cls* from dicts.
+
+    It's generated right away unless that is already happening, like for
+    classes that refer to themselves.
+    """
+    if cls in _structuring:
+        return functools.partial(from_dict, cls)
+
+    return _serializer((cls, "from_dict"))
+
+
+def from_columns(cls, columns, *, validate=True, lazy=False):
+    """
+    从按列存储的数据批量创建 *cls* 的实例。
+
+    *columns* 将属性名称（而不是 ``__init__`` 参数的别名）映射到等长的值序列；第 *i* 个实例由每列的第
+    *i* 个值构建。缺少的列使用属性的默认值或工厂。
+
+    具有 ``tolist()`` 方法的列（例如 NumPy 数组或 `array.array`）会先被转换为列表，因此实例包含的是
+    Python 对象，而不是 NumPy 标量。
+
+    如果一维 NumPy 数组的列所属的属性没有转换器，并且它的验证器是
+    `attrs.validators.instance_of`、`attrs.validators.lt` / `le` / `ge` / `gt`、
+    `attrs.validators.optional` 或它们的 `attrs.validators.and_` 组合，则通过检查数组的
+    ``dtype`` 并对整个数组进行一次比较来验证它们。
+    如果所有验证器都能这样检查并且通过，则创建实例时不再运行它们。否则，验证器会照常对每个实例运行，
+    并引发与 ``__init__`` 相同的错误。
+    NumPy 是可选的，并且永远不会被导入。
+
+    实例由与 `attrs.from_rows` 相同的生成循环创建，仅限关键字的属性的列也是如此。如果 ``__init__`` 不是由
+    *attrs* 编写的，则每个实例都通过以关键字参数调用 *cls* 来创建。
+
+    Args:
+        cls (type): 一个 *attrs* 类。
+
+        columns (~collections.abc.Mapping[str, ~collections.abc.Sequence]):
+            属性名称到其值的映射。
+
+        validate (bool): 如果为 `False`，则不运行验证器。
+
+        lazy (bool): 如果为 `True`，则返回一个按需创建实例的生成器，而不是一个列表。
+
+    Returns:
+        list | ~collections.abc.Iterator: *cls* 的实例。
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果 *cls* 不是一个 *attrs* 类。
+
+        TypeError:
+            如果某列不属于 ``__init__`` 接受的属性，或者缺少没有默认值的属性的列。
+
+        ValueError:
+            如果各列的长度不同，或者 *validate* 为 `False`，但 ``__init__`` 不是由 *attrs*
+            编写的，因此无法跳过验证器。
+
+    .. versionadded:: 24.3.0
+    """
+    attrs = fields(cls)
+    by_name = {a.name: a for a in attrs if a.init}
+
+    unknown = [name for name in columns if name not in by_name]
+    if unknown:
+        msg = f"{cls.__name__} has no attributes {unknown!r} that can be passed to __init__."
+        raise TypeError(msg)
+
+    lengths = {len(col) for col in columns.values()}
+    if len(lengths) > 1:
+        msg = "All columns must have the same length."
+        raise ValueError(msg)
+    n = lengths.pop() if lengths else 0
+
+    values = {
+        name: col.tolist() if hasattr(col, "tolist") else col
+        for name, col in columns.items()
+    }
+
+    if _make._init_args_of(cls) is None:
+        if not validate:
+            msg = f"validate=False needs an __init__ written by attrs, which {cls.__name__} doesn't have."
+            raise ValueError(msg)
+
+        aliases = [by_name[name].alias for name in values]
+        instances = (
+            cls(**dict(zip(aliases, row))) for row in zip(*values.values())
+        )
+
+        return instances if lazy else list(instances)
+
+    if validate:
+        validate = _needs_row_validation(attrs, columns)
+
+    cols = []
+    # Columns of keyword-only attributes follow the positional ones.
+    kw_only = []
+    kw_only_cols = []
+    for a in attrs:
+        if not a.init:
+            continue
+
+        col = values.get(a.name)
+        if col is None:
+            if a.default is NOTHING:
+                msg = f"from_columns() is missing a column for the mandatory attribute {a.name!r}."
+                raise TypeError(msg)
+            if a.kw_only:
+                continue
+            # The generated loop runs the factory for NOTHING, like __init__.
+            default = NOTHING if isinstance(a.default, Factory) else a.default
+            col = [default] * n
+
+        if a.kw_only:
+            kw_only.append(a.alias)
+            kw_only_cols.append(col)
+        else:
+            cols.append(col)
+
+    cols += kw_only_cols
+    rows = zip(*cols) if cols else [()] * n
+
+    return _serializer((cls, "from_rows", tuple(kw_only)))(
+        cls, rows, validate, lazy
+    )
+
+
+def _needs_row_validation(attrs, columns):
+    """
+    Return whether the validators of *attrs* still have to run for every
+    instance built from *columns*, because they can't be checked for whole
+    NumPy arrays or because some values don't pass.
+    """
+    # If any column is a NumPy array, NumPy has been imported by someone.
+    np = sys.modules.get("numpy")
+    for a in attrs:
+        if a.validator is None:
+            continue
+
+        col = columns.get(a.name)
+        if (
+            np is None
+            or a.converter is not None
+            or not isinstance(col, np.ndarray)
+            or col.ndim != 1
+            or _make._check_array(a.validator, col) is not True
+        ):
+            return True
+
+    return False
+
+
+def trusted(cls, *, post_init=False):
+    """
+    返回 *cls* 的受信任构造函数。
+
+    它接受与 ``__init__`` 相同的参数，但直接将它们赋值给实例，绕过 ``__setattr__``：
+    不运行转换器、验证器、*on_setattr* 钩子和 ``__attrs_pre_init__``。
+    只有省略的参数才会使用默认值或调用工厂。
+
+    这适用于重建已知有效的数据的实例，例如从你自己的数据库或缓存中加载的数据。
+
+    构造函数在第一次请求时生成，并与 `asdict` 等生成的函数一起缓存。
+
+    Args:
+        cls (type): 一个 *attrs* 类。
+
+        post_init (bool):
+            是否调用 ``__attrs_post_init__``。如果 *cls* 没有此方法，则忽略。
+
+    Returns:
+        typing.Callable: 返回 *cls* 新实例的构造函数。
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            如果 *cls* 不是一个 *attrs* 类。
+
+    .. versionadded:: 24.3.0
+    """
+    fields(cls)
+
+    post_init = post_init and bool(getattr(cls, "__attrs_post_init__", False))
+
+    return _serializer((cls, "trusted", post_init))
+
+
 def resolve_types(
     cls, globalns=None, localns=None, attribs=None, include_extras=True
 ):
@@ -478,6 +1510,9 @@ def resolve_types(
             if field.name in hints:
                 # Since fields have been frozen we must work around it.
                 _OBJ_SETATTR(field, "type", hints[field.name])
+        # The inherited views of attrs classes contain copies of the fields
+        # that are outdated now.
+        _make._inherited_views_generation += 1
         # We store the class we resolved so that subclasses know they haven't
         # been resolved.
         cls.__attrs_types_resolved__ = cls
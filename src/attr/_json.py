@@ -0,0 +1,315 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+
+from json import encoder
+
+from . import _make
+from ._funcs import _serializer, fields
+
+
+# Number of pieces that are collected before they're yielded as one chunk.
+_CHUNK_PIECES = 4096
+
+_INFINITY = float("inf")
+
+
+def _floatstr(o):
+    """
+    Encode the float *o* like `json.dumps` does.
+    """
+    if o != o:  # noqa: PLR0124
+        return "NaN"
+    if o == _INFINITY:
+        return "Infinity"
+    if o == -_INFINITY:
+        return "-Infinity"
+
+    return float.__repr__(o)
+
+
+_BOOLS = {True: "true", False: "false"}
+
+
+def _nullstr(o):
+    return "null"
+
+
+def iter_json(
+    obj,
+    *,
+    filter=None,
+    value_serializer=None,
+    by_alias=False,
+    ensure_ascii=True,
+):
+    """
+    将 *obj* 编码为 JSON，并逐块生成编码后的字符串。
+
+    结果与 ``json.dumps(attrs.asdict(obj, ...), separators=(",", ":"))`` 相同，但不会先构建字典树：
+    每个类的实例都由为该类生成一次并缓存在类上的函数直接编码。
+    与 `attrs.asdict` 一样，元组、集合和冻结集合被编码为数组。
+
+    块会在容器中的元素之间生成，因此即使是巨大的响应，也只需要很少的内存。
+
+    Args:
+        obj: 一个 *attrs* 实例，或者一个包含它们的列表、元组、集合或字典。
+
+        filter (~typing.Callable):
+            与 `attrs.asdict` 相同，决定一个属性是否被包含。
+
+        value_serializer (typing.Callable | None):
+            与 `attrs.asdict` 相同，在编码之前针对每个属性或字典键/值调用的钩子。
+
+        by_alias (bool):
+            如果为 `True`，则使用属性的别名（即它在 ``__init__`` 中的参数名）作为键，
+            而不是属性名称。
+
+        ensure_ascii (bool): 与 `json.dumps` 相同，转义所有非 ASCII 字符。
+
+    Returns:
+        ~collections.abc.Iterator[str]: JSON 文本的块。
+
+    Raises:
+        TypeError: 如果遇到无法编码为 JSON 的值或字典键。
+
+    .. versionadded:: 24.3.0
+    """
+    enc = (
+        _Encoder(by_alias, ensure_ascii, filter, value_serializer)
+        if filter is not None or value_serializer is not None
+        else _ENCODERS[by_alias, ensure_ascii]
+    )
+    out = []
+    for _ in enc.walk_top(obj, out):
+        yield "".join(out)
+        out.clear()
+
+    if out:
+        yield "".join(out)
+
+
+def dump_json(obj, fp, **kw):
+    """
+    将 *obj* 编码为 JSON 并逐块写入文本文件对象 *fp*。
+
+    关键字参数与 `attrs.iter_json` 相同。
+
+    .. versionadded:: 24.3.0
+    """
+    write = fp.write
+    for chunk in iter_json(obj, **kw):
+        write(chunk)
+
+
+class _Encoder:
+    """
+    The JSON encoding for one combination of arguments of `iter_json`.
+
+    The ``walk_*`` methods are generators that append the pieces of the JSON
+    text to a list and yield whenever enough pieces are collected.
+    """
+
+    __slots__ = (
+        "by_alias",
+        "encode_str",
+        "ensure_ascii",
+        "filter",
+        "scalars",
+        "value_serializer",
+    )
+
+    def __init__(self, by_alias, ensure_ascii, filter, value_serializer):
+        self.by_alias = by_alias
+        self.ensure_ascii = ensure_ascii
+        self.encode_str = (
+            encoder.encode_basestring_ascii
+            if ensure_ascii
+            else encoder.encode_basestring
+        )
+        self.filter = filter
+        self.value_serializer = value_serializer
+        self.scalars = {
+            str: self.encode_str,
+            int: int.__repr__,
+            float: _floatstr,
+            bool: _BOOLS.__getitem__,
+            type(None): _nullstr,
+        }
+
+    def walk_top(self, obj, out):
+        if getattr(obj.__class__, "__attrs_attrs__", None) is not None:
+            return self.walk_inst(obj, out)
+
+        return self.walk(obj, out, True)
+
+    def walk_inst(self, inst, out):
+        if self.filter is None and self.value_serializer is None:
+            return _serializer(
+                (inst.__class__, "json", self.by_alias, self.ensure_ascii)
+            )(inst, out)
+
+        return self.walk_inst_with_hooks(inst, out)
+
+    def walk_inst_with_hooks(self, inst, out):
+        """
+        Interpret the fields of *inst* like `attrs.asdict` does if it's
+        passed *filter* or *value_serializer*.
+        """
+        filter = self.filter
+        value_serializer = self.value_serializer
+        sep = "{"
+        for a in fields(inst.__class__):
+            v = getattr(inst, a.name)
+            if filter is not None and not filter(a, v):
+                continue
+
+            if value_serializer is not None:
+                v = value_serializer(inst, a, v)
+
+            out.append(sep)
+            out.append(self.encode_str(a.alias if self.by_alias else a.name))
+            out.append(":")
+            yield from self.walk(v, out, False)
+            sep = ","
+
+        out.append("{}" if sep == "{" else "}")
+
+    def walk(self, val, out, is_item):
+        """
+        Encode *val*.  *is_item* is True for the elements of containers,
+        which go through the value serializer unless they're containers or
+        *attrs* instances.
+        """
+        cls = val.__class__
+        if getattr(cls, "__attrs_attrs__", None) is not None:
+            yield from self.walk_inst(val, out)
+        elif isinstance(val, (tuple, list, set, frozenset)):
+            out.append("[")
+            first = True
+            for i in val:
+                if not first:
+                    out.append(",")
+                first = False
+                yield from self.walk(i, out, True)
+                if len(out) >= _CHUNK_PIECES:
+                    yield
+            out.append("]")
+        elif isinstance(val, dict):
+            out.append("{")
+            first = True
+            for k, v in val.items():
+                if not first:
+                    out.append(",")
+                first = False
+                out.append(self.encode_key(k))
+                out.append(":")
+                yield from self.walk(v, out, True)
+                if len(out) >= _CHUNK_PIECES:
+                    yield
+            out.append("}")
+        else:
+            if is_item and self.value_serializer is not None:
+                val = self.value_serializer(None, None, val)
+                cls = val.__class__
+            out.append(self.encode_scalar(val, cls))
+
+    def encode_scalar(self, val, cls):
+        enc = self.scalars.get(cls)
+        if enc is not None:
+            return enc(val)
+        if isinstance(val, str):
+            return self.encode_str(val)
+        if isinstance(val, int):
+            return int.__repr__(val)
+        if isinstance(val, float):
+            return _floatstr(val)
+
+        msg = f"Object of type {cls.__name__} is not JSON serializable"
+        raise TypeError(msg)
+
+    def encode_key(self, key):
+        """
+        Encode the dict key *key* like `json.dumps` does after `attrs.asdict`
+        has passed it through the value serializer.
+        """
+        if (
+            self.value_serializer is not None
+            and getattr(key.__class__, "__attrs_attrs__", None) is None
+            and not isinstance(key, (tuple, list, set, frozenset, dict))
+        ):
+            key = self.value_serializer(None, None, key)
+
+        if isinstance(key, str):
+            return self.encode_str(key)
+        if key is True or key is False or key is None:
+            return f'"{self.encode_scalar(key, key.__class__)}"'
+        if isinstance(key, (int, float)):
+            return f'"{self.encode_scalar(key, key.__class__)}"'
+
+        msg = (
+            "keys must be str, int, float, bool or None, not "
+            f"{key.__class__.__name__}"
+        )
+        raise TypeError(msg)
+
+
+_ENCODERS = {
+    (by_alias, ensure_ascii): _Encoder(by_alias, ensure_ascii, None, None)
+    for by_alias in (True, False)
+    for ensure_ascii in (True, False)
+}
+
+# Encoders of annotated types that generated emitters call directly if the
+# value has exactly that type.
+_ANNOTATED = {float: _floatstr, int: int.__repr__, bool: _BOOLS.__getitem__}
+
+
+def _make_emitter(cls, by_alias, ensure_ascii):
+    """
+    Create the generator function that `iter_json` uses to encode instances
+    of *cls* without *filter* and *value_serializer*.
+
+    It's called with the instance and the list to append the pieces to.
+    Values whose classes have no encoder are passed to the `_Encoder`'s
+    ``walk``.
+    """
+    enc = _ENCODERS[by_alias, ensure_ascii]
+    globs = {"__attr_scalars": enc.scalars, "__attr_walk": enc.walk}
+    lines = ["def emit(inst, out):", "    append = out.append"]
+    sep = "{"
+    for i, a in enumerate(cls.__attrs_attrs__):
+        key = enc.encode_str(a.alias if by_alias else a.name)
+        lines.append(f"    append({sep + key + ':'!r})")
+        lines.append(f"    v = inst.{a.name}")
+
+        type_enc = enc.encode_str if a.type is str else _ANNOTATED.get(a.type)
+        if type_enc is not None:
+            globs[f"__attr_type_{i}"] = a.type
+            globs[f"__attr_enc_{i}"] = type_enc
+            lines.append(f"    if v.__class__ is __attr_type_{i}:")
+            lines.append(f"        append(__attr_enc_{i}(v))")
+            lines.append("    else:")
+            indent = "        "
+        else:
+            indent = "    "
+        lines.append(f"{indent}enc = __attr_scalars.get(v.__class__)")
+        lines.append(f"{indent}if enc is not None:")
+        lines.append(f"{indent}    append(enc(v))")
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    yield from __attr_walk(v, out, False)")
+        sep = ","
+
+    lines.append(f"    append({'{}' if sep == '{' else '}'!r})")
+    if sep == "{":
+        # Still needs to be a generator.
+        lines.append("    yield from ()")
+
+    ns = _make._linecache_and_compile(
+        "\n".join(lines),
+        _make._generate_unique_filename(cls, "json"),
+        globs,
+        module=cls.__module__,
+    )
+
+    return ns["emit"]
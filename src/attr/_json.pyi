@@ -0,0 +1,24 @@
+from typing import Any, Callable, Iterator, Protocol
+
+from . import Attribute, _FilterType
+
+class _SupportsWrite(Protocol):
+    def write(self, s: str, /) -> object: ...
+
+def iter_json(
+    obj: Any,
+    *,
+    filter: _FilterType[Any] | None = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    by_alias: bool = ...,
+    ensure_ascii: bool = ...,
+) -> Iterator[str]: ...
+def dump_json(
+    obj: Any,
+    fp: _SupportsWrite,
+    *,
+    filter: _FilterType[Any] | None = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    by_alias: bool = ...,
+    ensure_ascii: bool = ...,
+) -> None: ...
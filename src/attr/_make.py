@@ -4,22 +4,22 @@
 from __future__ import annotations
 
 import abc
+import collections.abc
 import contextlib
 import copy
 import enum
 import functools
-import inspect
 import itertools
-import linecache
 import sys
 import types
 import typing
+import weakref
 
 from operator import itemgetter
 
 # We need to import _compat itself in addition to the _compat members to avoid
 # having the thread-local in the globals here.
-from . import _compat, _config, setters
+from . import _compat, _config, codegen, setters
 from ._compat import (
     PY_3_10_PLUS,
     PY_3_11_PLUS,
@@ -56,6 +56,13 @@ _SENTINEL = object()
 
 _DEFAULT_ON_SETATTR = setters.pipe(setters.convert, setters.validate)
 
+# Name of the dict that caches the functions generated for asdict() and
+# astuple() on each class.
+_SERIALIZERS_NAME = "__attrs_serializers__"
+
+# Classes whose instances asdict() and astuple() return unchanged.
+_SCALAR_TYPES = frozenset((str, int, float, bool, complex, bytes, type(None)))
+
 
 class _Nothing(enum.Enum):
     """
@@ -202,42 +209,47 @@ def attrib(
     )
 
 
-def _compile_and_eval(script, globs, locs=None, filename=""):
+def _compile_and_eval(script, globs, locs=None, filename="", module=None):
     """
     Evaluate the script with the given global (globs) and local (locs)
     variables.
+
+    *module* is the name of the module the script is generated for.
     """
-    bytecode = compile(script, filename, "exec")
+    code = codegen._precompiled(script, filename, module)
+    if code is not None:
+        # Precompiled scripts live in a function that returns its namespace.
+        ns = types.FunctionType(code, {**globs, **locs} if locs else globs)()
+        (globs if locs is None else locs).update(ns)
+        return
+
+    bytecode = codegen._compile(script, filename, module)
     eval(bytecode, globs, locs)
 
 
-def _make_method(name, script, filename, globs, locals=None):
+def _linecache_and_compile(script, filename, globs, locals=None, module=None):
     """
-    Create the method with the script given and return the method object.
+    Register *script* with linecache, evaluate it, and return the namespace
+    it has been evaluated in.
     """
     locs = {} if locals is None else locals
 
     # In order of debuggers like PDB being able to step through the code,
     # we add a fake linecache entry.
-    count = 1
-    base_filename = filename
-    while True:
-        linecache_tuple = (
-            len(script),
-            None,
-            script.splitlines(True),
-            filename,
-        )
-        old_val = linecache.cache.setdefault(filename, linecache_tuple)
-        if old_val == linecache_tuple:
-            break
+    filename = codegen._register_source(script, filename)
 
-        filename = f"{base_filename[:-1]}-{count}>"
-        count += 1
+    _compile_and_eval(script, globs, locs, filename, module)
 
-    _compile_and_eval(script, globs, locs, filename)
+    return locs
 
-    return locs[name]
+
+def _make_method(name, script, filename, globs, locals=None, module=None):
+    """
+    Create the method with the script given and return the method object.
+    """
+    return _linecache_and_compile(script, filename, globs, locals, module)[
+        name
+    ]
 
 
 def _make_attr_tuple_class(cls_name, attr_names):
@@ -249,22 +261,26 @@ def _make_attr_tuple_class(cls_name, attr_names):
     class MyClassAttributes(tuple):
         __slots__ = ()
         x = property(itemgetter(0))
+
+    Classes with the same name and attribute names share their tuple class.
     """
-    attr_class_name = f"{cls_name}Attributes"
-    attr_class_template = [
-        f"class {attr_class_name}(tuple):",
-        "    __slots__ = ()",
-    ]
-    if attr_names:
-        for i, attr_name in enumerate(attr_names):
-            attr_class_template.append(
-                f"    {attr_name} = _attrs_property(_attrs_itemgetter({i}))"
-            )
-    else:
-        attr_class_template.append("    pass")
-    globs = {"_attrs_itemgetter": itemgetter, "_attrs_property": property}
-    _compile_and_eval("\n".join(attr_class_template), globs)
-    return globs[attr_class_name]
+    return _attr_tuple_class(cls_name, tuple(attr_names))
+
+
+@functools.lru_cache(maxsize=1024)
+def _attr_tuple_class(cls_name, attr_names):
+    """
+    Build the tuple class for `_make_attr_tuple_class` using `type`, which is
+    much cheaper than generating and compiling its source.
+
+    The class name is part of the key because it shows up in the error
+    messages of misspelled attribute names.
+    """
+    body = {"__slots__": (), "__module__": "builtins"}
+    for i, attr_name in enumerate(attr_names):
+        body[attr_name] = property(itemgetter(i))
+
+    return type(f"{cls_name}Attributes", (tuple,), body)
 
 
 # Tuple class for extracted attributes from a class definition.
@@ -306,63 +322,173 @@ def _has_own_attribute(cls, attrib_name):
     return attrib_name in cls.__dict__
 
 
-def _collect_base_attrs(cls, taken_attr_names):
+# Bumped by resolve_types() that changes Attributes in place, which makes
+# all cached inherited views stale.
+_inherited_views_generation = 0
+
+
+def _inherited_view(cls, collect_by_mro):
     """
-    Collect attr.ibs from base classes of *cls*, except *taken_attr_names*.
+    Return the attributes that *cls* passes on to its subclasses as a list of
+    inherited `Attribute`s and a dict of their names to the classes that
+    define them.
+
+    The result is cached in ``cls.__attrs_inherited_view__``, such that the
+    subclasses of *cls* don't have to walk its MRO again.  Don't modify it.
+    """
+    own_attrs = cls.__dict__["__attrs_attrs__"]
+    cached = cls.__dict__.get("__attrs_inherited_view__")
+    if (
+        cached is None
+        or cached[0] is not own_attrs
+        or cached[1] != _inherited_views_generation
+    ):
+        cached = (own_attrs, _inherited_views_generation, {})
+        with contextlib.suppress(AttributeError, TypeError):
+            cls.__attrs_inherited_view__ = cached
+
+    views = cached[2]
+    view = views.get(collect_by_mro)
+    if view is None:
+        prepend = (
+            _prepend_base_attrs
+            if collect_by_mro
+            else _prepend_base_attrs_broken
+        )
+        view = views[collect_by_mro] = prepend(
+            (cls,), *_walk_base_attrs(cls.__mro__[1:-1], collect_by_mro)
+        )
+
+    return view
+
+
+def _walk_base_attrs(mro, collect_by_mro):
+    """
+    Collect the attributes of the classes in *mro* like `_inherited_view`.
+
+    Start from the view of the first attrs class that shares the rest of
+    *mro* and only walk the classes in front of it, which makes creating
+    classes in deep hierarchies linear instead of quadratic in their depth.
+
+    Don't modify the result.
     """
-    base_attrs = []
-    base_attr_map = {}  # A dictionary of base attrs to their classes.
+    for i, base_cls in enumerate(mro):
+        if (
+            "__attrs_attrs__" in base_cls.__dict__
+            and base_cls.__mro__[:-1] == mro[i:]
+        ):
+            view = _inherited_view(base_cls, collect_by_mro)
+            mro = mro[:i]
+            break
+    else:
+        view = [], {}
+
+    if collect_by_mro:
+        return _prepend_base_attrs(mro, *view)
 
+    return _prepend_base_attrs_broken(mro, *view)
+
+
+def _prepend_base_attrs(classes, base_attrs, base_attr_map):
+    """
+    Return *base_attrs* and *base_attr_map* with the attributes of the more
+    derived *classes* in front of them, in MRO order.
+    """
+    new_attrs = []
+    new_attr_map = {}
     # Traverse the MRO and collect attributes.
-    for base_cls in reversed(cls.__mro__[1:-1]):
+    for base_cls in reversed(classes):
         for a in getattr(base_cls, "__attrs_attrs__", []):
-            if a.inherited or a.name in taken_attr_names:
+            if a.inherited:
                 continue
 
             a = a.evolve(inherited=True)  # noqa: PLW2901
-            base_attrs.append(a)
-            base_attr_map[a.name] = base_cls
+            new_attrs.append(a)
+            new_attr_map[a.name] = base_cls
+
+    if not new_attrs:
+        return base_attrs, base_attr_map
 
     # For each name, only keep the freshest definition i.e. the furthest at the
     # back.  base_attr_map is fine because it gets overwritten with every new
     # instance.
     filtered = []
     seen = set()
-    for a in reversed(base_attrs):
+    for a in reversed(base_attrs + new_attrs):
         if a.name in seen:
             continue
-        filtered.insert(0, a)
+        filtered.append(a)
         seen.add(a.name)
+    filtered.reverse()
 
-    return filtered, base_attr_map
+    return filtered, {**base_attr_map, **new_attr_map}
 
 
-def _collect_base_attrs_broken(cls, taken_attr_names):
+def _prepend_base_attrs_broken(classes, base_attrs, base_attr_map):
+    """
+    Like `_prepend_base_attrs`, but adhere to the old incorrect behavior.
+
+    Notably it collects from the front and considers inherited attributes which
+    leads to the buggy behavior reported in #428.
+    """
+    new_attrs = []
+    new_attr_map = {}
+    for base_cls in classes:
+        for a in getattr(base_cls, "__attrs_attrs__", []):
+            if a.name in new_attr_map:
+                continue
+
+            # Views aren't handed out, so inherited ones can be shared.
+            if not a.inherited:
+                a = a.evolve(inherited=True)  # noqa: PLW2901
+            new_attrs.append(a)
+            new_attr_map[a.name] = base_cls
+
+    if not new_attrs:
+        return base_attrs, base_attr_map
+
+    new_attrs.extend(a for a in base_attrs if a.name not in new_attr_map)
+
+    return new_attrs, {**base_attr_map, **new_attr_map}
+
+
+def _collect_base_attrs(cls, taken_attr_names):
     """
     Collect attr.ibs from base classes of *cls*, except *taken_attr_names*.
+    """
+    return _copy_base_attrs(
+        _walk_base_attrs(cls.__mro__[1:-1], True), taken_attr_names
+    )
 
-    N.B. *taken_attr_names* will be mutated.
+
+def _collect_base_attrs_broken(cls, taken_attr_names):
+    """
+    Collect attr.ibs from base classes of *cls*, except *taken_attr_names*.
 
     Adhere to the old incorrect behavior.
 
     Notably it collects from the front and considers inherited attributes which
     leads to the buggy behavior reported in #428.
     """
-    base_attrs = []
-    base_attr_map = {}  # A dictionary of base attrs to their classes.
-
-    # Traverse the MRO and collect attributes.
-    for base_cls in cls.__mro__[1:-1]:
-        for a in getattr(base_cls, "__attrs_attrs__", []):
-            if a.name in taken_attr_names:
-                continue
+    return _copy_base_attrs(
+        _walk_base_attrs(cls.__mro__[1:-1], False), taken_attr_names
+    )
 
-            a = a.evolve(inherited=True)  # noqa: PLW2901
-            taken_attr_names.add(a.name)
-            base_attrs.append(a)
-            base_attr_map[a.name] = base_cls
 
-    return base_attrs, base_attr_map
+def _copy_base_attrs(view, taken_attr_names):
+    """
+    Return copies of the attributes in the inherited *view* that belong to a
+    new class, except *taken_attr_names*.
+    """
+    base_attrs, base_attr_map = view
+
+    return [
+        copy.copy(a) for a in base_attrs if a.name not in taken_attr_names
+    ], {
+        name: base_cls
+        for name, base_cls in base_attr_map.items()
+        if name not in taken_attr_names
+    }
 
 
 def _transform_attrs(
@@ -529,6 +655,7 @@ def _make_cached_property_getattr(cached_properties, original_getattr, cls):
         locals={
             "_cls": cls,
         },
+        module=cls.__module__,
     )
 
 
@@ -554,6 +681,121 @@ def _frozen_delattrs(self, name):
     raise FrozenInstanceError
 
 
+class _LazyMethods:
+    """
+    Stand in for a group of methods that are generated on first access.
+
+    *factory* is called with the class the descriptor has been found on and
+    returns the methods called *names*.  The methods replace all stand-ins of
+    the group on that class, so after the first access the class looks
+    exactly like one whose methods have been generated eagerly.
+    """
+
+    __slots__ = ("factory", "methods", "names")
+
+    def __init__(self, names, factory):
+        self.names = names
+        self.factory = factory
+        self.methods = {}
+
+    def install(self, cls):
+        """
+        Generate the methods and put them on *cls*.
+        """
+        if not self.methods:
+            self.methods = {
+                name: _add_method_dunders(cls, meth)
+                for name, meth in zip(self.names, self.factory(cls))
+            }
+
+        for name, meth in self.methods.items():
+            if isinstance(cls.__dict__.get(name), _LazyMethod):
+                setattr(cls, name, meth)
+
+        return self.methods
+
+
+class _LazyMethod:
+    """
+    A non-data descriptor that stands in for the method *name* of a
+    `_LazyMethods` group until it's accessed for the first time.
+    """
+
+    __slots__ = ("group", "name")
+
+    def __init__(self, name, group):
+        self.name = name
+        self.group = group
+
+    def __get__(self, instance, owner):
+        cls = next(
+            c for c in owner.__mro__ if c.__dict__.get(self.name) is self
+        )
+
+        return self.group.install(cls)[self.name].__get__(instance, owner)
+
+
+def _add_method_dunders(cls, method):
+    """
+    Add __module__ and __qualname__ to a *method* of *cls* if possible.
+    """
+    with contextlib.suppress(AttributeError):
+        method.__module__ = cls.__module__
+
+    with contextlib.suppress(AttributeError):
+        method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+
+    with contextlib.suppress(AttributeError):
+        method.__doc__ = (
+            f"Method generated by attrs for class {cls.__qualname__}."
+        )
+
+    return method
+
+
+def _rewrite_closure_cells(items, old_cls, new_cls):
+    """
+    Point all closure cells of *items* that refer to *old_cls* to *new_cls*.
+
+    The following is a fix for
+    <https://github.com/python-attrs/attrs/issues/102>.
+    If a method mentions `__class__` or uses the no-arg super(), the
+    compiler will bake a reference to the class in the method itself
+    as `method.__closure__`.  Since we replace the class with a
+    clone, we rewrite these references so it keeps working.
+    """
+    for item in items:
+        if isinstance(item, (classmethod, staticmethod)):
+            # Class- and staticmethods hide their functions inside.
+            # These might need to be rewritten as well.
+            closure_cells = getattr(item.__func__, "__closure__", None)
+        elif isinstance(item, property):
+            # Workaround for property `super()` shortcut (PY3-only).
+            # There is no universal way for other descriptors.
+            closure_cells = getattr(item.fget, "__closure__", None)
+        else:
+            closure_cells = getattr(item, "__closure__", None)
+
+        if not closure_cells:  # Catch None or the empty list.
+            continue
+        for cell in closure_cells:
+            try:
+                match = cell.cell_contents is old_cls
+            except ValueError:  # noqa: PERF203
+                # ValueError: Cell is empty
+                pass
+            else:
+                if match:
+                    cell.cell_contents = new_cls
+
+
+def _call_attrs_init_subclass(cls):
+    """
+    Call the ``__attrs_init_subclass__`` class method of *cls*.
+    """
+    cls.__attrs_init_subclass__()
+
+
 class _ClassBuilder:
     """
     Iteratively build *one* class.
@@ -573,7 +815,10 @@ class _ClassBuilder:
         "_pre_init_has_args",
         "_has_post_init",
         "_is_exc",
+        "_lazy_methods",
         "_on_setattr",
+        "_repr_added",
+        "_script_snippets",
         "_slots",
         "_weakref_slot",
         "_wrote_own_setattr",
@@ -596,6 +841,7 @@ class _ClassBuilder:
         on_setattr,
         has_custom_setattr,
         field_transformer,
+        lazy_methods,
     ):
         attrs, base_attrs, base_map = _transform_attrs(
             cls,
@@ -621,6 +867,8 @@ class _ClassBuilder:
         if self._has_pre_init:
             # Check if the pre init method has more arguments than just `self`
             # We want to pass arguments if pre init expects arguments
+            import inspect
+
             pre_init_func = cls.__attrs_pre_init__
             pre_init_signature = inspect.signature(pre_init_func)
             self._pre_init_has_args = len(pre_init_signature.parameters) > 1
@@ -628,9 +876,15 @@ class _ClassBuilder:
         self._delete_attribs = not bool(these)
         self._is_exc = is_exc
         self._on_setattr = on_setattr
+        self._lazy_methods = lazy_methods
 
         self._has_custom_setattr = has_custom_setattr
         self._wrote_own_setattr = False
+        self._repr_added = False
+        # (script, globals, hook) triples of methods that are compiled in one
+        # go once the class is built.  The hooks are called with the class
+        # dict and the namespace the scripts have been evaluated in.
+        self._script_snippets = []
 
         self._cls_dict["__attrs_attrs__"] = self._attrs
 
@@ -681,6 +935,9 @@ class _ClassBuilder:
 
         Builder cannot be used after calling this method.
         """
+        if self._script_snippets:
+            self._eval_snippets()
+
         if self._slots is True:
             cls = self._create_slots_class()
         else:
@@ -694,10 +951,45 @@ class _ClassBuilder:
             getattr(cls, "__attrs_init_subclass__", None)
             and "__attrs_init_subclass__" not in cls.__dict__
         ):
-            cls.__attrs_init_subclass__()
+            _call_attrs_init_subclass(cls)
 
         return cls
 
+    def _eval_snippets(self):
+        """
+        Compile and evaluate all collected scripts at once and let their
+        hooks attach the resulting methods.
+        """
+        cls = self._cls
+        names = {}
+        for _, snippet_globs, _ in self._script_snippets:
+            names.update(snippet_globs)
+
+        # The scripts are wrapped in a function that takes the names they
+        # need as arguments, such that the module namespace can be used as
+        # the globals of the methods without copying it.
+        script = "\n\n".join(
+            snippet for snippet, _, _ in self._script_snippets
+        )
+        body = "\n".join(
+            f"    {line}" if line.strip() else ""
+            for line in script.splitlines()
+        )
+        script = (
+            f"def __attrs_create({', '.join(names)}):\n"
+            f"{body}\n    return locals()\n"
+        )
+
+        ns = _linecache_and_compile(
+            script,
+            _generate_unique_filename(cls, "methods"),
+            _module_globals(cls),
+            module=cls.__module__,
+        )["__attrs_create"](**names)
+
+        for _, _, hook in self._script_snippets:
+            hook(self._cls_dict, ns)
+
     def _patch_original_class(self):
         """
         Apply accumulated methods and return the class.
@@ -796,6 +1088,8 @@ class _ClassBuilder:
         # To know to update them.
         additional_closure_functions_to_update = []
         if cached_properties:
+            import inspect
+
             class_annotations = _get_annotations(self._cls)
             for name, func in cached_properties.items():
                 # Add cached properties to names for slotting.
@@ -840,48 +1134,32 @@ class _ClassBuilder:
         # Create new class based on old class and our methods.
         cls = type(self._cls)(self._cls.__name__, self._cls.__bases__, cd)
 
-        # The following is a fix for
-        # <https://github.com/python-attrs/attrs/issues/102>.
-        # If a method mentions `__class__` or uses the no-arg super(), the
-        # compiler will bake a reference to the class in the method itself
-        # as `method.__closure__`.  Since we replace the class with a
-        # clone, we rewrite these references so it keeps working.
-        for item in itertools.chain(
-            cls.__dict__.values(), additional_closure_functions_to_update
-        ):
-            if isinstance(item, (classmethod, staticmethod)):
-                # Class- and staticmethods hide their functions inside.
-                # These might need to be rewritten as well.
-                closure_cells = getattr(item.__func__, "__closure__", None)
-            elif isinstance(item, property):
-                # Workaround for property `super()` shortcut (PY3-only).
-                # There is no universal way for other descriptors.
-                closure_cells = getattr(item.fget, "__closure__", None)
-            else:
-                closure_cells = getattr(item, "__closure__", None)
+        _rewrite_closure_cells(
+            itertools.chain(
+                cls.__dict__.values(), additional_closure_functions_to_update
+            ),
+            self._cls,
+            cls,
+        )
 
-            if not closure_cells:  # Catch None or the empty list.
-                continue
-            for cell in closure_cells:
-                try:
-                    match = cell.cell_contents is self._cls
-                except ValueError:  # noqa: PERF203
-                    # ValueError: Cell is empty
-                    pass
-                else:
-                    if match:
-                        cell.cell_contents = cls
         return cls
 
     def add_repr(self, ns):
-        self._cls_dict["__repr__"] = self._add_method_dunders(
-            _make_repr(self._attrs, ns, self._cls)
-        )
+        attrs = self._attrs
+
+        if self._lazy_methods:
+            self._add_methods(
+                ("__repr__",), lambda cls: (_make_repr(attrs, ns, cls),)
+            )
+        else:
+            self._add_script("__repr__", *_make_repr_script(attrs, ns))
+
+        self._repr_added = True
+
         return self
 
     def add_str(self):
-        repr = self._cls_dict.get("__repr__")
-        if repr is None:
+        if not self._repr_added:
             msg = "__str__ can only be generated if a __repr__ exists."
             raise ValueError(msg)
 
@@ -937,34 +1215,31 @@ class _ClassBuilder:
         return self
 
     def add_hash(self):
-        self._cls_dict["__hash__"] = self._add_method_dunders(
-            _make_hash(
-                self._cls,
-                self._attrs,
-                frozen=self._frozen,
-                cache_hash=self._cache_hash,
+        attrs = self._attrs
+        frozen = self._frozen
+        cache_hash = self._cache_hash
+
+        if self._lazy_methods:
+            self._add_methods(
+                ("__hash__",),
+                lambda cls: (
+                    _make_hash(
+                        cls, attrs, frozen=frozen, cache_hash=cache_hash
+                    ),
+                ),
+            )
+        else:
+            self._add_script(
+                "__hash__",
+                *_make_hash_script(
+                    self._cls, attrs, frozen=frozen, cache_hash=cache_hash
+                ),
             )
-        )
 
         return self
 
     def add_init(self):
-        self._cls_dict["__init__"] = self._add_method_dunders(
-            _make_init(
-                self._cls,
-                self._attrs,
-                self._has_pre_init,
-                self._pre_init_has_args,
-                self._has_post_init,
-                self._frozen,
-                self._slots,
-                self._cache_hash,
-                self._base_attr_map,
-                self._is_exc,
-                self._on_setattr,
-                attrs_init=False,
-            )
-        )
+        self._add_init_script(attrs_init=False)
 
         return self
 
@@ -976,41 +1251,49 @@ class _ClassBuilder:
         )
 
     def add_attrs_init(self):
-        self._cls_dict["__attrs_init__"] = self._add_method_dunders(
-            _make_init(
-                self._cls,
-                self._attrs,
-                self._has_pre_init,
-                self._pre_init_has_args,
-                self._has_post_init,
-                self._frozen,
-                self._slots,
-                self._cache_hash,
-                self._base_attr_map,
-                self._is_exc,
-                self._on_setattr,
-                attrs_init=True,
-            )
-        )
+        self._add_init_script(attrs_init=True)
 
         return self
 
-    def add_eq(self):
-        cd = self._cls_dict
-
-        cd["__eq__"] = self._add_method_dunders(
-            _make_eq(self._cls, self._attrs)
+    def _add_init_script(self, attrs_init):
+        init_args = (
+            self._attrs,
+            self._has_pre_init,
+            self._pre_init_has_args,
+            self._has_post_init,
+            self._frozen,
+            self._slots,
+            self._cache_hash,
+            self._base_attr_map,
+            self._is_exc,
+            self._on_setattr,
         )
-        cd["__ne__"] = self._add_method_dunders(_make_ne())
+        script, globs, annotations = _make_init_script(
+            *init_args, attrs_init=attrs_init
+        )
+        name = "__attrs_init__" if attrs_init else "__init__"
+
+        def attach_init(cls_dict, ns):
+            init = ns[name]
+            init.__annotations__ = annotations
+            cls_dict[name] = self._add_method_dunders(init)
+            if not attrs_init:
+                _INIT_ARGS[init] = init_args
+
+        self._script_snippets.append((script, globs, attach_init))
+
+    def add_eq(self):
+        self._add_script("__eq__", *_make_eq_script(self._attrs))
+        self._cls_dict["__ne__"] = self._add_method_dunders(_make_ne())
 
         return self
 
     def add_order(self):
-        cd = self._cls_dict
+        attrs = self._attrs
 
-        cd["__lt__"], cd["__le__"], cd["__gt__"], cd["__ge__"] = (
-            self._add_method_dunders(meth)
-            for meth in _make_order(self._cls, self._attrs)
+        self._add_methods(
+            ("__lt__", "__le__", "__gt__", "__ge__"),
+            lambda cls: _make_order(cls, attrs),
         )
 
         return self
@@ -1033,6 +1316,17 @@ class _ClassBuilder:
             msg = "Can't combine custom __setattr__ with on_setattr hooks."
             raise ValueError(msg)
 
+        script, globs = _make_on_setattr_script(sa_attrs)
+        if script:
+
+            def attach_hooks(cls_dict, ns):
+                for name, (a, _) in sa_attrs.items():
+                    hook = ns.get(f"__attr_on_setattr_{name}")
+                    if hook is not None:
+                        sa_attrs[name] = a, hook
+
+            self._script_snippets.append((script, globs, attach_hooks))
+
         # docstring comes from _add_method_dunders
         def __setattr__(self, name, val):
             try:
@@ -1050,23 +1344,40 @@ class _ClassBuilder:
 
         return self
 
-    def _add_method_dunders(self, method):
+    def _add_script(self, name, script, globs):
         """
-        Add __module__ and __qualname__ to a *method* if possible.
+        Add the method *name* defined by *script* to the scripts that are
+        compiled when the class is built.
         """
-        with contextlib.suppress(AttributeError):
-            method.__module__ = self._cls.__module__
 
-        with contextlib.suppress(AttributeError):
-            method.__qualname__ = f"{self._cls.__qualname__}.{method.__name__}"
+        def attach(cls_dict, ns):
+            cls_dict[name] = self._add_method_dunders(ns[name])
 
-        with contextlib.suppress(AttributeError):
-            method.__doc__ = (
-                "Method generated by attrs for class "
-                f"{self._cls.__qualname__}."
-            )
+        self._script_snippets.append((script, globs, attach))
+
+    def _add_methods(self, names, factory):
+        """
+        Add the methods *names* returned by *factory* -- called with the
+        class -- to the class.
+
+        If the class has lazy methods, *factory* isn't called before one of
+        the methods is accessed for the first time.
+        """
+        cd = self._cls_dict
+
+        if self._lazy_methods:
+            group = _LazyMethods(names, factory)
+            for name in names:
+                cd[name] = _LazyMethod(name, group)
+        else:
+            for name, meth in zip(names, factory(self._cls)):
+                cd[name] = self._add_method_dunders(meth)
 
-        return method
+    def _add_method_dunders(self, method):
+        """
+        Add __module__ and __qualname__ to a *method* if possible.
+        """
+        return _add_method_dunders(self._cls, method)
 
 
 def _determine_attrs_eq_order(cmp, eq, order, default_eq):
@@ -1191,6 +1502,7 @@ def attrs(
     field_transformer=None,
     match_args=True,
     unsafe_hash=None,
+    lazy_methods=None,
 ):
     r"""
     一个类装饰器，根据指定的属性使用 `attr.ib` 或 *these* 参数添加 :term:`双下划线方法 <dunder methods>`。
@@ -1244,6 +1556,7 @@ def attrs(
     .. versionadded:: 24.1.0
        如果一个类有一个 *继承的* 类方法 ``__attrs_init_subclass__``，则在类创建后执行。
     .. deprecated:: 24.1.0 *hash* 被弃用，取而代之的是 *unsafe_hash*。
+    .. versionadded:: 24.3.0 *lazy_methods*
     """
     if repr_ns is not None:
         import warnings
@@ -1296,6 +1609,13 @@ def attrs(
             on_setattr,
             has_own_setattr,
             field_transformer,
+            # Scripts that are captured for or loaded from precompiled
+            # modules must be complete.
+            codegen._captured_scripts is None
+            and not codegen._use_precompiled
+            and (
+                codegen._lazy_methods if lazy_methods is None else lazy_methods
+            ),
         )
         if _determine_whether_to_implement(
             cls, repr, auto_detect, ("__repr__",)
@@ -1399,17 +1719,21 @@ def _generate_unique_filename(cls, func_name):
     )
 
 
-def _make_hash(cls, attrs, frozen, cache_hash):
+def _make_hash_script(cls, attrs, frozen, cache_hash):
+    """
+    Return the script and the globals of the __hash__ method for *cls* with
+    *attrs*.
+    """
     attrs = tuple(
         a for a in attrs if a.hash is True or (a.hash is None and a.eq is True)
     )
 
     tab = "        "
 
-    unique_filename = _generate_unique_filename(cls, "hash")
-    type_hash = hash(unique_filename)
+    # The type hash is passed in as a global to keep the script free of
+    # per-process values like string hashes.
     # If eq is custom generated, we need to include the functions in globs
-    globs = {}
+    globs = {"_type_hash": hash(_generate_unique_filename(cls, "hash"))}
 
     hash_def = "def __hash__(self"
     hash_func = "hash(("
@@ -1435,7 +1759,7 @@ def _make_hash(cls, attrs, frozen, cache_hash):
         method_lines.extend(
             [
                 indent + prefix + hash_func,
-                indent + f"        {type_hash},",
+                indent + "        _type_hash,",
             ]
         )
 
@@ -1466,8 +1790,19 @@ def _make_hash(cls, attrs, frozen, cache_hash):
     else:
         append_hash_computation_lines("return ", tab)
 
-    script = "\n".join(method_lines)
-    return _make_method("__hash__", script, unique_filename, globs)
+    return "\n".join(method_lines), globs
+
+
+def _make_hash(cls, attrs, frozen, cache_hash):
+    script, globs = _make_hash_script(cls, attrs, frozen, cache_hash)
+
+    return _make_method(
+        "__hash__",
+        script,
+        _generate_unique_filename(cls, "hash"),
+        globs,
+        module=cls.__module__,
+    )
 
 
 def _add_hash(cls, attrs):
@@ -1497,13 +1832,12 @@ def _make_ne():
     return __ne__
 
 
-def _make_eq(cls, attrs):
+def _make_eq_script(attrs):
     """
-    Create __eq__ method for *cls* with *attrs*.
+    Return the script and the globals of the __eq__ method for *attrs*.
     """
     attrs = [a for a in attrs if a.eq]
 
-    unique_filename = _generate_unique_filename(cls, "eq")
     lines = [
         "def __eq__(self, other):",
         "    if other.__class__ is not self.__class__:",
@@ -1532,9 +1866,22 @@ def _make_eq(cls, attrs):
     else:
         lines.append("    return True")
 
-    script = "\n".join(lines)
+    return "\n".join(lines), globs
+
+
+def _make_eq(cls, attrs):
+    """
+    Create __eq__ method for *cls* with *attrs*.
+    """
+    script, globs = _make_eq_script(attrs)
 
-    return _make_method("__eq__", script, unique_filename, globs)
+    return _make_method(
+        "__eq__",
+        script,
+        _generate_unique_filename(cls, "eq"),
+        globs,
+        module=cls.__module__,
+    )
 
 
 def _make_order(cls, attrs):
@@ -1606,8 +1953,10 @@ def _add_eq(cls, attrs=None):
     return cls
 
 
-def _make_repr(attrs, ns, cls):
-    unique_filename = _generate_unique_filename(cls, "repr")
+def _make_repr_script(attrs, ns):
+    """
+    Return the script and the globals of the __repr__ method for *attrs*.
+    """
     # Figure out which attributes to include, and which function to use to
     # format them. The a.repr value can be either bool or a custom
     # callable.
@@ -1658,8 +2007,18 @@ def _make_repr(attrs, ns, cls):
         "    already_repring.remove(id(self))",
     ]
 
+    return "\n".join(lines), globs
+
+
+def _make_repr(attrs, ns, cls):
+    script, globs = _make_repr_script(attrs, ns)
+
     return _make_method(
-        "__repr__", "\n".join(lines), unique_filename, globs=globs
+        "__repr__",
+        script,
+        _generate_unique_filename(cls, "repr"),
+        globs=globs,
+        module=cls.__module__,
     )
 
 
@@ -1772,8 +2131,7 @@ def _is_slot_attr(a_name, base_attr_map):
     return cls and "__slots__" in cls.__dict__
 
 
-def _make_init(
-    cls,
+def _make_init_script(
     attrs,
     pre_init,
     pre_init_has_args,
@@ -1786,6 +2144,49 @@ def _make_init(
     cls_on_setattr,
     attrs_init,
 ):
+    """
+    Return the script, the globals, and the annotations of the __init__ (or
+    __attrs_init__ if *attrs_init* is True) method for *attrs*.
+    """
+    lines, args, kw_only_args, globs, annotations = _make_init_lines(
+        attrs,
+        pre_init,
+        pre_init_has_args,
+        post_init,
+        frozen,
+        slots,
+        cache_hash,
+        base_attr_map,
+        is_exc,
+        cls_on_setattr,
+    )
+    script = _fmt_init_script(
+        "__attrs_init__" if attrs_init else "__init__",
+        lines,
+        args,
+        kw_only_args,
+    )
+
+    return script, globs, annotations
+
+
+def _make_init_lines(
+    attrs,
+    pre_init,
+    pre_init_has_args,
+    post_init,
+    frozen,
+    slots,
+    cache_hash,
+    base_attr_map,
+    is_exc,
+    cls_on_setattr,
+    run_validators="_config._run_validators",
+):
+    """
+    Return the body lines, the positional and keyword-only parameters, the
+    globals, and the annotations of an initializer for *attrs*.
+    """
     has_cls_on_setattr = (
         cls_on_setattr is not None and cls_on_setattr is not setters.NO_OP
     )
@@ -1813,9 +2214,7 @@ def _make_init(
         elif has_cls_on_setattr and a.on_setattr is not setters.NO_OP:
             needs_cached_setattr = True
 
-    unique_filename = _generate_unique_filename(cls, "init")
-
-    script, globs, annotations = _attrs_to_init_script(
+    lines, args, kw_only_args, globs, annotations = _attrs_to_init_lines(
         filtered_attrs,
         frozen,
         slots,
@@ -1827,11 +2226,8 @@ def _make_init(
         is_exc,
         needs_cached_setattr,
         has_cls_on_setattr,
-        "__attrs_init__" if attrs_init else "__init__",
+        run_validators,
     )
-    if cls.__module__ in sys.modules:
-        # This makes typing.get_type_hints(CLS.__init__) resolve string types.
-        globs.update(sys.modules[cls.__module__].__dict__)
 
     globs.update({"NOTHING": NOTHING, "attr_dict": attr_dict})
 
@@ -1840,18 +2236,1004 @@ def _make_init(
         # setattr hooks.
         globs["_cached_setattr_get"] = _OBJ_SETATTR.__get__
 
-    init = _make_method(
-        "__attrs_init__" if attrs_init else "__init__",
-        script,
-        unique_filename,
-        globs,
-    )
-    init.__annotations__ = annotations
+    return lines, args, kw_only_args, globs, annotations
 
-    return init
 
+# The __init__ methods written by us and the arguments that they have been
+# created with, such that attrs.from_rows can repeat their bodies.
+_INIT_ARGS = weakref.WeakKeyDictionary()
 
-def _setattr(attr_name: str, value_var: str, has_on_setattr: bool) -> str:
+
+def _init_args_of(cls):
+    """
+    Return the arguments that the __init__ of *cls* has been created with, or
+    None if it isn't written by us.
+    """
+    try:
+        return _INIT_ARGS.get(cls.__init__)
+    except TypeError:  # Can't be weakly referenced, so it's not ours.
+        return None
+
+
+def _make_from_rows(cls, kw_only=()):
+    """
+    Create the bulk constructor of *cls* for `attrs.from_rows`, or return
+    None if the __init__ of *cls* isn't written by us.
+
+    It runs the body of __init__ in a loop over rows that are unpacked into
+    the positional arguments, which saves a call per instance.  Rows that
+    are shorter than the positional arguments get the defaults of the
+    missing ones.
+
+    If *kw_only* names keyword-only arguments, each row must contain all
+    positional arguments followed by them.
+    """
+    init_args = _init_args_of(cls)
+    if init_args is None:
+        return None
+
+    body, args, kw_only_args, globs, _ = _make_init_lines(
+        *init_args, run_validators="__attr_validate"
+    )
+
+    kw_only_args = [
+        kwa for kwa in kw_only_args if kwa.split("=")[0] not in kw_only
+    ]
+    mandatory = [arg for arg in kw_only_args if "=" not in arg]
+    if mandatory:
+        msg = f"{cls.__name__}() has mandatory keyword-only arguments {mandatory!r} that can't be passed in rows."
+        raise TypeError(msg)
+
+    positional = [arg.split("=")[0] for arg in args]
+    tail = []
+    for a in init_args[0]:
+        if not a.init or a.kw_only or a.default is NOTHING:
+            continue
+        # The body runs the factory for NOTHING, like __init__.
+        tail.append(NOTHING if isinstance(a.default, Factory) else a.default)
+    tail = tuple(tail)
+    n_min = len(positional) - len(tail)
+    n_max = len(positional)
+    if kw_only:
+        tail = ()
+        n_min = n_max = n_max + len(kw_only)
+
+    def fill(row):
+        n = len(row)
+        if not n_min <= n <= n_max:
+            takes = n_max if n_min == n_max else f"from {n_min} to {n_max}"
+            msg = f"{cls.__name__}() takes {takes} positional arguments but a row has {n} values."
+            raise TypeError(msg)
+
+        return row + tail[n - n_min :]
+
+    globs.update(
+        {
+            "_config": _config,
+            "__attr_tuple": tuple,
+            "__attr_fill": fill,
+            "__attr_new": cls.__new__,
+        }
+    )
+    plain_new = cls.__new__ is object.__new__
+    unpack = f"[{', '.join((*positional, *kw_only))}]"
+
+    def fmt_loop(emit):
+        lines = [
+            "__attr_validate = bool(__attr_validate) and _config._run_validators is True",
+            *(kwa.replace("=", " = ", 1) for kwa in kw_only_args),
+            "for __attr_row in __attr_rows:",
+            "    if __attr_row.__class__ is not tuple:",
+            "        __attr_row = __attr_tuple(__attr_row)",
+            f"    if len(__attr_row) == {n_max}:",
+            f"        {unpack} = __attr_row",
+            "    else:",
+            f"        {unpack} = __attr_fill(__attr_row)",
+        ]
+        if plain_new:
+            lines.append("    self = __attr_new(__attr_cls)")
+        else:
+            # Like type.__call__: a __new__ gets the arguments and __init__
+            # only runs for instances of the class.
+            if kw_only:
+                kws = ", ".join(f"{name}={name}" for name in kw_only)
+                new_args = f"*__attr_row[:{len(positional)}], {kws}"
+            else:
+                new_args = "*__attr_row"
+            lines += [
+                f"    self = __attr_new(__attr_cls, {new_args})",
+                "    if not isinstance(self, __attr_cls):",
+                f"        {emit}(self)",
+                "        continue",
+            ]
+        lines += [f"    {line}" for line in body]
+        lines.append(f"    {emit}(self)")
+
+        return lines
+
+    params = "__attr_cls, __attr_rows, __attr_validate"
+    lines = [
+        f"def from_rows({params}, __attr_lazy):",
+        "    if __attr_lazy:",
+        f"        return __attr_iter_rows({params})",
+        "    __attr_out = []",
+        "    __attr_append = __attr_out.append",
+        *(f"    {line}" for line in fmt_loop("__attr_append")),
+        "    return __attr_out",
+        "",
+        f"def __attr_iter_rows({params}):",
+        *(f"    {line}" for line in fmt_loop("yield ")),
+        "",
+    ]
+
+    ns = _linecache_and_compile(
+        "\n".join(lines),
+        _generate_unique_filename(cls, "from_rows"),
+        globs,
+        module=cls.__module__,
+    )
+    globs["__attr_iter_rows"] = ns["__attr_iter_rows"]
+
+    return ns["from_rows"]
+
+
+def _may_be_scalar(type_):
+    """
+    Return whether the values of a field declared as *type_* may be scalars.
+
+    Annotations aren't enforced, so this is only used to skip checking for
+    scalars where it would be a waste of time.
+    """
+    origin = getattr(type_, "__origin__", type_)
+
+    return not isinstance(origin, type) or not (
+        issubclass(origin, (tuple, list, set, frozenset, dict))
+        or getattr(origin, "__attrs_attrs__", None) is not None
+    )
+
+
+def _is_planned_filter(filter):
+    """
+    Return whether the generated serializers can apply *filter* themselves.
+
+    Such filters have a ``_plan`` method that takes an `Attribute` and
+    returns True if its values are always included, False if they're always
+    dropped, or a tuple of a set of classes and a bool that says whether
+    values of exactly those classes are included or dropped.  See
+    `attrs.filters.include`.
+    """
+    return "_plan" in type(filter).__dict__
+
+
+def _is_planned_serializer(value_serializer):
+    """
+    Return whether the generated serializers can call *value_serializer*
+    themselves.
+
+    Such value serializers have a ``_plan`` method that takes an `Attribute`
+    and returns a set of classes whose values it returns unchanged, or None.
+    The generated functions don't call it for values of exactly those
+    classes.  See `attrs.serializers.by_type`.
+    """
+    return "_plan" in type(value_serializer).__dict__
+
+
+def _fmt_serialized_values(
+    cls, recurse, retain, factory, filter, globs, value_serializer=None
+):
+    """
+    Return how the values of the fields of *cls* that *filter* doesn't
+    always drop are read from ``inst``.
+
+    Each field is a tuple of its name, the lines that read and convert its
+    value, the expression the value ends up in, and the condition that the
+    value must satisfy to be included or None.
+
+    If *value_serializer* is not None, the values are passed through it
+    unless its plan says they're returned unchanged.  If *recurse* is True,
+    values that aren't scalars are passed through ``__attr_convert``
+    together with *retain*, the variable *factory*, and the filter and the
+    value serializer if there are any.  Everything else the lines need is
+    registered in *globs*.
+    """
+    convert_args = f"{retain}, {factory}"
+    if filter is not None or value_serializer is not None:
+        globs["__attr_filter"] = filter
+        convert_args += ", __attr_filter"
+    if value_serializer is not None:
+        globs["__attr_hook"] = value_serializer
+        convert_args += ", __attr_hook"
+
+    rv = []
+    for i, a in enumerate(cls.__attrs_attrs__):
+        var = f"v{i}"
+        cond = None
+        if filter is not None:
+            plan = filter._plan(a)
+            if plan is False:
+                continue
+            if plan is not True:
+                types, included = plan
+                globs[f"__attr_types_{i}"] = types
+                op = "in" if included else "not in"
+                cond = f"{var}.__class__ {op} __attr_types_{i}"
+
+        lines = [f"{var} = inst.{a.name}"]
+        if value_serializer is not None:
+            globs[f"__attr_field_{i}"] = a
+            hook = f"{var} = __attr_hook(inst, __attr_field_{i}, {var})"
+            unchanged = value_serializer._plan(a)
+            if unchanged:
+                globs[f"__attr_unchanged_{i}"] = unchanged
+                lines.append(
+                    f"if {var}.__class__ not in __attr_unchanged_{i}:"
+                )
+                hook = f"    {hook}"
+            lines.append(hook)
+
+        if not recurse:
+            if cond is None and value_serializer is None:
+                rv.append((a.name, [], f"inst.{a.name}", None))
+            else:
+                rv.append((a.name, lines, var, cond))
+            continue
+
+        convert_call = f"__attr_convert({var}, {convert_args})"
+        if _may_be_scalar(a.type):
+            lines.append(f"if {var}.__class__ not in __attr_scalars:")
+            lines.append(f"    {var} = {convert_call}")
+        else:
+            lines.append(f"{var} = {convert_call}")
+        rv.append((a.name, lines, var, cond))
+
+    return rv
+
+
+def _fmt_store_values(fields, store):
+    """
+    Return the lines that read the values of *fields* and store them using
+    *store*, a function that takes a name and a value expression and returns
+    a line.
+
+    Lines of conditional fields are only run if the value is included,
+    except for the first one that reads it.
+    """
+    lines = []
+    for name, value_lines, value, cond in fields:
+        if cond is None:
+            lines.extend(value_lines)
+            lines.append(store(name, value))
+        else:
+            lines.append(value_lines[0])
+            lines.append(f"if {cond}:")
+            lines.extend(f"    {line}" for line in value_lines[1:])
+            lines.append(f"    {store(name, value)}")
+
+    return lines
+
+
+def _compile_serializer(cls, name, args, lines, convert, globs):
+    """
+    Compile the function *name* with *args* and the body *lines* for *cls*
+    and return it.
+    """
+    ns = _linecache_and_compile(
+        "\n".join(
+            [f"def {name}({args}):", *(f"    {line}" for line in lines)]
+        ),
+        _generate_unique_filename(cls, name),
+        {"__attr_convert": convert, "__attr_scalars": _SCALAR_TYPES, **globs},
+        module=cls.__module__,
+    )
+
+    return ns[name]
+
+
+def _make_asdict(
+    cls, recurse, retain, plain_dict, filter, value_serializer, convert
+):
+    """
+    Create the function that `attrs.asdict` uses for instances of *cls* if
+    *filter* and *value_serializer* are None or can be planned, see
+    `_is_planned_filter` and `_is_planned_serializer`.
+
+    It takes the instance and the *dict_factory*.  If *recurse* is True,
+    values that aren't scalars are passed through *convert* together with
+    *retain*, the *dict_factory*, *filter*, and *value_serializer*.  If
+    *plain_dict* is True, the dict factory is `dict` and the result is built
+    using a dict display unless some fields are only included depending on
+    their values.
+    """
+    globs = {}
+    fields = _fmt_serialized_values(
+        cls, recurse, retain, "dict_factory", filter, globs, value_serializer
+    )
+
+    if plain_dict and all(cond is None for *_, cond in fields):
+        lines = [
+            line for _, value_lines, _, _ in fields for line in value_lines
+        ]
+        lines.append(
+            "return {"
+            + ", ".join(f"{name!r}: {value}" for name, _, value, _ in fields)
+            + "}"
+        )
+    else:
+        lines = [
+            "rv = dict_factory()",
+            *_fmt_store_values(
+                fields, lambda name, value: f"rv[{name!r}] = {value}"
+            ),
+            "return rv",
+        ]
+
+    return _compile_serializer(
+        cls, "asdict", "inst, dict_factory", lines, convert, globs
+    )
+
+
+def _make_asdict_columns(
+    cls, recurse, retain, filter, value_serializer, convert
+):
+    """
+    Create the function that `attrs.asdict_many` uses for sequences of
+    instances of *cls* if it's called with *columnar*, and *filter* and
+    *value_serializer* are None or can be planned, see `_is_planned_filter`
+    and `_is_planned_serializer`.
+
+    It takes the instances and the *dict_factory* and returns a list of the
+    names of the fields and a list of columns in the same order.  Values are
+    converted like in the function of `_make_asdict`.
+
+    Returns None if some fields are only included depending on their values,
+    because the columns wouldn't line up.
+    """
+    globs = {}
+    fields = _fmt_serialized_values(
+        cls, recurse, retain, "dict_factory", filter, globs, value_serializer
+    )
+    if any(cond is not None for *_, cond in fields):
+        return None
+
+    n = len(fields)
+    body = [
+        *(line for _, value_lines, _, _ in fields for line in value_lines),
+        *(f"append{i}({f[2]})" for i, f in enumerate(fields)),
+    ]
+
+    return _compile_serializer(
+        cls,
+        "asdict_columns",
+        "insts, dict_factory",
+        [
+            *(f"c{i} = []" for i in range(n)),
+            *(f"append{i} = c{i}.append" for i in range(n)),
+            "for inst in insts:",
+            *(f"    {line}" for line in body or ["pass"]),
+            f"return {[f[0] for f in fields]!r}, "
+            f"[{', '.join(f'c{i}' for i in range(n))}]",
+        ],
+        convert,
+        globs,
+    )
+
+
+def _make_astuple(cls, recurse, retain, factory, filter, convert):
+    """
+    Create the function that `attrs.astuple` uses for instances of *cls* if
+    *filter* is None or can be planned, see `_is_planned_filter`.
+
+    It takes the instance and the *tuple_factory*.  If *recurse* is True,
+    values that aren't scalars are passed through *convert* together with
+    *retain*, the *tuple_factory*, and *filter*.  If *factory* is `tuple` or
+    `list`, the result is built using a display of it, otherwise by passing
+    a list to the tuple factory.  If some fields are only included depending
+    on their values, the list is built by appending.
+    """
+    globs = {}
+    fields = _fmt_serialized_values(
+        cls, recurse, retain, "tuple_factory", filter, globs
+    )
+
+    if all(cond is None for *_, cond in fields):
+        lines = [
+            line for _, value_lines, _, _ in fields for line in value_lines
+        ]
+        items = ", ".join(value for _, _, value, _ in fields)
+        if factory is tuple:
+            trailing = "," if len(fields) == 1 else ""
+            lines.append(f"return ({items}{trailing})")
+        elif factory is list:
+            lines.append(f"return [{items}]")
+        else:
+            lines.append(f"return tuple_factory([{items}])")
+    else:
+        lines = [
+            "rv = []",
+            *_fmt_store_values(fields, lambda _, value: f"rv.append({value})"),
+            "return rv if tuple_factory is list else tuple_factory(rv)",
+        ]
+
+    return _compile_serializer(
+        cls, "astuple", "inst, tuple_factory", lines, convert, globs
+    )
+
+
+# Origins of the generic types from_dict() builds lists, sets, and dicts for.
+_LIST_ORIGINS = (
+    list,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+)
+_SET_ORIGINS = (set, collections.abc.Set, collections.abc.MutableSet)
+_DICT_ORIGINS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+_UNION_ORIGINS = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def _fmt_structure(type_, value, new_name, globs, structurer, depth=0):
+    """
+    Return an expression that structures the expression *value* as *type_*
+    the way `attrs.from_dict` does, or None if *value* is used as it is.
+
+    Nested *attrs* classes are structured by calling the function that
+    *structurer* returns for them.  Everything the expression needs is
+    registered in *globs* under names that *new_name* returns, which it
+    never returns twice.  *depth* is the nesting depth of comprehensions, so
+    their variables don't clash.
+    """
+    if getattr(type_, "__attrs_attrs__", None) is not None:
+        name = new_name()
+        globs[name] = structurer(type_)
+        return f"{name}({value})"
+
+    origin = typing.get_origin(type_)
+    args = typing.get_args(type_)
+    if origin is None and type_ in (tuple, set, frozenset):
+        return f"{type_.__name__}({value})"
+
+    if origin is getattr(typing, "Annotated", None):
+        return _fmt_structure(
+            args[0], value, new_name, globs, structurer, depth
+        )
+
+    if origin in _UNION_ORIGINS:
+        fmt = _fmt_structure_optional
+    elif origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        fmt = _fmt_structure_tuple
+    elif origin in _DICT_ORIGINS and len(args) == 2:
+        fmt = _fmt_structure_dict
+    elif (
+        origin in _LIST_ORIGINS
+        or origin in _SET_ORIGINS
+        or origin in (frozenset, tuple)
+    ):
+        fmt = _fmt_structure_iterable
+    else:
+        return None
+
+    return fmt(origin, args, value, new_name, globs, structurer, depth)
+
+
+def _fmt_structure_optional(
+    origin, args, value, new_name, globs, structurer, depth
+):
+    """
+    Like `_fmt_structure` for ``Optional[T]``, which keeps None.  Other
+    unions are used as they are.
+    """
+    if len(args) != 2 or type(None) not in args:
+        return None
+
+    first, later = _fmt_bind(value, new_name())
+    inner = _fmt_structure(
+        args[args[0] is type(None)], later, new_name, globs, structurer, depth
+    )
+    if inner is None:
+        return None
+
+    return f"(None if {first} is None else {inner})"
+
+
+def _fmt_structure_iterable(
+    origin, args, value, new_name, globs, structurer, depth
+):
+    """
+    Like `_fmt_structure` for lists, sets, frozensets, and tuples of
+    arbitrary length.
+    """
+    elem = f"__attr_e{depth}"
+    inner = (
+        _fmt_structure(args[0], elem, new_name, globs, structurer, depth + 1)
+        if args
+        else None
+    )
+
+    if origin in _LIST_ORIGINS:
+        return None if inner is None else f"[{inner} for {elem} in {value}]"
+
+    if origin is tuple or origin is frozenset:
+        factory = origin.__name__
+    else:
+        factory = "set"
+    if inner is None:
+        return f"{factory}({value})"
+
+    return f"{factory}([{inner} for {elem} in {value}])"
+
+
+def _fmt_structure_tuple(
+    origin, args, value, new_name, globs, structurer, depth
+):
+    """
+    Like `_fmt_structure` for tuples of fixed length.
+    """
+    elem = f"__attr_e{depth}"
+    items = [
+        _fmt_structure(
+            arg, f"{elem}[{i}]", new_name, globs, structurer, depth + 1
+        )
+        for i, arg in enumerate(args)
+    ]
+    if not any(items):
+        return f"tuple({value})"
+
+    items = ", ".join(item or f"{elem}[{i}]" for i, item in enumerate(items))
+
+    return f"[({items},) for {elem} in ({value},)][0]"
+
+
+def _fmt_structure_dict(
+    origin, args, value, new_name, globs, structurer, depth
+):
+    """
+    Like `_fmt_structure` for dicts.
+    """
+    key = f"__attr_k{depth}"
+    elem = f"__attr_e{depth}"
+    key_expr = _fmt_structure(
+        args[0], key, new_name, globs, structurer, depth + 1
+    )
+    value_expr = _fmt_structure(
+        args[1], elem, new_name, globs, structurer, depth + 1
+    )
+    if key_expr is None and value_expr is None:
+        return None
+
+    return (
+        f"{{{key_expr or key}: {value_expr or elem} "
+        f"for {key}, {elem} in {value}.items()}}"
+    )
+
+
+def _make_from_dict(cls, structurer):
+    """
+    Create the function that `attrs.from_dict` uses to create instances of
+    *cls* from dicts.
+
+    Values of attributes without converters are structured according to
+    their types.  *structurer* is called with nested *attrs* classes and
+    returns the function that creates their instances.
+
+    If all keys are present, the function reads them all at once and calls
+    *cls* with them, otherwise it collects the keys that are present and
+    passes them on as keyword arguments.
+    """
+    globs = {"__attr_cls": cls}
+    counter = itertools.count()
+
+    def new_name():
+        return f"__attr_structure_{next(counter)}"
+
+    names = []
+    values = []
+    for a in cls.__attrs_attrs__:
+        if not a.init:
+            continue
+
+        var = f"v{len(names)}"
+        value = var
+        if a.converter is None:
+            value = (
+                _fmt_structure(a.type, var, new_name, globs, structurer) or var
+            )
+        names.append((a.name, a.alias))
+        values.append((var, value))
+
+    lines = ["def from_dict(data):"]
+    if names:
+        lines.append("    try:")
+        lines.extend(
+            f"        {var} = data[{name!r}]"
+            for (name, _), (var, _) in zip(names, values)
+        )
+        lines.append("    except KeyError:")
+        lines.append("        return __attr_from_partial_dict(data)")
+    # Positional arguments are cheaper, but only attrs knows their order.
+    positional = _init_args_of(cls) is not None
+    kw_only = {a.alias for a in cls.__attrs_attrs__ if a.kw_only}
+    args = [
+        value
+        for (_, alias), (_, value) in zip(names, values)
+        if positional and alias not in kw_only
+    ]
+    args.extend(
+        f"{alias}={value}"
+        for (_, alias), (_, value) in zip(names, values)
+        if not positional or alias in kw_only
+    )
+    lines.append(f"    return __attr_cls({', '.join(args)})")
+    lines.append("")
+    lines.append("def __attr_from_partial_dict(data):")
+    lines.append("    kw = {}")
+    for (name, alias), (var, value) in zip(names, values):
+        lines.append(f"    if {name!r} in data:")
+        lines.append(f"        {var} = data[{name!r}]")
+        lines.append(f"        kw[{alias!r}] = {value}")
+    lines.append("    return __attr_cls(**kw)")
+
+    ns = _linecache_and_compile(
+        "\n".join(lines),
+        _generate_unique_filename(cls, "from_dict"),
+        globs,
+        module=cls.__module__,
+    )
+    globs["__attr_from_partial_dict"] = ns["__attr_from_partial_dict"]
+
+    return ns["from_dict"]
+
+
+def _slot_setter(cls, name):
+    """
+    Return the ``__set__`` of the member descriptor of the slot *name* of
+    *cls* or None if *name* isn't a slot.
+
+    Calling it is the cheapest way to bypass a __setattr__ of *cls*.
+    """
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            if type(base.__dict__[name]) is types.MemberDescriptorType:
+                return base.__dict__[name].__set__
+            break
+
+    return None
+
+
+def _fmt_trusted_setter(cls, name, value, globs):
+    """
+    Return a statement that sets the attribute *name* of ``self`` to *value*
+    bypassing any __setattr__ of *cls*.
+
+    Classes without their own __setattr__ use normal assignment, slots are
+    set through their member descriptors, and everything else is written
+    into ``_inst_dict``.
+    """
+    if cls.__setattr__ is _OBJ_SETATTR:
+        return f"self.{name} = {value}"
+
+    setter = _slot_setter(cls, name)
+    if setter is not None:
+        globs[f"__attr_set_{name}"] = setter
+        return f"__attr_set_{name}(self, {value})"
+
+    return f"_inst_dict['{name}'] = {value}"
+
+
+def _make_trusted(cls, post_init):
+    """
+    Create the trusted constructor of *cls* for `attrs.trusted`.
+
+    It takes the same arguments as __init__ but creates the instance itself
+    and assigns the arguments without running converters, validators,
+    on_setattr hooks, or __attrs_pre_init__.  It only calls
+    __attrs_post_init__ if *post_init* is true.
+    """
+    init_args = _init_args_of(cls)
+    if init_args is None:
+        cache_hash = is_exc = False
+    else:
+        cache_hash, is_exc = init_args[6], init_args[8]
+
+    attrs = [a for a in fields(cls) if a.init or a.default is not NOTHING]
+    globs = {
+        "NOTHING": NOTHING,
+        "attr_dict": {a.name: a for a in attrs},
+        "__attr_cls": cls,
+    }
+    args = []
+    kw_only_args = []
+    annotations = {}
+    lines = []
+
+    for a in attrs:
+        arg_name = a.alias
+        has_factory = isinstance(a.default, Factory)
+        if has_factory:
+            factory_name = _INIT_FACTORY_PAT % (a.name,)
+            globs[factory_name] = a.default.factory
+            value = (
+                f"{factory_name}(self)"
+                if a.default.takes_self
+                else f"{factory_name}()"
+            )
+        else:
+            value = f"attr_dict['{a.name}'].default"
+
+        if not a.init:
+            lines.append(_fmt_trusted_setter(cls, a.name, value, globs))
+            continue
+
+        if a.type is not None:
+            annotations[arg_name] = a.type
+
+        if has_factory:
+            arg = f"{arg_name}=NOTHING"
+            lines.append(f"if {arg_name} is NOTHING:")
+            lines.append(f"    {arg_name} = {value}")
+        elif a.default is not NOTHING:
+            arg = f"{arg_name}={value}"
+        else:
+            arg = arg_name
+        (kw_only_args if a.kw_only else args).append(arg)
+        lines.append(_fmt_trusted_setter(cls, a.name, arg_name, globs))
+
+    if cache_hash:
+        lines.append(
+            _fmt_trusted_setter(cls, _HASH_CACHE_FIELD, "None", globs)
+        )
+
+    if is_exc:
+        vals = ",".join(f"self.{a.name}" for a in attrs if a.init)
+        lines.append(f"BaseException.__init__(self, {vals})")
+
+    if post_init:
+        lines.append("self.__attrs_post_init__()")
+
+    if any(line.startswith("_inst_dict") for line in lines):
+        lines.insert(0, "_inst_dict = self.__dict__")
+    lines.insert(0, "self = __attr_cls.__new__(__attr_cls)")
+    lines.append("return self")
+
+    if kw_only_args:
+        args.append("*")
+        args.extend(kw_only_args)
+    args = ", ".join(args)
+    body = "\n    ".join(lines)
+
+    ns = _linecache_and_compile(
+        f"def trusted({args}):\n    {body}\n",
+        _generate_unique_filename(cls, "trusted"),
+        globs,
+        module=cls.__module__,
+    )
+    ctor = ns["trusted"]
+    ctor.__annotations__ = annotations
+
+    return ctor
+
+
+def _module_globals(cls):
+    """
+    Return the namespace of the module *cls* is defined in.
+
+    Used as the globals of generated methods.  This makes
+    typing.get_type_hints(CLS.__init__) resolve string types.  It's the
+    module's own dict, so it must not be written to.
+    """
+    mod = sys.modules.get(cls.__module__)
+
+    return {} if mod is None else mod.__dict__
+
+
+def _make_init(
+    cls,
+    attrs,
+    pre_init,
+    pre_init_has_args,
+    post_init,
+    frozen,
+    slots,
+    cache_hash,
+    base_attr_map,
+    is_exc,
+    cls_on_setattr,
+    attrs_init,
+):
+    script, globs, annotations = _make_init_script(
+        attrs,
+        pre_init,
+        pre_init_has_args,
+        post_init,
+        frozen,
+        slots,
+        cache_hash,
+        base_attr_map,
+        is_exc,
+        cls_on_setattr,
+        attrs_init,
+    )
+    globs = {**_module_globals(cls), **globs}
+
+    init = _make_method(
+        "__attrs_init__" if attrs_init else "__init__",
+        script,
+        _generate_unique_filename(cls, "init"),
+        globs,
+        module=cls.__module__,
+    )
+    init.__annotations__ = annotations
+
+    return init
+
+
+def _fmt_helper_name(name: str, suffix: str) -> str:
+    """
+    Return the name of the global or local variable *suffix* that the code
+    generated for the global *name* needs.
+
+    The names of the globals of fields start with ``__attr_`` and contain the
+    field's name, so appending *suffix* to *name* could produce the name of
+    another field's global, e.g. for fields ``x`` and ``x_type``.  Helper
+    names start with ``__attrs_`` followed by the length of *name* instead,
+    so they're neither the name of a field's global nor of a helper of
+    another name.
+    """
+    return f"__attrs_{len(name)}_{name}_{suffix}"
+
+
+def _fmt_validator_call(
+    validator, name: str, value_var: str, attr_var: str, globs: dict
+) -> list[str]:
+    """
+    Return the lines that run *validator* on *value_var* in a generated
+    method that has ``self`` and the `Attribute` *attr_var* in scope.
+
+    *validator* is registered in *globs* under *name* and everything else the
+    lines need under names from `_fmt_helper_name`.
+
+    Built-in validators whose class defines ``_fmt_inline`` are inlined to
+    save a call per validator.  Only if the value turns out to be invalid,
+    they're called to raise the very same error.  Subclasses don't inherit
+    this since they may change ``__call__``.
+    """
+    globs[name] = validator
+
+    fmt_inline = type(validator).__dict__.get("_fmt_inline")
+    if fmt_inline is not None:
+        lines = fmt_inline(validator, name, value_var, attr_var, globs)
+        if lines is not None:
+            return lines
+
+    return [f"{name}(self, {attr_var}, {value_var})"]
+
+
+# dtype.kind of a NumPy array -> type of the elements of ``arr.tolist()``.
+_ARRAY_KINDS = {
+    "b": bool,
+    "i": int,
+    "u": int,
+    "f": float,
+    "c": complex,
+    "U": str,
+    "S": bytes,
+}
+
+
+def _check_array(validator, arr):
+    """
+    Check all elements of the NumPy array *arr* against *validator* at once.
+
+    Return True if all of them -- after converting them to Python objects
+    using ``arr.tolist()`` -- pass, False if any of them doesn't, and None if
+    *validator* can't be checked this way.
+
+    Like with ``_fmt_inline``, only built-in validators whose class defines
+    ``_check_array`` qualify.
+    """
+    check = type(validator).__dict__.get("_check_array")
+    if check is None:
+        return None
+
+    return check(validator, arr)
+
+
+def _fmt_bind(value_var: str, tmp: str) -> tuple[str, str]:
+    """
+    Return how to refer to the expression *value_var* the first time and
+    every time after that, such that it's evaluated only once.
+
+    Unless *value_var* is just a name, the first use binds it to *tmp*.
+    """
+    if value_var.isidentifier():
+        return value_var, value_var
+
+    return f"({tmp} := {value_var})", tmp
+
+
+def _fmt_converter_expr(
+    converter, name: str, value_var: str, field_var: str, globs: dict
+) -> str:
+    """
+    Return an expression that runs *converter* -- a `Converter` or a plain
+    callable -- on the expression *value_var* in a generated method that has
+    ``self`` and the `Attribute` *field_var* in scope.
+
+    The wrapped callable is registered in *globs* under *name* and everything
+    else the expression needs under names from `_fmt_helper_name`.
+
+    Built-in converters are functions that carry a ``_fmt_inline`` formatter
+    with the same signature as this function and are inlined to save the
+    calls through them.  Functions that wrap them using `functools.wraps`
+    copy the attribute, so they're recognized by ``__wrapped__`` and called.
+    """
+    if isinstance(converter, Converter):
+        conv = converter.converter
+        args = ", self" if converter.takes_self else ""
+        if converter.takes_field:
+            args += f", {field_var}"
+    else:
+        conv = converter
+        args = ""
+
+    globs[name] = conv
+
+    if type(conv) is types.FunctionType and "__wrapped__" not in conv.__dict__:
+        fmt_inline = conv.__dict__.get("_fmt_inline")
+        if fmt_inline is not None:
+            return fmt_inline(name, value_var, field_var, globs)
+
+    return f"{name}({value_var}{args})"
+
+
+def _make_on_setattr_script(sa_attrs):
+    """
+    Return a script of on_setattr hooks with inlined converters and
+    validators that replace `setters.convert`, `setters.validate`, and the
+    default on_setattr hooks in *sa_attrs*, and a dict of globals.  If there's
+    nothing to replace, the script is empty.
+    """
+    lines = []
+    globs = {"_config": _config}
+    for name, (a, hook) in sa_attrs.items():
+        convert = (
+            hook in (setters.convert, _DEFAULT_ON_SETATTR)
+            and a.converter is not None
+        )
+        validate = (
+            hook in (setters.validate, _DEFAULT_ON_SETATTR)
+            and a.validator is not None
+        )
+        if not (convert or validate):
+            continue
+
+        lines.append(f"def __attr_on_setattr_{name}(self, attrib, val):")
+        if convert:
+            expr = _fmt_converter_expr(
+                a.converter, f"__attr_converter_{name}", "val", "attrib", globs
+            )
+            lines.append(f"    val = {expr}")
+        if validate:
+            lines.append("    if _config._run_validators is True:")
+            lines.extend(
+                f"        {line}"
+                for line in _fmt_validator_call(
+                    a.validator,
+                    f"__attr_validator_{name}",
+                    "val",
+                    "attrib",
+                    globs,
+                )
+            )
+        lines.append("    return val")
+        lines.append("")
+
+    return "\n".join(lines), globs
+
+
+def _setattr(attr_name: str, value_var: str, has_on_setattr: bool) -> str:
     """
     Use the cached object.setattr to set *attr_name* to *value_var*.
     """
@@ -1859,13 +3241,17 @@ def _setattr(attr_name: str, value_var: str, has_on_setattr: bool) -> str:
 
 
 def _setattr_with_converter(
-    attr_name: str, value_var: str, has_on_setattr: bool, converter: Converter
+    attr_name: str,
+    value_var: str,
+    has_on_setattr: bool,
+    converter: Converter,
+    globs: dict,
 ) -> str:
     """
     Use the cached object.setattr to set *attr_name* to *value_var*, but run
     its converter first.
     """
-    return f"_setattr('{attr_name}', {converter._fmt_converter_call(attr_name, value_var)})"
+    return f"_setattr('{attr_name}', {converter._fmt_converter_call(attr_name, value_var, globs)})"
 
 
 def _assign(attr_name: str, value: str, has_on_setattr: bool) -> str:
@@ -1880,16 +3266,22 @@ def _assign(attr_name: str, value: str, has_on_setattr: bool) -> str:
 
 
 def _assign_with_converter(
-    attr_name: str, value_var: str, has_on_setattr: bool, converter: Converter
+    attr_name: str,
+    value_var: str,
+    has_on_setattr: bool,
+    converter: Converter,
+    globs: dict,
 ) -> str:
     """
     Unless *attr_name* has an on_setattr hook, use normal assignment after
     conversion. Otherwise relegate to _setattr_with_converter.
     """
     if has_on_setattr:
-        return _setattr_with_converter(attr_name, value_var, True, converter)
+        return _setattr_with_converter(
+            attr_name, value_var, True, converter, globs
+        )
 
-    return f"self.{attr_name} = {converter._fmt_converter_call(attr_name, value_var)}"
+    return f"self.{attr_name} = {converter._fmt_converter_call(attr_name, value_var, globs)}"
 
 
 def _determine_setters(
@@ -1921,13 +3313,14 @@ def _determine_setters(
             value_var: str,
             has_on_setattr: bool,
             converter: Converter,
+            globs: dict,
         ) -> str:
             if has_on_setattr or _is_slot_attr(attr_name, base_attr_map):
                 return _setattr_with_converter(
-                    attr_name, value_var, has_on_setattr, converter
+                    attr_name, value_var, has_on_setattr, converter, globs
                 )
 
-            return f"_inst_dict['{attr_name}'] = {converter._fmt_converter_call(attr_name, value_var)}"
+            return f"_inst_dict['{attr_name}'] = {converter._fmt_converter_call(attr_name, value_var, globs)}"
 
         return (
             ("_inst_dict = self.__dict__",),
@@ -1939,7 +3332,7 @@ def _determine_setters(
     return (), _assign, _assign_with_converter
 
 
-def _attrs_to_init_script(
+def _attrs_to_init_lines(
     attrs: list[Attribute],
     is_frozen: bool,
     is_slotted: bool,
@@ -1951,13 +3344,15 @@ def _attrs_to_init_script(
     is_exc: bool,
     needs_cached_setattr: bool,
     has_cls_on_setattr: bool,
-    method_name: str,
-) -> tuple[str, dict, dict]:
+    run_validators: str,
+) -> tuple[list[str], list[str], list[str], dict, dict]:
     """
-    Return a script of an initializer for *attrs*, a dict of globals, and
-    annotations for the initializer.
+    Return the body lines of an initializer for *attrs*, its positional and
+    keyword-only parameters, a dict of globals, and annotations for the
+    initializer.
 
-    The globals are required by the generated script.
+    Validators run if the expression *run_validators* is True.  The globals
+    are required by the generated lines.
     """
     lines = ["self.__attrs_pre_init__()"] if call_pre_init else []
 
@@ -2013,11 +3408,9 @@ def _attrs_to_init_script(
                             init_factory_name + f"({maybe_self})",
                             has_on_setattr,
                             converter,
+                            names_for_globals,
                         )
                     )
-                    names_for_globals[converter._get_global_name(a.name)] = (
-                        converter.converter
-                    )
                 else:
                     lines.append(
                         fmt_setter(
@@ -2034,11 +3427,9 @@ def _attrs_to_init_script(
                         f"attr_dict['{attr_name}'].default",
                         has_on_setattr,
                         converter,
+                        names_for_globals,
                     )
                 )
-                names_for_globals[converter._get_global_name(a.name)] = (
-                    converter.converter
-                )
             else:
                 lines.append(
                     fmt_setter(
@@ -2057,12 +3448,13 @@ def _attrs_to_init_script(
             if converter is not None:
                 lines.append(
                     fmt_setter_with_converter(
-                        attr_name, arg_name, has_on_setattr, converter
+                        attr_name,
+                        arg_name,
+                        has_on_setattr,
+                        converter,
+                        names_for_globals,
                     )
                 )
-                names_for_globals[converter._get_global_name(a.name)] = (
-                    converter.converter
-                )
             else:
                 lines.append(fmt_setter(attr_name, arg_name, has_on_setattr))
 
@@ -2079,7 +3471,11 @@ def _attrs_to_init_script(
                 lines.append(
                     "    "
                     + fmt_setter_with_converter(
-                        attr_name, arg_name, has_on_setattr, converter
+                        attr_name,
+                        arg_name,
+                        has_on_setattr,
+                        converter,
+                        names_for_globals,
                     )
                 )
                 lines.append("else:")
@@ -2090,11 +3486,9 @@ def _attrs_to_init_script(
                         init_factory_name + "(" + maybe_self + ")",
                         has_on_setattr,
                         converter,
+                        names_for_globals,
                     )
                 )
-                names_for_globals[converter._get_global_name(a.name)] = (
-                    converter.converter
-                )
             else:
                 lines.append(
                     "    " + fmt_setter(attr_name, arg_name, has_on_setattr)
@@ -2118,12 +3512,13 @@ def _attrs_to_init_script(
             if converter is not None:
                 lines.append(
                     fmt_setter_with_converter(
-                        attr_name, arg_name, has_on_setattr, converter
+                        attr_name,
+                        arg_name,
+                        has_on_setattr,
+                        converter,
+                        names_for_globals,
                     )
                 )
-                names_for_globals[converter._get_global_name(a.name)] = (
-                    converter.converter
-                )
             else:
                 lines.append(fmt_setter(attr_name, arg_name, has_on_setattr))
 
@@ -2136,12 +3531,20 @@ def _attrs_to_init_script(
 
     if attrs_to_validate:  # we can skip this if there are no validators.
         names_for_globals["_config"] = _config
-        lines.append("if _config._run_validators is True:")
+        lines.append(f"if {run_validators} is True:")
         for a in attrs_to_validate:
             val_name = "__attr_validator_" + a.name
             attr_name = "__attr_" + a.name
-            lines.append(f"    {val_name}(self, {attr_name}, self.{a.name})")
-            names_for_globals[val_name] = a.validator
+            lines.extend(
+                f"    {line}"
+                for line in _fmt_validator_call(
+                    a.validator,
+                    val_name,
+                    f"self.{a.name}",
+                    attr_name,
+                    names_for_globals,
+                )
+            )
             names_for_globals[attr_name] = a
 
     if call_post_init:
@@ -2169,34 +3572,41 @@ def _attrs_to_init_script(
 
         lines.append(f"BaseException.__init__(self, {vals})")
 
-    args = ", ".join(args)
-    pre_init_args = args
-    if kw_only_args:
-        # leading comma & kw_only args
-        args += f"{', ' if args else ''}*, {', '.join(kw_only_args)}"
-        pre_init_kw_only_args = ", ".join(
-            [
+    if call_pre_init and pre_init_has_args:
+        # If pre init method has arguments, pass same arguments as `__init__`.
+        pre_init_args = [
+            *args,
+            *(
                 f"{kw_arg_name}={kw_arg_name}"
                 # We need to remove the defaults from the kw_only_args.
                 for kw_arg_name in (kwa.split("=")[0] for kwa in kw_only_args)
-            ]
-        )
-        pre_init_args += ", " if pre_init_args else ""
-        pre_init_args += pre_init_kw_only_args
+            ),
+        ]
+        lines[0] = f"self.__attrs_pre_init__({', '.join(pre_init_args)})"
+
+    return lines, args, kw_only_args, names_for_globals, annotations
 
-    if call_pre_init and pre_init_has_args:
-        # If pre init method has arguments, pass same arguments as `__init__`.
-        lines[0] = f"self.__attrs_pre_init__({pre_init_args})"
+
+def _fmt_init_script(
+    method_name: str,
+    lines: list[str],
+    args: list[str],
+    kw_only_args: list[str],
+) -> str:
+    """
+    Return the script of an initializer called *method_name* with the body
+    *lines* and the parameters *args* and *kw_only_args*.
+    """
+    params = ", ".join(args)
+    if kw_only_args:
+        # leading comma & kw_only args
+        params += f"{', ' if params else ''}*, {', '.join(kw_only_args)}"
 
     # Python <3.12 doesn't allow backslashes in f-strings.
     NL = "\n    "
-    return (
-        f"""def {method_name}(self, {args}):
-    {NL.join(lines) if lines else 'pass'}
-""",
-        names_for_globals,
-        annotations,
-    )
+    return f"""def {method_name}(self, {params}):
+    {NL.join(lines) if lines else "pass"}
+"""
 
 
 def _default_init_alias_for(name: str) -> str:
@@ -2366,6 +3776,19 @@ class Attribute:
 
         return new
 
+    def __copy__(self):
+        """
+        Copy the slots directly instead of going through the pickle protocol,
+        which is a lot faster and matters when classes inherit many
+        attributes.  The read-only metadata can be shared.
+        """
+        new = self.__class__.__new__(self.__class__)
+        bound_setattr = _OBJ_SETATTR.__get__(new)
+        for name in self.__slots__:
+            bound_setattr(name, getattr(self, name))
+
+        return new
+
     # Don't use _add_pickle since fields(Attribute) doesn't work
     def __getstate__(self):
         """
@@ -2692,22 +4115,23 @@ class Converter:
         """
         return f"__attr_converter_{attr_name}"
 
-    def _fmt_converter_call(self, attr_name: str, value_var: str) -> str:
+    def _fmt_converter_call(
+        self, attr_name: str, value_var: str, globs: dict
+    ) -> str:
         """
         Return a string that calls the converter for an attribute name
         *attr_name* and the value in variable named *value_var* according to
         `self.takes_self` and `self.takes_field`.
-        """
-        if not (self.takes_self or self.takes_field):
-            return f"{self._get_global_name(attr_name)}({value_var})"
-
-        if self.takes_self and self.takes_field:
-            return f"{self._get_global_name(attr_name)}({value_var}, self, attr_dict['{attr_name}'])"
-
-        if self.takes_self:
-            return f"{self._get_global_name(attr_name)}({value_var}, self)"
 
-        return f"{self._get_global_name(attr_name)}({value_var}, attr_dict['{attr_name}'])"
+        The converter and everything the call needs are registered in *globs*.
+        """
+        return _fmt_converter_expr(
+            self,
+            self._get_global_name(attr_name),
+            value_var,
+            f"attr_dict['{attr_name}']",
+            globs,
+        )
 
     def __getstate__(self):
         """
@@ -2845,6 +4269,35 @@ class _AndValidator:
         for v in self._validators:
             v(inst, attr, value)
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        """
+        Inline all validators one after another.
+        """
+        lines = []
+        for i, v in enumerate(self._validators):
+            lines.extend(
+                _fmt_validator_call(
+                    v,
+                    _fmt_helper_name(name, str(i)),
+                    value_var,
+                    attr_var,
+                    globs,
+                )
+            )
+
+        return lines or None
+
+    def _check_array(self, arr):
+        ok = True
+        for v in self._validators:
+            res = _check_array(v, arr)
+            if res is False:
+                return False
+            if res is None:
+                ok = None
+
+        return ok
+
 
 def and_(*validators):
     """
@@ -2890,6 +4343,16 @@ def pipe(*converters):
 
         return val
 
+    def fmt_inline(name, value_var, field_var, globs):
+        for i, c in enumerate(converters):
+            value_var = _fmt_converter_expr(
+                c, _fmt_helper_name(name, str(i)), value_var, field_var, globs
+            )
+
+        return value_var
+
+    pipe_converter._fmt_inline = fmt_inline
+
     if not converters:
         # 如果转换器列表为空，pipe_converter 是恒等函数。
         A = typing.TypeVar("A")
@@ -10,6 +10,7 @@ from functools import partial
 
 from . import setters
 from ._funcs import asdict as _asdict
+from ._funcs import asdict_many as _asdict_many
 from ._funcs import astuple as _astuple
 from ._make import (
     _DEFAULT_ON_SETATTR,
@@ -44,6 +45,7 @@ def define(
     on_setattr=None,
     field_transformer=None,
     match_args=True,
+    lazy_methods=None,
 ):
     r"""
     一个类装饰器, 它根据使用 :doc:`类型注释 <types>` 、`field()` 调用或 *these* 参数指定的 :term:`fields(字段) <field>` , 添加 :term:`双下划线方法 <dunder methods>` 。
@@ -156,6 +158,9 @@ def define(
         match_args (bool):
             如果为 True(默认), 则在类上设置 ``__match_args__`` 以支持 :pep:`634` (*结构模式匹配*)。它是一个元组, 包含所有非关键字参数的 ``__init__`` 参数名, 仅在 Python 3.10 及更高版本中可用。在较旧的 Python 版本中被忽略。
 
+        lazy_methods (bool | None):
+            如果为 True, 则 ``__repr__``、``__hash__`` 和排序方法不会在创建类时生成, 而是在第一次访问时生成。这使得类的创建更快, 而之后的调用没有任何额外开销。如果为 None(默认), 则使用 `attrs.codegen.set_lazy_methods` 设置的全局值。
+
         collect_by_mro (bool):
             如果为 True, *attrs* 将根据 `方法解析顺序
             <https://docs.python.org/3/howto/mro.html>`_ 正确收集基类的属性。如果为 False, *attrs* 将模仿(错误的) `dataclasses` 和 :pep:`681` 的行为。
@@ -204,6 +209,7 @@ def define(
     .. versionadded:: 24.1.0  
         如果一个类有一个 *继承的* 类方法 ``__attrs_init_subclass__``, 它将在类创建后执行。  
     .. deprecated:: 24.1.0 *hash* 已被弃用, 取而代之的是 *unsafe_hash*。
+    .. versionadded:: 24.3.0 *lazy_methods*
 
     .. note::
 
@@ -248,6 +254,7 @@ def define(
             on_setattr=on_setattr,
             field_transformer=field_transformer,
             match_args=match_args,
+            lazy_methods=lazy_methods,
         )
 
     def wrap(cls):
@@ -445,6 +452,29 @@ def asdict(inst, *, recurse=True, filter=None, value_serializer=None):
     )
 
 
+def asdict_many(
+    instances,
+    *,
+    recurse=True,
+    filter=None,
+    value_serializer=None,
+    columnar=False,
+):
+    """
+    与 `attr.asdict_many` 相同, 但集合类型始终被保留, 并且字典(dict)始终使用 *dict_factory*。
+
+    .. versionadded:: 24.3.0
+    """
+    return _asdict_many(
+        instances,
+        recurse=recurse,
+        filter=filter,
+        value_serializer=value_serializer,
+        retain_collection_types=True,
+        columnar=columnar,
+    )
+
+
 def astuple(inst, *, recurse=True, filter=None):
     """
     与 `attr.asdict` 相同, 但集合类型始终被保留, 并且元素(`tuple`)始终使用 *tuple_factory*。
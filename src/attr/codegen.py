@@ -0,0 +1,688 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+"""
+Control how *attrs* compiles the methods it generates.
+"""
+
+import contextlib
+import linecache
+import marshal
+import os
+import sys
+
+from pathlib import Path
+from typing import NamedTuple
+
+
+__all__ = [
+    "BytecodeCacheInfo",
+    "TemplateCacheInfo",
+    "bytecode_cache_info",
+    "clear_template_cache",
+    "disable_bytecode_cache",
+    "disable_precompiled",
+    "enable_bytecode_cache",
+    "enable_precompiled",
+    "get_lazy_methods",
+    "get_linecache_mode",
+    "invalidate_bytecode_cache",
+    "set_lazy_methods",
+    "set_linecache_mode",
+    "template_cache_info",
+]
+
+
+class BytecodeCacheInfo(NamedTuple):
+    """
+    字节码缓存的统计信息。
+
+    .. versionadded:: 24.3.0
+    """
+
+    hits: int
+    misses: int
+
+
+class TemplateCacheInfo(NamedTuple):
+    """
+    模板缓存的统计信息。
+
+    .. versionadded:: 24.3.0
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_ratio(self):
+        """
+        命中次数占所有查找次数的比例；如果还没有查找，则为 0.0。
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# The active on-disk cache or None if it's disabled.
+_bytecode_cache = None
+
+_CACHE_SUFFIX = ".attrs"
+
+# Name of the companion modules written by ``python -m attr.compile``.
+_PRECOMPILED_MODULE = "_attrs_generated"
+
+_use_precompiled = False
+
+# Module name -> tuple of script tables of all companion modules in its
+# package hierarchy.
+_precompiled_tables = {}
+
+# If not None, (module, filename, script) tuples of all generated scripts are
+# appended to it.  Used by ``python -m attr.compile``.
+_captured_scripts = None
+
+# Default for classes that don't pass *lazy_methods*.
+_lazy_methods = False
+
+_LINECACHE_MODES = ("eager", "shared", "off")
+
+_linecache_mode = "eager"
+
+# Script -> the filename and the linecache entry that all identical scripts
+# are registered under if the mode is "shared".  Bounded like the template
+# cache.
+_shared_entries = {}
+_SHARED_ENTRIES_MAXSIZE = 1024
+
+# Base filename -> the next suffix to try once the filename is taken by a
+# different script.  Bounded, since forgetting a base only costs retries.
+_next_suffix = {}
+_NEXT_SUFFIX_MAXSIZE = 1024
+
+
+class _TemplateCache:
+    """
+    Share code objects between classes whose generated scripts are identical.
+
+    Per-class objects only ever enter the scripts through their globals, so
+    classes of the same shape -- same field names, same kinds of defaults,
+    validators, and converters -- produce the same script text.  Entries are
+    evicted first-in, first-out once there are *maxsize* of them.  A
+    *maxsize* of 0 disables the cache.
+    """
+
+    __slots__ = ("_codes", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._codes = {}
+
+    def get(self, script, filename):
+        code = self._codes.get(script)
+        if code is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if code.co_filename != filename:
+            code = _replace_filename(code, filename)
+
+        return code
+
+    def put(self, script, code):
+        codes = self._codes
+        if len(codes) >= self.maxsize:
+            if not codes:
+                return
+            del codes[next(iter(codes))]
+
+        codes[script] = code
+
+
+_template_cache = _TemplateCache(1024)
+
+
+class _BytecodeCache:
+    """
+    Store marshalled code objects of generated scripts on disk.
+
+    There is one file per module holding a table of script hashes to code
+    objects.  Tables are loaded lazily on first use and written back when the
+    cache is disabled or the interpreter exits.
+    """
+
+    __slots__ = ("_dirty", "_paths", "_tables", "directory", "hits", "misses")
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._tables = {}
+        self._paths = {}
+        self._dirty = set()
+
+    def _path_for(self, module):
+        """
+        Return the path of the cache file for *module* or None if there's
+        nowhere to put it.
+        """
+        try:
+            return self._paths[module]
+        except KeyError:
+            pass
+
+        path = None
+        if self.directory is not None:
+            path = self.directory / (
+                f"{module}.{sys.implementation.cache_tag}{_CACHE_SUFFIX}"
+            )
+        else:
+            mod_file = getattr(sys.modules.get(module), "__file__", None)
+            if mod_file is not None:
+                import importlib.util
+
+                try:
+                    pyc = importlib.util.cache_from_source(mod_file)
+                except NotImplementedError:
+                    pyc = None
+                if pyc is not None:
+                    path = Path(pyc).with_suffix(_CACHE_SUFFIX)
+
+        self._paths[module] = path
+
+        return path
+
+    def _table_for(self, path):
+        table = self._tables.get(path)
+        if table is None:
+            table = self._tables[path] = _read_table(path)
+
+        return table
+
+    def get(self, key, module):
+        path = self._path_for(module)
+        if path is None:
+            return None
+
+        return self._table_for(path).get(key)
+
+    def put(self, key, module, code):
+        path = self._path_for(module)
+        if path is None:
+            return
+
+        self._table_for(path)[key] = code
+        self._dirty.add(path)
+
+    def flush(self):
+        """
+        Write all tables with new entries back to disk.
+        """
+        for path in self._dirty:
+            # Another process might have written entries in the meantime.
+            table = _read_table(path)
+            table.update(self._tables[path])
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(_magic_number() + marshal.dumps(table))
+                tmp.replace(path)
+            except OSError:
+                # A cache that can't be written is merely a slow cache.
+                with contextlib.suppress(OSError):
+                    tmp.unlink()
+
+        self._dirty.clear()
+
+    def invalidate(self):
+        """
+        Delete all cache files known to this cache and forget their contents.
+        """
+        paths = set(self._tables) | {
+            p for p in self._paths.values() if p is not None
+        }
+        if self.directory is not None:
+            with contextlib.suppress(OSError):
+                paths.update(
+                    path
+                    for path in self.directory.iterdir()
+                    if path.name.endswith(_CACHE_SUFFIX)
+                )
+
+        for path in paths:
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+        self._tables.clear()
+        self._dirty.clear()
+
+
+def _register_source(script, filename):
+    """
+    Register *script* with linecache so debuggers and tracebacks can show it.
+
+    If *filename* is already taken by a different script, a ``-N`` suffix is
+    added.  In "shared" mode, a script that is already registered isn't
+    registered again but keeps the filename of its first registration.
+    Return the filename the script has been registered under.
+    """
+    mode = _linecache_mode
+    if mode == "off":
+        return filename
+
+    if mode == "shared":
+        shared = _shared_entries.get(script)
+        if shared is not None and linecache.cache.get(shared[0]) is shared[1]:
+            return shared[0]
+
+    base = filename
+    lines = script.splitlines(True)
+    count = _next_suffix.get(base, 1)
+    while True:
+        new = (len(script), None, lines, filename)
+        entry = linecache.cache.setdefault(filename, new)
+        if entry == new:
+            break
+
+        filename = f"{base[:-1]}-{count}>"
+        count += 1
+
+    if filename != base:
+        _next_suffix.pop(base, None)
+        if len(_next_suffix) >= _NEXT_SUFFIX_MAXSIZE:
+            del _next_suffix[next(iter(_next_suffix))]
+        _next_suffix[base] = count
+
+    if mode == "shared":
+        _shared_entries.pop(script, None)
+        if len(_shared_entries) >= _SHARED_ENTRIES_MAXSIZE:
+            del _shared_entries[next(iter(_shared_entries))]
+        _shared_entries[script] = (filename, entry)
+
+    return filename
+
+
+def _magic_number():
+    import importlib.util
+
+    return importlib.util.MAGIC_NUMBER
+
+
+def _read_table(path):
+    """
+    Read the table stored at *path*.  Return an empty one if it doesn't exist,
+    is corrupt, or has been written by a different Python version.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return {}
+
+    magic = _magic_number()
+    if not data.startswith(magic):
+        return {}
+
+    try:
+        # Private cache, keyed by the interpreter magic and the script hashes.
+        table = marshal.loads(data[len(magic) :])  # noqa: S302
+    except (EOFError, ValueError, TypeError):
+        return {}
+
+    return table if isinstance(table, dict) else {}
+
+
+def _script_key(script):
+    """
+    Return the cache key for *script*.
+    """
+    import hashlib
+
+    return hashlib.sha256(script.encode()).hexdigest()
+
+
+def _replace_filename(code, filename):
+    """
+    Return a copy of *code* and all code objects nested within it whose
+    ``co_filename`` is *filename*.
+    """
+    consts = tuple(
+        (
+            _replace_filename(const, filename)
+            if isinstance(const, type(code))
+            else const
+        )
+        for const in code.co_consts
+    )
+
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def _compile(script, filename, module=None):
+    """
+    Compile *script* into a code object for exec'ing.
+
+    *module* is the name of the module the script is generated for.  It
+    determines where the script ends up in the bytecode cache.  Scripts
+    without a module are never cached.
+    """
+    code = _template_cache.get(script, filename)
+    if code is not None:
+        return code
+
+    cache = _bytecode_cache
+    if cache is None or module is None:
+        code = compile(script, filename, "exec")
+    else:
+        key = _script_key(script)
+        code = cache.get(key, module)
+        if code is not None:
+            cache.hits += 1
+            if code.co_filename != filename:
+                code = _replace_filename(code, filename)
+        else:
+            cache.misses += 1
+            code = compile(script, filename, "exec")
+            cache.put(key, module, code)
+
+    _template_cache.put(script, code)
+
+    return code
+
+
+def _precompiled_tables_for(module):
+    """
+    Return the script tables of all companion modules that can contain
+    scripts for *module*, innermost package first.
+    """
+    try:
+        return _precompiled_tables[module]
+    except KeyError:
+        pass
+
+    import importlib
+    import importlib.util
+
+    parts = module.split(".")
+    if getattr(sys.modules.get(module), "__path__", None) is None:
+        # Not a package, so the closest candidate is next to it.
+        parts.pop()
+
+    tables = []
+    while parts:
+        name = ".".join((*parts, _PRECOMPILED_MODULE))
+        try:
+            if importlib.util.find_spec(name) is not None:
+                tables.append(importlib.import_module(name).SCRIPTS)
+        except (ImportError, AttributeError):
+            pass
+        parts.pop()
+
+    rv = _precompiled_tables[module] = tuple(tables)
+
+    return rv
+
+
+def _precompiled(script, filename, module):
+    """
+    Record *script* if scripts are being captured and return the code of its
+    precompiled version or None.
+
+    Precompiled scripts are wrapped in functions that run the script in their
+    body and return their locals.
+    """
+    if module is None:
+        return None
+
+    if _captured_scripts is not None:
+        _captured_scripts.append((module, filename, script))
+
+    if not _use_precompiled:
+        return None
+
+    tables = _precompiled_tables_for(module)
+    if not tables:
+        return None
+
+    key = _script_key(script)
+    for table in tables:
+        func = table.get(key)
+        if func is not None:
+            return func.__code__
+
+    return None
+
+
+def _flush_at_exit():
+    if _bytecode_cache is not None:
+        _bytecode_cache.flush()
+
+
+_registered_atexit = False
+
+
+def enable_bytecode_cache(directory=None):
+    """
+    启用生成方法字节码的磁盘缓存。
+
+    *attrs* 为每个类生成 ``__init__``、``__eq__`` 等方法的源代码并调用 `compile`。启用缓存后，编译结果（代码对象）会以 `marshal` 格式存储在磁盘上，以生成脚本的哈希值和 Python 版本作为键。之后的进程可以直接加载它们，从而完全跳过编译器。
+
+    Args:
+        directory (str | None):
+            存放缓存文件的目录。如果为 `None`（默认），则缓存文件存放在定义类的模块旁边的 ``__pycache__`` 目录中；没有文件的模块（例如交互式会话）不会被缓存。
+
+    缓存文件在解释器退出时或调用 `disable_bytecode_cache` 时写入。
+
+    .. warning::
+
+        此函数不是线程安全的！
+
+    .. versionadded:: 24.3.0
+    """
+    global _bytecode_cache, _registered_atexit
+
+    if _bytecode_cache is not None:
+        _bytecode_cache.flush()
+
+    _bytecode_cache = _BytecodeCache(
+        None if directory is None else Path(directory)
+    )
+
+    if not _registered_atexit:
+        import atexit
+
+        atexit.register(_flush_at_exit)
+        _registered_atexit = True
+
+
+def disable_bytecode_cache():
+    """
+    将挂起的条目写入磁盘并禁用字节码缓存。
+
+    .. versionadded:: 24.3.0
+    """
+    global _bytecode_cache
+
+    if _bytecode_cache is not None:
+        _bytecode_cache.flush()
+        _bytecode_cache = None
+
+
+def invalidate_bytecode_cache():
+    """
+    删除当前字节码缓存已知的所有缓存文件并清空内存中的条目。
+
+    如果使用显式的 *directory* 启用了缓存，则该目录中的所有缓存文件都会被删除。
+
+    如果缓存未启用，则不执行任何操作。
+
+    .. versionadded:: 24.3.0
+    """
+    if _bytecode_cache is not None:
+        _bytecode_cache.invalidate()
+
+
+def bytecode_cache_info():
+    """
+    返回当前字节码缓存的命中和未命中次数。
+
+    Returns:
+        BytecodeCacheInfo:
+            一个具有 *hits* 和 *misses* 字段的命名元组。如果缓存未启用，两者均为 0。
+
+    .. versionadded:: 24.3.0
+    """
+    if _bytecode_cache is None:
+        return BytecodeCacheInfo(0, 0)
+
+    return BytecodeCacheInfo(_bytecode_cache.hits, _bytecode_cache.misses)
+
+
+def enable_precompiled():
+    """
+    使用由 ``python -m attr.compile`` 预先生成的方法。
+
+    启用后，*attrs* 在创建类时会在定义类的模块所在的包（及其父包）中查找 ``_attrs_generated`` 模块。如果其中包含与当前生成脚本完全相同的脚本，则直接使用它们已编译的代码，而不是再次生成和编译。不匹配的脚本（例如因为类在此期间发生了变化）会照常在运行时生成。
+
+    由于预先生成的方法位于真实的模块中，覆盖率工具和性能分析器也能看到它们。
+
+    必须在导入包含 *attrs* 类的包 **之前** 调用此函数。
+
+    .. warning::
+
+        此函数不是线程安全的！
+
+    .. versionadded:: 24.3.0
+    """
+    global _use_precompiled
+
+    _use_precompiled = True
+
+
+def disable_precompiled():
+    """
+    停止使用由 ``python -m attr.compile`` 预先生成的方法。
+
+    .. versionadded:: 24.3.0
+    """
+    global _use_precompiled
+
+    _use_precompiled = False
+    _precompiled_tables.clear()
+
+
+def set_lazy_methods(lazy):
+    """
+    全局设置 *attrs* 是否延迟生成方法。
+
+    启用后，``__repr__``、``__hash__`` 以及排序方法（``__lt__``、``__le__``、``__gt__`` 和 ``__ge__``）不会在创建类时生成，而是在第一次访问时生成并替换类上的占位符。之后的调用与立即生成的方法没有任何区别。
+
+    这使得类的创建更快，特别是当许多类的这些方法从未被调用时。
+
+    只影响之后创建的、没有显式传递 *lazy_methods* 的类。使用 `enable_precompiled` 时，方法总是立即生成，以便与预先生成的方法匹配。
+
+    Args:
+        lazy (bool): 是否延迟生成方法。
+
+    .. warning::
+
+        此函数不是线程安全的！
+
+    .. versionadded:: 24.3.0
+    """
+    global _lazy_methods
+
+    _lazy_methods = lazy
+
+
+def get_lazy_methods():
+    """
+    返回 *attrs* 是否全局延迟生成方法。
+
+    Returns:
+        bool: 如果延迟生成方法，则为 `True`。
+
+    .. versionadded:: 24.3.0
+    """
+    return _lazy_methods
+
+
+def template_cache_info():
+    """
+    返回进程范围内模板缓存的统计信息。
+
+    形状相同的类（相同的字段名，以及相同种类的默认值、验证器和转换器）生成的脚本完全相同。*attrs* 只编译一次这样的脚本，之后的类复用已编译的代码对象，只为其创建新的函数。
+
+    Returns:
+        TemplateCacheInfo:
+            一个具有 *hits*、*misses*、*maxsize* 和 *currsize* 字段以及 *hit_ratio* 属性的命名元组。
+
+    .. versionadded:: 24.3.0
+    """
+    cache = _template_cache
+
+    return TemplateCacheInfo(
+        cache.hits, cache.misses, cache.maxsize, len(cache._codes)
+    )
+
+
+def clear_template_cache():
+    """
+    清空模板缓存并重置其统计信息。
+
+    .. versionadded:: 24.3.0
+    """
+    cache = _template_cache
+
+    cache._codes.clear()
+    cache.hits = cache.misses = 0
+
+
+def set_linecache_mode(mode):
+    """
+    设置 *attrs* 如何在 `linecache` 中注册生成方法的源代码。
+
+    调试器（如 PDB）和回溯通过 `linecache` 显示生成方法的源代码。
+
+    Args:
+        mode (str):
+            - ``"eager"`` （默认）：为每个类存储其源代码的完整副本。
+            - ``"shared"``：源代码相同的类（例如在循环中使用 `attrs.make_class` 创建的类）共享同一个 `linecache` 条目，而不是各自存储一份副本。回溯和调试器中显示的文件名是第一个生成该源代码的类的文件名。最多共享 1024 份不同的源代码。
+            - ``"off"``：完全不注册源代码。这可以节省内存，但回溯和调试器将无法显示生成方法的源代码。
+
+    Raises:
+        ValueError: 如果 *mode* 不是上述值之一。
+
+    只影响之后生成的方法。
+
+    .. warning::
+
+        此函数不是线程安全的！
+
+    .. versionadded:: 24.3.0
+    """
+    global _linecache_mode
+
+    if mode not in _LINECACHE_MODES:
+        msg = f"Invalid linecache mode {mode!r}, must be one of {', '.join(map(repr, _LINECACHE_MODES))}."
+        raise ValueError(msg)
+
+    _linecache_mode = mode
+
+    if mode != "shared":
+        _shared_entries.clear()
+
+
+def get_linecache_mode():
+    """
+    返回 *attrs* 如何在 `linecache` 中注册生成方法的源代码。
+
+    Returns:
+        str: ``"eager"``、``"shared"`` 或 ``"off"``。
+
+    .. versionadded:: 24.3.0
+    """
+    return _linecache_mode
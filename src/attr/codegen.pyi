@@ -0,0 +1,30 @@
+from os import PathLike
+from typing import Literal, NamedTuple
+
+class BytecodeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+
+def enable_bytecode_cache(
+    directory: str | PathLike[str] | None = ...,
+) -> None: ...
+def disable_bytecode_cache() -> None: ...
+def invalidate_bytecode_cache() -> None: ...
+def bytecode_cache_info() -> BytecodeCacheInfo: ...
+def enable_precompiled() -> None: ...
+def disable_precompiled() -> None: ...
+def set_lazy_methods(lazy: bool) -> None: ...
+def get_lazy_methods() -> bool: ...
+
+class TemplateCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    @property
+    def hit_ratio(self) -> float: ...
+
+def template_cache_info() -> TemplateCacheInfo: ...
+def clear_template_cache() -> None: ...
+def set_linecache_mode(mode: Literal["eager", "shared", "off"]) -> None: ...
+def get_linecache_mode() -> Literal["eager", "shared", "off"]: ...
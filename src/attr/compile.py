@@ -0,0 +1,155 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+"""
+Write the methods *attrs* generates for a package into a real module.
+
+Run it as ``python -m attr.compile PACKAGE [PACKAGE ...]``.  Each package and
+all of its submodules are imported and every script *attrs* generates while
+doing so is written into ``PACKAGE/_attrs_generated.py``.  After calling
+`attrs.codegen.enable_precompiled`, *attrs* uses the methods from that module
+instead of generating and compiling them at import time.
+"""
+
+import argparse
+import importlib
+import pkgutil
+import sys
+
+from pathlib import Path
+
+from . import codegen
+
+
+_HEADER = '''\
+"""
+Methods generated by attrs for the classes in {package}.
+
+Created by ``python -m attr.compile {package}``; do not edit.  Scripts that
+don't match the classes anymore are ignored and generated at runtime.
+"""'''
+
+
+def _import_all(package):
+    """
+    Import *package* and all of its submodules.
+
+    Return the package module and a list of (module name, exception) pairs of
+    submodules that failed to import.
+    """
+    pkg = importlib.import_module(package)
+    if getattr(pkg, "__path__", None) is None:
+        msg = f"{package} is not a package."
+        raise ValueError(msg)
+
+    errors = []
+    for info in pkgutil.walk_packages(
+        pkg.__path__, prefix=f"{package}.", onerror=lambda _: None
+    ):
+        name = info.name
+        last = name.rsplit(".", 1)[-1]
+        if last in ("__main__", codegen._PRECOMPILED_MODULE):
+            continue
+        try:
+            importlib.import_module(name)
+        except Exception as e:  # noqa: BLE001
+            errors.append((name, e))
+
+    return pkg, errors
+
+
+def _render(package, scripts):
+    """
+    Return the source of the companion module for *package* containing
+    *scripts*, a list of (filename, script) pairs.
+    """
+    lines = [_HEADER.format(package=package)]
+    table = []
+    seen = set()
+    for filename, script in scripts:
+        key = codegen._script_key(script)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        func_name = f"_script_{len(table)}"
+        table.append((key, func_name))
+        lines.append("")
+        lines.append("")
+        lines.append(f"# {filename}")
+        lines.append(f"def {func_name}():")
+        lines.extend(
+            f"    {line}" if line.strip() else ""
+            for line in script.splitlines()
+        )
+        lines.append("    return locals()")
+
+    lines.append("")
+    lines.append("")
+    lines.append("SCRIPTS = {")
+    lines.extend(f'    "{key}": {func_name},' for key, func_name in table)
+    lines.append("}")
+
+    return "\n".join(lines) + "\n", len(table)
+
+
+def compile_package(package):
+    """
+    Import *package* with all submodules and write the scripts generated for
+    them into its ``_attrs_generated`` module.
+
+    Return the path of the written module, the number of scripts, and a list
+    of submodules that failed to import.
+    """
+    codegen._captured_scripts = captured = []
+    try:
+        pkg, errors = _import_all(package)
+    finally:
+        codegen._captured_scripts = None
+
+    prefix = f"{package}."
+    scripts = [
+        (filename, script)
+        for module, filename, script in captured
+        if module == package or module.startswith(prefix)
+    ]
+    source, count = _render(package, scripts)
+
+    path = Path(pkg.__file__).with_name(f"{codegen._PRECOMPILED_MODULE}.py")
+    # Fail loudly now instead of silently at import time.
+    compile(source, str(path), "exec")
+    path.write_text(source, encoding="utf-8")
+
+    return str(path), count, errors
+
+
+def main(argv=None):
+    """
+    Run the command line interface with *argv* and return the exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m attr.compile",
+        description="Write the methods attrs generates for PACKAGEs into "
+        "PACKAGE/_attrs_generated.py.",
+    )
+    parser.add_argument("packages", metavar="PACKAGE", nargs="+")
+    args = parser.parse_args(argv)
+
+    rc = 0
+    for package in args.packages:
+        try:
+            path, count, errors = compile_package(package)
+        except (ImportError, ValueError) as e:
+            sys.stderr.write(f"error: {e}\n")
+            rc = 1
+            continue
+
+        for name, e in errors:
+            sys.stderr.write(f"warning: couldn't import {name}: {e!r}\n")
+        sys.stdout.write(f"Wrote {count} scripts to {path}.\n")
+
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
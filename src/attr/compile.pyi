@@ -0,0 +1,6 @@
+from typing import Sequence
+
+def compile_package(
+    package: str,
+) -> tuple[str, int, list[tuple[str, Exception]]]: ...
+def main(argv: Sequence[str] | None = ...) -> int: ...
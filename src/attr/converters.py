@@ -8,7 +8,15 @@ Commonly useful converters.
 import typing
 
 from ._compat import _AnnotationExtractor
-from ._make import NOTHING, Factory, pipe
+from ._make import (
+    NOTHING,
+    Converter,
+    Factory,
+    _fmt_bind,
+    _fmt_converter_expr,
+    _fmt_helper_name,
+    pipe,
+)
 
 
 __all__ = [
@@ -48,6 +56,18 @@ def optional(converter):
     if rt:
         optional_converter.__annotations__["return"] = typing.Optional[rt]
 
+    if not isinstance(converter, Converter):
+
+        def fmt_inline(name, value_var, field_var, globs):
+            first, val = _fmt_bind(value_var, _fmt_helper_name(name, "v"))
+            conv = _fmt_converter_expr(
+                converter, _fmt_helper_name(name, "c"), val, field_var, globs
+            )
+
+            return f"(None if {first} is None else {conv})"
+
+        optional_converter._fmt_inline = fmt_inline
+
     return optional_converter
 
 
@@ -96,6 +116,13 @@ def default_if_none(default=NOTHING, factory=None):
 
             return default.factory()
 
+        def fmt_inline(name, value_var, field_var, globs):
+            first, val = _fmt_bind(value_var, _fmt_helper_name(name, "v"))
+            factory = _fmt_helper_name(name, "f")
+            globs[factory] = default.factory
+
+            return f"({val} if {first} is not None else {factory}())"
+
     else:
 
         def default_if_none_converter(val):
@@ -104,6 +131,15 @@ def default_if_none(default=NOTHING, factory=None):
 
             return default
 
+        def fmt_inline(name, value_var, field_var, globs):
+            first, val = _fmt_bind(value_var, _fmt_helper_name(name, "v"))
+            default_ = _fmt_helper_name(name, "d")
+            globs[default_] = default
+
+            return f"({val} if {first} is not None else {default_})"
+
+    default_if_none_converter._fmt_inline = fmt_inline
+
     return default_if_none_converter
 
 
@@ -144,3 +180,43 @@ def to_bool(val):
 
     msg = f"Cannot convert value to bool: {val!r}"
     raise ValueError(msg)
+
+
+# Values that to_bool maps without having to lowercase them first.
+_BOOLS = {
+    True: True,
+    "true": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "on": True,
+    "1": True,
+    False: False,
+    "false": False,
+    "f": False,
+    "no": False,
+    "n": False,
+    "off": False,
+    "0": False,
+}
+_BOOL_TYPES = frozenset((bool, str))
+
+
+def _fmt_to_bool(name, value_var, field_var, globs):
+    """
+    Look up bools and lowercase strings directly and leave everything else to
+    `to_bool`.
+    """
+    first, val = _fmt_bind(value_var, _fmt_helper_name(name, "v"))
+    bools = _fmt_helper_name(name, "b")
+    bool_types = _fmt_helper_name(name, "t")
+    globs[bools] = _BOOLS
+    globs[bool_types] = _BOOL_TYPES
+
+    return (
+        f"({bools}[{val}] if {first}.__class__ in {bool_types} "
+        f"and {val} in {bools} else {name}({val}))"
+    )
+
+
+to_bool._fmt_inline = _fmt_to_bool
@@ -5,7 +5,7 @@
 Commonly useful filters for `attrs.asdict` and `attrs.astuple`.
 """
 
-from ._make import Attribute
+from ._make import Attribute, attrib, attrs
 
 
 def _split_what(what):
@@ -19,6 +19,76 @@ def _split_what(what):
     )
 
 
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _IncludeFilter:
+    types = attrib()
+    names = attrib()
+    attributes = attrib()
+
+    def __call__(self, attribute, value):
+        """
+        We use a callable class to make the filter introspectable.
+        """
+        return (
+            value.__class__ in self.types
+            or attribute.name in self.names
+            or (bool(self.attributes) and attribute in self.attributes)
+        )
+
+    def __repr__(self):
+        return _fmt_repr("include", self)
+
+    def _plan(self, attribute):
+        if attribute.name in self.names or (
+            self.attributes and attribute in self.attributes
+        ):
+            return True
+        if not self.types:
+            return False
+
+        return self.types, True
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _ExcludeFilter:
+    types = attrib()
+    names = attrib()
+    attributes = attrib()
+
+    def __call__(self, attribute, value):
+        """
+        We use a callable class to make the filter introspectable.
+        """
+        return not (
+            value.__class__ in self.types
+            or attribute.name in self.names
+            or (bool(self.attributes) and attribute in self.attributes)
+        )
+
+    def __repr__(self):
+        return _fmt_repr("exclude", self)
+
+    def _plan(self, attribute):
+        if attribute.name in self.names or (
+            self.attributes and attribute in self.attributes
+        ):
+            return False
+        if not self.types:
+            return True
+
+        return self.types, False
+
+
+def _fmt_repr(kind, filter):
+    what = [
+        *sorted(t.__qualname__ for t in filter.types),
+        *sorted(repr(n) for n in filter.names),
+        *sorted(f"<Attribute {a.name!r}>" for a in filter.attributes),
+    ]
+
+    return f"<{kind} filter for {', '.join(what) or 'nothing'}>"
+
+
 def include(*what):
     """
     创建一个只允许 *what* 的过滤器。
@@ -30,19 +100,15 @@ def include(*what):
     Returns:
         Callable:
             可传递给 `attrs.asdict` 和 `attrs.astuple` 的 *filter* 参数的可调用对象。
+            它的 ``types``、``names`` 和 ``attributes`` 属性是要包含的类型、名称和属性的 `frozenset`。
 
     .. versionchanged:: 23.1.0 接受字段名称的字符串。
+    .. versionchanged:: 24.3.0
+        返回一个可内省的可调用对象而不是一个函数。
+        `attrs.asdict`、`attrs.astuple` 和 `attrs.asdict_many` 为每个类只求值一次，
+        而不是针对每个实例的每个属性调用它。
     """
-    cls, names, attrs = _split_what(what)
-
-    def include_(attribute, value):
-        return (
-            value.__class__ in cls
-            or attribute.name in names
-            or attribute in attrs
-        )
-
-    return include_
+    return _IncludeFilter(*_split_what(what))
 
 
 def exclude(*what):
@@ -58,16 +124,12 @@ def exclude(*what):
             A callable that can be passed to `attrs.asdict`'s and `attrs.astuple`'s *filter* argument.
 
             可以传递给 `attrs.asdict` 和 `attrs.astuple` 的 *filter* 参数的可调用函数。
+            它的 ``types``、``names`` 和 ``attributes`` 属性是要排除的类型、名称和属性的 `frozenset`。
 
     .. versionchanged:: 23.3.0 接受字段名称字符串作为输入参数
+    .. versionchanged:: 24.3.0
+        返回一个可内省的可调用对象而不是一个函数。
+        `attrs.asdict`、`attrs.astuple` 和 `attrs.asdict_many` 为每个类只求值一次，
+        而不是针对每个实例的每个属性调用它。
     """
-    cls, names, attrs = _split_what(what)
-
-    def exclude_(attribute, value):
-        return not (
-            value.__class__ in cls
-            or attribute.name in names
-            or attribute in attrs
-        )
-
-    return exclude_
+    return _ExcludeFilter(*_split_what(what))
@@ -0,0 +1,167 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+"""
+Report how much of the import time of a module goes to *attrs*.
+
+Run it as ``python -m attr.importtime MODULE``.  The module is imported with
+`attrs.profiling` enabled and a summary of the slowest classes, the time
+spent in *attrs* compared to the whole import, and the amount of generated
+code is printed.
+"""
+
+import argparse
+import importlib
+import linecache
+import sys
+
+from time import perf_counter
+from typing import NamedTuple
+
+from . import _make, codegen, profiling
+
+
+class _Report(NamedTuple):
+    elapsed: float
+    attrs_time: float
+    records: list
+    scripts: int
+    compiled: int
+    linecache_bytes: int
+
+
+def _linecache_bytes(filenames):
+    """
+    Return the number of bytes held by the linecache entries of *filenames*,
+    counting objects shared between entries only once.
+    """
+    seen = set()
+    size = 0
+    stack = [linecache.cache[f] for f in filenames if f in linecache.cache]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return size
+
+
+def _measure(module):
+    """
+    Import *module* with profiling enabled and return a `_Report`.
+    """
+    if module in sys.modules:
+        msg = f"{module} has already been imported."
+        raise ValueError(msg)
+
+    scripts = 0
+    compile_and_eval = _make._compile_and_eval
+
+    def counting_compile_and_eval(*args, **kw):
+        nonlocal scripts
+        scripts += 1
+        return compile_and_eval(*args, **kw)
+
+    templates = codegen.template_cache_info()
+    disk_hits = codegen.bytecode_cache_info().hits
+    before = set(linecache.cache)
+
+    profiling.enable()
+    _make._compile_and_eval = counting_compile_and_eval
+    try:
+        start = perf_counter()
+        importlib.import_module(module)
+        elapsed = perf_counter() - start
+    finally:
+        _make._compile_and_eval = compile_and_eval
+        profiling.disable()
+
+    compiled = (
+        codegen.template_cache_info().misses
+        - templates.misses
+        - (codegen.bytecode_cache_info().hits - disk_hits)
+    )
+    generated = [
+        f
+        for f in set(linecache.cache) - before
+        if f.startswith("<attrs generated ")
+    ]
+
+    return _Report(
+        elapsed,
+        profiling.class_creation_time(),
+        profiling.class_creation_report(),
+        scripts,
+        compiled,
+        _linecache_bytes(generated),
+    )
+
+
+def _format(module, report, limit):
+    """
+    Return the lines of the human-readable version of *report*.
+    """
+    ms = report.elapsed * 1000
+    attrs_ms = report.attrs_time * 1000
+    share = report.attrs_time / report.elapsed if report.elapsed else 0.0
+
+    lines = [
+        f"Imported {module} in {ms:.1f} ms.",
+        f"attrs: {attrs_ms:.1f} ms ({share:.0%}) creating "
+        f"{len(report.records)} classes, rest of the import: "
+        f"{ms - attrs_ms:.1f} ms.",
+        f"Generated {report.scripts} scripts, compiled {report.compiled}; "
+        f"linecache holds {report.linecache_bytes} bytes of generated "
+        "source.",
+    ]
+
+    slowest = report.records[:limit]
+    if slowest:
+        lines.append("")
+        lines.append(f"Slowest classes (top {len(slowest)}):")
+        lines.append("      ms  class")
+        for rec in slowest:
+            phases = sorted(rec.phases.items(), key=lambda p: -p[1])[:3]
+            details = ", ".join(f"{name} {t * 1000:.2f}" for name, t in phases)
+            lines.append(f"{rec.total * 1000:8.2f}  {rec.name} ({details})")
+
+    return lines
+
+
+def main(argv=None):
+    """
+    Run the command line interface with *argv* and return the exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m attr.importtime",
+        description="Import MODULE and report the time spent creating attrs "
+        "classes.",
+    )
+    parser.add_argument("module", metavar="MODULE")
+    parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of slowest classes to show (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = _measure(args.module)
+    except (ImportError, ValueError) as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 1
+
+    lines = _format(args.module, report, args.limit)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+"""
+Measure where *attrs* spends its time while creating classes.
+"""
+
+import functools
+
+from time import perf_counter
+from typing import NamedTuple
+
+from . import _make
+
+
+__all__ = [
+    "ClassCreationRecord",
+    "class_creation_report",
+    "class_creation_time",
+    "disable",
+    "enable",
+    "reset",
+]
+
+
+class ClassCreationRecord(NamedTuple):
+    """
+    创建单个 *attrs* 类所花费的时间。
+
+    Attributes:
+        name (str): 类的完全限定名称（``module.qualname``）。
+
+        total (float): 创建类所花费的总时间（秒）。
+
+        phases (dict[str, float]):
+            各个阶段所花费的时间（秒）。阶段可以嵌套：
+            ``collect_base_attrs`` 是 ``transform_attrs`` 的一部分，``closure_cells`` 是 ``create_slots_class`` 的一部分。
+
+    .. versionadded:: 24.3.0
+    """
+
+    name: str
+    total: float
+    phases: dict
+
+
+# Module-level functions of attr._make -> phase they're accounted to.
+_PHASES = {
+    "_transform_attrs": "transform_attrs",
+    "_collect_base_attrs": "collect_base_attrs",
+    "_collect_base_attrs_broken": "collect_base_attrs",
+    "_make_init_script": "make_init",
+    "_make_eq_script": "make_eq",
+    "_make_hash_script": "make_hash",
+    "_make_repr_script": "make_repr",
+    "_make_order": "make_order",
+    "_make_cached_property_getattr": "make_getattr",
+    "_rewrite_closure_cells": "closure_cells",
+    "_call_attrs_init_subclass": "attrs_init_subclass",
+}
+
+# Methods of attr._make._ClassBuilder -> phase they're accounted to.
+_BUILDER_PHASES = {
+    "_make_getstate_setstate": "make_getstate_setstate",
+    "_eval_snippets": "compile",
+    "_create_slots_class": "create_slots_class",
+    "_patch_original_class": "patch_original_class",
+}
+
+# Finished records or None if profiling has never been enabled.
+_records = None
+
+# Profiles of the classes that are being created right now, innermost last.
+_stack = []
+
+# Time spent creating classes.  Nested class creations are only counted
+# once, in their outermost class.
+_total = 0.0
+
+# (owner, name) -> the original, unwrapped object.
+_originals = {}
+
+
+class _ClassProfile:
+    __slots__ = ("cls", "phases", "start")
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.phases = {}
+        self.start = perf_counter()
+
+
+def _timed(phase, func):
+    """
+    Wrap *func* such that its run time is added to *phase* of the class that
+    is being created.
+    """
+
+    @functools.wraps(func)
+    def timed(*args, **kw):
+        if not _stack:
+            return func(*args, **kw)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            phases = _stack[-1].phases
+            phases[phase] = phases.get(phase, 0.0) + perf_counter() - start
+
+    return timed
+
+
+def _wrap_init(init):
+    @functools.wraps(init)
+    def __init__(self, cls, *args, **kw):
+        profile = _ClassProfile(cls)
+        _stack.append(profile)
+        try:
+            init(self, cls, *args, **kw)
+        except BaseException:
+            _pop(profile.cls)
+            raise
+
+    return __init__
+
+
+def _wrap_build_class(build_class):
+    @functools.wraps(build_class)
+    def build(self):
+        global _total
+
+        try:
+            return build_class(self)
+        finally:
+            profile = _pop(self._cls)
+            if profile is not None and _records is not None:
+                elapsed = perf_counter() - profile.start
+                if not _stack:
+                    _total += elapsed
+                _records.append(
+                    ClassCreationRecord(
+                        f"{profile.cls.__module__}.{profile.cls.__qualname__}",
+                        elapsed,
+                        profile.phases,
+                    )
+                )
+
+    return build
+
+
+def _pop(cls):
+    """
+    Remove the profile of *cls* from the stack and return it.
+
+    Profiles above it belong to classes whose creation failed and are
+    dropped.
+    """
+    for i in range(len(_stack) - 1, -1, -1):
+        if _stack[i].cls is cls:
+            profile = _stack[i]
+            del _stack[i:]
+
+            return profile
+
+    return None
+
+
+def _patch(owner, name, wrapped):
+    _originals[owner, name] = getattr(owner, name)
+    setattr(owner, name, wrapped)
+
+
+def enable():
+    """
+    开始记录 *attrs* 创建每个类时在各个阶段所花费的时间。
+
+    之前的记录会被丢弃。启用之前，分析不会带来任何开销。
+
+    .. warning::
+
+        此函数不是线程安全的！
+
+    .. versionadded:: 24.3.0
+    """
+    global _records, _total
+
+    _records = []
+    _total = 0.0
+
+    if _originals:
+        return
+
+    builder = _make._ClassBuilder
+    for name, phase in _PHASES.items():
+        _patch(_make, name, _timed(phase, getattr(_make, name)))
+    for name, phase in _BUILDER_PHASES.items():
+        _patch(builder, name, _timed(phase, getattr(builder, name)))
+    _patch(builder, "__init__", _wrap_init(builder.__init__))
+    _patch(builder, "build_class", _wrap_build_class(builder.build_class))
+
+
+def disable():
+    """
+    停止记录。已经收集的记录仍然可以通过 `class_creation_report` 查询。
+
+    .. versionadded:: 24.3.0
+    """
+    for (owner, name), orig in _originals.items():
+        setattr(owner, name, orig)
+
+    _originals.clear()
+    _stack.clear()
+
+
+def reset():
+    """
+    丢弃所有已收集的记录。
+
+    .. versionadded:: 24.3.0
+    """
+    global _total
+
+    if _records is not None:
+        _records.clear()
+    _total = 0.0
+
+
+def class_creation_report(limit=None):
+    """
+    返回自调用 `enable` 以来创建的类的记录，按总时间从高到低排序。
+
+    Args:
+        limit (int | None): 如果不为 `None`，则只返回最慢的 *limit* 个类。
+
+    Returns:
+        list[ClassCreationRecord]
+
+    .. versionadded:: 24.3.0
+    """
+    report = sorted(_records or (), key=lambda r: r.total, reverse=True)
+
+    return report if limit is None else report[:limit]
+
+
+def class_creation_time():
+    """
+    返回自调用 `enable` 或 `reset` 以来创建类所花费的总时间（秒）。
+
+    在创建另一个类的过程中创建的类只计算一次，即计入最外层的类。因此，这通常小于所有记录的 ``total`` 之和。
+
+    Returns:
+        float
+
+    .. versionadded:: 24.3.0
+    """
+    return _total
@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+class ClassCreationRecord(NamedTuple):
+    name: str
+    total: float
+    phases: dict[str, float]
+
+def enable() -> None: ...
+def disable() -> None: ...
+def reset() -> None: ...
+def class_creation_report(
+    limit: int | None = ...,
+) -> list[ClassCreationRecord]: ...
+def class_creation_time() -> float: ...
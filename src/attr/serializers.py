@@ -0,0 +1,135 @@
+# mypy: ignore-errors
+# SPDX-License-Identifier: MIT
+
+"""
+Commonly useful value serializers for `attrs.asdict`.
+"""
+
+import typing
+
+from ._make import _UNION_ORIGINS, attrib, attrs
+
+
+__all__ = ["by_type"]
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _ByTypeSerializer:
+    table = attrib(eq=False)
+    _key = attrib()
+    _cache = attrib(init=False, eq=False, factory=dict)
+
+    def __call__(self, inst, field, value):
+        """
+        We use a callable class to make the serializer introspectable.
+        """
+        cls = value.__class__
+        try:
+            fn = self._cache[cls]
+        except KeyError:
+            fn = self._resolve(cls)
+
+        if fn is None:
+            return value
+
+        return fn(value)
+
+    def __repr__(self):
+        what = ", ".join(sorted(t.__qualname__ for t in self.table))
+
+        return f"<by_type serializer for {what or 'nothing'}>"
+
+    def _resolve(self, cls):
+        """
+        Look up the function for *cls* or its closest base class in the
+        table and remember it.
+        """
+        table = self.table
+        fn = next((table[b] for b in cls.__mro__ if b in table), None)
+        self._cache[cls] = fn
+
+        return fn
+
+    def _plan(self, attribute):
+        """
+        Return the set of classes that values of *attribute* can be of
+        according to its type, but that aren't in the table -- values of
+        exactly these classes are returned as they are.
+
+        Returns None if there are no such classes or the type doesn't tell.
+        """
+        classes = _declared_classes(attribute.type)
+        if classes is None:
+            return None
+
+        rv = frozenset(cls for cls in classes if self._resolve(cls) is None)
+
+        return rv or None
+
+
+def _declared_classes(type_):
+    """
+    Return the classes that *type_* -- a class, a generic alias, or a union
+    of those -- declares, or None if it's something else.
+    """
+    origin = typing.get_origin(type_)
+    if origin in _UNION_ORIGINS:
+        rv = []
+        for arg in typing.get_args(type_):
+            classes = _declared_classes(arg)
+            if classes is None:
+                return None
+            rv.extend(classes)
+
+        return rv
+
+    if origin is not None:
+        type_ = origin
+
+    # typing.Any is a class on Python 3.11 and later.
+    if not isinstance(type_, type) or type_ is typing.Any:
+        return None
+
+    return [type_]
+
+
+def by_type(table):
+    """
+    创建一个按值的类型分派的 *value_serializer*，可以传递给 `attrs.asdict` 和 `attrs.asdict_many`。
+
+    它用 *table* 中值的类或其方法解析顺序（MRO）中最近的基类所对应的函数转换每个值，
+    并返回结果。不在 *table* 中的类的值保持不变。
+    每个类只查找一次，结果会缓存在序列化器中。
+
+    因为 *table* 在创建时是已知的，所以 `attrs.asdict` 和 `attrs.asdict_many`
+    使用为每个类生成一次的函数，并且对于值恰好属于字段声明的类型之一、而该类型不在 *table* 中的字段，完全不调用它。
+    这些函数只在序列化器（或一个相等的序列化器）被再次使用时才生成，因此最好只创建一次序列化器并重复使用它。
+
+    Args:
+        table (dict[type, ~typing.Callable]):
+            类到函数的映射。函数接收值并返回它的序列化形式。
+
+    Returns:
+        Callable:
+            可传递给 *value_serializer* 参数的可调用对象。
+            它的 ``table`` 属性是 *table* 的副本。
+
+    Raises:
+        TypeError: 如果 *table* 的某个键不是类。
+
+    .. versionadded:: 24.3.0
+    """
+    table = dict(table)
+    for cls in table:
+        if not isinstance(cls, type):
+            msg = f"Keys of the table must be classes, not {cls!r}."
+            raise TypeError(msg)
+
+    try:
+        key = frozenset(table.items())
+    except TypeError:
+        # Functions that can't be hashed make the serializer only equal to
+        # itself.
+        key = object()
+
+    return _ByTypeSerializer(table, key)
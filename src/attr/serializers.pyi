@@ -0,0 +1,7 @@
+from typing import Any, Callable, Mapping
+
+from . import Attribute
+
+def by_type(
+    table: Mapping[type, Callable[[Any], Any]],
+) -> Callable[[Any, Attribute[Any] | None, Any], Any]: ...
@@ -12,7 +12,16 @@ from contextlib import contextmanager
 from re import Pattern
 
 from ._config import get_run_validators, set_run_validators
-from ._make import _AndValidator, and_, attrib, attrs
+from ._make import (
+    _ARRAY_KINDS,
+    _AndValidator,
+    _check_array,
+    _fmt_helper_name,
+    _fmt_validator_call,
+    and_,
+    attrib,
+    attrs,
+)
 from .converters import default_if_none
 from .exceptions import NotCallableError
 
@@ -108,10 +117,26 @@ class _InstanceOfValidator:
     def __repr__(self):
         return f"<instance_of validator for type {self.type!r}>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        type_ = _fmt_helper_name(name, "type")
+        globs[type_] = self.type
+
+        return [
+            f"if not isinstance({value_var}, {type_}):",
+            f"    {name}(self, {attr_var}, {value_var})",
+        ]
+
+    def _check_array(self, arr):
+        kind = _ARRAY_KINDS.get(arr.dtype.kind)
+        if kind is None:
+            return None
+
+        return len(arr) == 0 or issubclass(kind, self.type)
+
 
 def instance_of(type):
     """
-    一个验证器，如果初始化器使用错误类型调用该特定属性，则引发 `TypeError` 
+    一个验证器，如果初始化器使用错误类型调用该特定属性，则引发 `TypeError`
     （检查使用 `isinstance` 执行，因此也可以传递类型元组）。
 
     Args:
@@ -207,6 +232,28 @@ class _OptionalValidator:
     def __repr__(self):
         return f"<optional validator for {self.validator!r} or None>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        return [
+            f"if {value_var} is not None:",
+            *(
+                f"    {line}"
+                for line in _fmt_validator_call(
+                    self.validator,
+                    _fmt_helper_name(name, "v"),
+                    value_var,
+                    attr_var,
+                    globs,
+                )
+            ),
+        ]
+
+    def _check_array(self, arr):
+        # Only arrays of objects can hold None.
+        if arr.dtype.kind == "O":
+            return None
+
+        return _check_array(self.validator, arr)
+
 
 def optional(validator):
     """
@@ -251,6 +298,21 @@ class _InValidator:
     def __repr__(self):
         return f"<in_ validator with options {self._original_options!r}>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        options = _fmt_helper_name(name, "options")
+        ok = _fmt_helper_name(name, "ok")
+        globs[options] = self.options
+
+        # Not raising from within the except block keeps __context__ clean.
+        return [
+            "try:",
+            f"    {ok} = {value_var} in {options}",
+            "except TypeError:",
+            f"    {ok} = False",
+            f"if not {ok}:",
+            f"    {name}(self, {attr_var}, {value_var})",
+        ]
+
 
 def in_(options):
     """
@@ -424,6 +486,36 @@ class _NumberValidator:
     def __repr__(self):
         return f"<Validator for x {self.compare_op} {self.bound}>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        if _COMPARE_FUNCS.get(self.compare_op) is not self.compare_func:
+            return None
+
+        bound = _fmt_helper_name(name, "bound")
+        globs[bound] = self.bound
+
+        return [
+            f"if not {value_var} {self.compare_op} {bound}:",
+            f"    {name}(self, {attr_var}, {value_var})",
+        ]
+
+    def _check_array(self, arr):
+        if (
+            _COMPARE_FUNCS.get(self.compare_op) is not self.compare_func
+            or arr.dtype.kind not in "biuf"
+            or type(self.bound) not in (int, float)
+        ):
+            return None
+
+        return bool(self.compare_func(arr, self.bound).all())
+
+
+_COMPARE_FUNCS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
 
 def lt(val):
     """
@@ -496,6 +588,15 @@ class _MaxLengthValidator:
     def __repr__(self):
         return f"<max_len validator for {self.max_length}>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        max_length = _fmt_helper_name(name, "max_length")
+        globs[max_length] = self.max_length
+
+        return [
+            f"if len({value_var}) > {max_length}:",
+            f"    {name}(self, {attr_var}, {value_var})",
+        ]
+
 
 def max_len(length):
     """
@@ -524,6 +625,15 @@ class _MinLengthValidator:
     def __repr__(self):
         return f"<min_len validator for {self.min_length}>"
 
+    def _fmt_inline(self, name, value_var, attr_var, globs):
+        min_length = _fmt_helper_name(name, "min_length")
+        globs[min_length] = self.min_length
+
+        return [
+            f"if len({value_var}) < {min_length}:",
+            f"    {name}(self, {attr_var}, {value_var})",
+        ]
+
 
 def min_len(length):
     """
@@ -7,23 +7,25 @@ from attr import (
     Converter,
     Factory,
     _make_getattr,
+    as_mapping,
     assoc,
-    cmp_using,
     define,
     evolve,
     field,
     fields,
     fields_dict,
+    from_columns,
+    from_dict,
+    from_rows,
     frozen,
     has,
     make_class,
     mutable,
     resolve_types,
+    trusted,
     validate,
 )
-from attr._next_gen import asdict, astuple
-
-from . import converters, exceptions, filters, setters, validators
+from attr._next_gen import asdict, asdict_many, astuple
 
 
 __all__ = [
@@ -37,15 +39,19 @@ __all__ = [
     "__url__",
     "__version__",
     "__version_info__",
+    "as_mapping",
     "asdict",
+    "asdict_many",
     "assoc",
     "astuple",
     "Attribute",
     "AttrsInstance",
     "cmp_using",
+    "codegen",
     "Converter",
     "converters",
     "define",
+    "dump_json",
     "evolve",
     "exceptions",
     "Factory",
@@ -53,15 +59,37 @@ __all__ = [
     "fields_dict",
     "fields",
     "filters",
+    "from_columns",
+    "from_dict",
+    "from_rows",
     "frozen",
     "has",
+    "iter_json",
     "make_class",
     "mutable",
     "NOTHING",
+    "profiling",
     "resolve_types",
+    "serializers",
     "setters",
+    "trusted",
     "validate",
     "validators",
 ]
 
-__getattr__ = _make_getattr(__name__)
+# Submodules and rarely used names are imported on first access.
+_LAZY = {
+    "cmp_using": ("attr._cmp", "cmp_using"),
+    "codegen": ("attrs.codegen", None),
+    "converters": ("attrs.converters", None),
+    "dump_json": ("attr._json", "dump_json"),
+    "exceptions": ("attrs.exceptions", None),
+    "filters": ("attrs.filters", None),
+    "iter_json": ("attr._json", "iter_json"),
+    "profiling": ("attrs.profiling", None),
+    "serializers": ("attrs.serializers", None),
+    "setters": ("attrs.setters", None),
+    "validators": ("attrs.validators", None),
+}
+
+__getattr__ = _make_getattr(__name__, _LAZY)
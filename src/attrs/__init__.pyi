@@ -20,26 +20,37 @@ from attr import __title__ as __title__
 from attr import __url__ as __url__
 from attr import __version__ as __version__
 from attr import __version_info__ as __version_info__
+from attr import as_mapping as as_mapping
 from attr import assoc as assoc
 from attr import Attribute as Attribute
 from attr import AttrsInstance as AttrsInstance
 from attr import cmp_using as cmp_using
+from attr import codegen as codegen
+from attr import profiling as profiling
 from attr import converters as converters
 from attr import Converter as Converter
+from attr import dump_json as dump_json
 from attr import evolve as evolve
 from attr import exceptions as exceptions
 from attr import Factory as Factory
 from attr import fields as fields
 from attr import fields_dict as fields_dict
 from attr import filters as filters
+from attr import from_columns as from_columns
+from attr import from_dict as from_dict
+from attr import from_rows as from_rows
 from attr import has as has
+from attr import iter_json as iter_json
 from attr import make_class as make_class
 from attr import NOTHING as NOTHING
 from attr import resolve_types as resolve_types
+from attr import serializers as serializers
 from attr import setters as setters
+from attr import trusted as trusted
 from attr import validate as validate
 from attr import validators as validators
 from attr import attrib, asdict as asdict, astuple as astuple
+from attr import asdict_many as asdict_many
 
 if sys.version_info >= (3, 11):
     from typing import dataclass_transform
@@ -168,6 +179,7 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(field_specifiers=(attrib, field))
@@ -194,6 +206,7 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool | None = ...,
 ) -> Callable[[_C], _C]: ...
 
 mutable = define
@@ -223,6 +236,7 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(frozen_default=True, field_specifiers=(attrib, field))
@@ -249,4 +263,5 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool | None = ...,
 ) -> Callable[[_C], _C]: ...
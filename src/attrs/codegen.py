@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: MIT
+
+from attr.codegen import *  # noqa: F403
@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: MIT
+
+from attr.profiling import *  # noqa: F403
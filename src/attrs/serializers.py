@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: MIT
+
+from attr.serializers import *  # noqa: F403
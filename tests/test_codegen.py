@@ -0,0 +1,410 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr.codegen`.
+"""
+
+import linecache
+import sys
+
+import pytest
+
+import attr
+
+from attr import codegen
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    """
+    Make sure no test leaks an enabled bytecode cache and that every test
+    compiles its scripts like a fresh process would.
+    """
+    codegen.clear_template_cache()
+
+    yield
+
+    codegen._bytecode_cache = None
+    codegen.clear_template_cache()
+    codegen.set_linecache_mode("eager")
+
+
+def make_c(name="C"):
+    """
+    Return a fresh class that generates all common dunder methods.
+    """
+    return attr.make_class(
+        name,
+        {"x": attr.ib(), "y": attr.ib(default=42)},
+        unsafe_hash=True,
+        order=True,
+    )
+
+
+class TestBytecodeCache:
+    def test_disabled_by_default(self):
+        """
+        The cache is off by default and reports no activity.
+        """
+        make_c()
+
+        assert codegen._bytecode_cache is None
+        assert (0, 0) == codegen.bytecode_cache_info()
+
+    def test_miss_then_hit(self, tmp_path):
+        """
+        The first run compiles and stores the scripts, the second one loads
+        them from disk and the resulting methods work.
+        """
+        codegen.enable_bytecode_cache(tmp_path)
+        make_c()
+        misses = codegen.bytecode_cache_info().misses
+
+        assert misses > 0
+        assert 0 == codegen.bytecode_cache_info().hits
+
+        codegen.disable_bytecode_cache()
+
+        assert [f"{__name__}.{sys.implementation.cache_tag}.attrs"] == [
+            p.name for p in tmp_path.iterdir()
+        ]
+
+        codegen.clear_template_cache()
+        codegen.enable_bytecode_cache(tmp_path)
+        C = make_c()
+
+        assert (misses, 0) == codegen.bytecode_cache_info()
+        assert "C(x=1, y=42)" == repr(C(1))
+        assert C(1) == C(1)
+        assert C(1) < C(2)
+        assert hash(C(1)) == hash(C(1))
+
+    def test_filename_rewritten(self, tmp_path):
+        """
+        Code objects loaded from the cache carry the filename of the class
+        they're used for.
+        """
+        codegen.enable_bytecode_cache(tmp_path)
+        make_c()
+        codegen.disable_bytecode_cache()
+
+        codegen.clear_template_cache()
+        codegen.enable_bytecode_cache(tmp_path)
+
+        @attr.s(unsafe_hash=True, order=True)
+        class D:
+            x = attr.ib()
+            y = attr.ib(default=42)
+
+        assert codegen.bytecode_cache_info().hits > 0
+        assert (
+            f"<attrs generated methods {__name__}."
+            "TestBytecodeCache.test_filename_rewritten.<locals>.D>"
+            == D.__init__.__code__.co_filename
+        )
+
+    def test_default_location(self, tmp_path, monkeypatch):
+        """
+        If no directory is passed, the cache lives next to the module's
+        bytecode.
+        """
+        monkeypatch.setattr(sys, "pycache_prefix", str(tmp_path))
+
+        codegen.enable_bytecode_cache()
+        make_c()
+        codegen.disable_bytecode_cache()
+
+        assert 1 == len(list(tmp_path.rglob("test_codegen.*.attrs")))
+
+    def test_no_module_file(self, tmp_path, monkeypatch):
+        """
+        Classes from modules without a file aren't cached if no directory is
+        passed.
+        """
+        monkeypatch.setattr(sys, "pycache_prefix", str(tmp_path))
+        codegen.enable_bytecode_cache()
+
+        attr.s(these={"x": attr.ib()})(type("C", (), {"__module__": "nope"}))
+        codegen.disable_bytecode_cache()
+
+        assert codegen._BytecodeCache(None)._path_for("nope") is None
+        assert [] == list(tmp_path.rglob("*.attrs"))
+
+    def test_invalidate(self, tmp_path):
+        """
+        Invalidating deletes the files and forgets loaded entries.
+        """
+        codegen.enable_bytecode_cache(tmp_path)
+        make_c()
+        codegen.disable_bytecode_cache()
+        codegen.enable_bytecode_cache(tmp_path)
+
+        codegen.invalidate_bytecode_cache()
+
+        assert [] == list(tmp_path.iterdir())
+
+        make_c()
+
+        assert 0 == codegen.bytecode_cache_info().hits
+
+    def test_invalidate_disabled(self):
+        """
+        Invalidating a disabled cache is a no-op.
+        """
+        codegen.invalidate_bytecode_cache()
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"garbage", b"\x00\x00\x00\x00", None]
+    )
+    def test_corrupt(self, tmp_path, data):
+        """
+        Unreadable cache files and files of other Python versions are
+        ignored and overwritten.
+        """
+        path = tmp_path / f"{__name__}.{sys.implementation.cache_tag}.attrs"
+        if data is None:
+            # Valid magic number but garbage after it.
+            data = codegen._magic_number() + b"\xff"
+        path.write_bytes(data)
+
+        codegen.enable_bytecode_cache(tmp_path)
+        C = make_c()
+
+        assert 0 == codegen.bytecode_cache_info().hits
+        assert "C(x=1, y=42)" == repr(C(1))
+
+        codegen.disable_bytecode_cache()
+
+        assert path.read_bytes().startswith(codegen._magic_number())
+
+    def test_unwritable(self, tmp_path):
+        """
+        If the cache can't be written, it's silently skipped.
+        """
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        codegen.enable_bytecode_cache(blocker / "cache")
+        make_c()
+        codegen.disable_bytecode_cache()
+
+        assert [blocker] == list(tmp_path.iterdir())
+
+    def test_reenable_flushes(self, tmp_path):
+        """
+        Enabling the cache again writes the entries of the old one.
+        """
+        codegen.enable_bytecode_cache(tmp_path / "a")
+        make_c()
+        codegen.enable_bytecode_cache(tmp_path / "b")
+
+        assert 1 == len(list((tmp_path / "a").iterdir()))
+        assert not (tmp_path / "b").exists()
+
+
+class TestLazyMethods:
+    def test_set_get(self, monkeypatch):
+        """
+        The global setting can be set and read.
+        """
+        monkeypatch.setattr(codegen, "_lazy_methods", False)
+
+        assert codegen.get_lazy_methods() is False
+
+        codegen.set_lazy_methods(True)
+
+        assert codegen.get_lazy_methods() is True
+
+
+class TestTemplateCache:
+    def test_shared(self):
+        """
+        Classes of the same shape share the compiled scripts, but their
+        methods carry their own filenames.
+        """
+        make_c()
+        info = codegen.template_cache_info()
+
+        assert 0 == info.hits
+        assert info.misses == info.currsize > 0
+        assert 0.0 == info.hit_ratio
+
+        C = make_c()
+        info2 = codegen.template_cache_info()
+
+        assert info.misses == info2.hits == info2.misses
+        assert 0.5 == info2.hit_ratio
+        assert "C(x=1, y=42)" == repr(C(1))
+
+        @attr.s(unsafe_hash=True, order=True)
+        class D:
+            x = attr.ib()
+            y = attr.ib(default=42)
+
+        assert codegen.template_cache_info().hits > info2.hits
+        assert D.__init__.__code__.co_filename.endswith(".D>")
+        assert D(1) == D(1)
+
+    def test_different_shapes(self):
+        """
+        Classes of different shapes don't share scripts.
+        """
+        make_c()
+        hits = codegen.template_cache_info().hits
+
+        attr.make_class("C", ["a", "b", "c"])
+
+        assert hits == codegen.template_cache_info().hits
+
+    def test_evicts_oldest(self, monkeypatch):
+        """
+        Once full, the oldest entry is evicted.
+        """
+        monkeypatch.setattr(
+            codegen, "_template_cache", codegen._TemplateCache(2)
+        )
+        code = compile("", "", "exec")
+
+        for script in ("a", "b", "c"):
+            codegen._template_cache.put(script, code)
+
+        assert ["b", "c"] == list(codegen._template_cache._codes)
+        assert 2 == codegen.template_cache_info().currsize
+
+    def test_maxsize_zero(self, monkeypatch):
+        """
+        A cache of size 0 caches nothing.
+        """
+        monkeypatch.setattr(
+            codegen, "_template_cache", codegen._TemplateCache(0)
+        )
+
+        make_c()
+        C = make_c()
+
+        assert 0 == codegen.template_cache_info().hits
+        assert 0 == codegen.template_cache_info().currsize
+        assert "C(x=1, y=42)" == repr(C(1))
+
+    def test_clear(self):
+        """
+        Clearing empties the cache and resets the statistics.
+        """
+        make_c()
+        make_c()
+        codegen.clear_template_cache()
+
+        assert (0, 0, 1024, 0) == codegen.template_cache_info()
+
+
+class TestLinecache:
+    def test_eager(self):
+        """
+        By default, every class gets its own copy of the source.
+        """
+        C1, C2 = make_c("Eager1"), make_c("Eager2")
+        f1 = C1.__init__.__code__.co_filename
+        f2 = C2.__init__.__code__.co_filename
+
+        assert "eager" == codegen.get_linecache_mode()
+        assert f1 != f2
+        assert linecache.getlines(f1) == linecache.getlines(f2)
+        assert linecache.getlines(f1) is not linecache.getlines(f2)
+
+    def test_shared(self):
+        """
+        In shared mode, identical scripts are registered once, under the
+        filename of the first one.
+        """
+        codegen.set_linecache_mode("shared")
+        n = len(linecache.cache)
+        C1, C2 = make_c("Shared1"), make_c("Shared2")
+        f1 = C1.__init__.__code__.co_filename
+        f2 = C2.__init__.__code__.co_filename
+
+        assert f1 == f2
+        assert "Shared1" in f1
+        assert len(linecache.cache) - n == len(
+            {
+                getattr(C1, name).__code__.co_filename
+                for name in ("__init__", "__eq__", "__repr__")
+            }
+        )
+        assert "    def __init__(self, x, y=attr_dict['y'].default):\n" in (
+            linecache.getlines(f1)
+        )
+        assert "Shared2(x=1, y=42)" == repr(C2(1))
+
+    def test_shared_reregisters(self):
+        """
+        Scripts whose entry has been removed from linecache are registered
+        again.
+        """
+        codegen.set_linecache_mode("shared")
+        make_c("Shared1")
+        linecache.clearcache()
+        f2 = make_c("Shared2").__init__.__code__.co_filename
+
+        assert "Shared2" in f2
+        assert [] != linecache.getlines(f2)
+
+    def test_shared_bounded(self, monkeypatch):
+        """
+        Only a bounded number of scripts is remembered.
+        """
+        monkeypatch.setattr(codegen, "_SHARED_ENTRIES_MAXSIZE", 2)
+        codegen.set_linecache_mode("shared")
+
+        for i in range(5):
+            codegen._register_source(f"x = {i}", f"<attrs generated {i}>")
+
+        assert ["x = 3", "x = 4"] == list(codegen._shared_entries)
+
+    def test_off(self):
+        """
+        If switched off, no source is registered.
+        """
+        codegen.set_linecache_mode("off")
+        C = make_c("Off")
+
+        assert "off" == codegen.get_linecache_mode()
+        assert [] == linecache.getlines(C.__init__.__code__.co_filename)
+        assert "Off(x=1, y=42)" == repr(C(1))
+
+    def test_invalid(self):
+        """
+        Invalid modes are rejected.
+        """
+        with pytest.raises(ValueError, match="Invalid linecache mode 'lazy'"):
+            codegen.set_linecache_mode("lazy")
+
+        assert "eager" == codegen.get_linecache_mode()
+
+    def test_suffixes(self):
+        """
+        Taken filenames get increasing suffixes without retrying all earlier
+        ones.
+        """
+        base = "<attrs generated test test_suffixes>"
+
+        filenames = [
+            codegen._register_source(f"x = {i}", base) for i in range(3)
+        ]
+
+        assert [base, base[:-1] + "-1>", base[:-1] + "-2>"] == filenames
+        assert 3 == codegen._next_suffix[base]
+        assert base == codegen._register_source("x = 0", base)
+
+    def test_suffixes_bounded(self, monkeypatch):
+        """
+        Only a bounded number of next suffixes is remembered.
+        """
+        monkeypatch.setattr(codegen, "_next_suffix", {})
+        monkeypatch.setattr(codegen, "_NEXT_SUFFIX_MAXSIZE", 2)
+        bases = [f"<attrs generated test bounded {i}>" for i in range(4)]
+
+        for base in bases:
+            codegen._register_source("x = 1", base)
+            codegen._register_source("x = 2", base)
+
+        assert bases[2:] == list(codegen._next_suffix)
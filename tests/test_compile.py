@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr.compile`.
+"""
+
+import itertools
+import sys
+import textwrap
+
+import pytest
+
+from attr import codegen
+from attr.compile import compile_package, main
+
+
+_counter = itertools.count()
+
+SOURCE = """
+import attr
+import functools
+
+@attr.s(unsafe_hash=True, order=True, slots=True)
+class C:
+    x = attr.ib(validator=attr.validators.instance_of(int))
+    y = attr.ib(factory=list, hash=False)
+
+    @functools.cached_property
+    def double(self):
+        return self.x * 2
+"""
+
+
+@pytest.fixture(name="make_pkg")
+def _make_pkg(tmp_path, monkeypatch):
+    """
+    Return a function that creates a fresh package with a module *mod*
+    containing *source*.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = []
+
+    def make_pkg(source=SOURCE):
+        name = f"attrs_compile_pkg_{next(_counter)}"
+        names.append(name)
+        pkg = tmp_path / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "__main__.py").write_text("raise SystemExit('do not run me')")
+        (pkg / "mod.py").write_text(textwrap.dedent(source))
+
+        return name, pkg
+
+    yield make_pkg
+
+    codegen.disable_precompiled()
+    for mod in list(sys.modules):
+        if mod.startswith(tuple(names)):
+            del sys.modules[mod]
+
+
+def forget(name):
+    """
+    Remove package *name* from sys.modules so it's imported afresh.
+    """
+    for mod in list(sys.modules):
+        if mod == name or mod.startswith(f"{name}."):
+            del sys.modules[mod]
+
+
+class TestCompilePackage:
+    def test_roundtrip(self, make_pkg):
+        """
+        The written module is used once precompiled methods are enabled and
+        the methods behave like generated ones.
+        """
+        name, pkg = make_pkg()
+
+        path, count, errors = compile_package(name)
+
+        assert str(pkg / "_attrs_generated.py") == path
+        assert 0 < count
+        assert [] == errors
+
+        forget(name)
+        codegen.enable_precompiled()
+        mod = __import__(f"{name}.mod").mod
+        C = mod.C
+
+        for meth in ("__init__", "__eq__", "__hash__", "__repr__"):
+            assert path == getattr(C, meth).__code__.co_filename
+
+        assert path == C.__getattr__.__code__.co_filename
+        assert "C(x=1, y=[])" == repr(C(1))
+        assert C(1) == C(1)
+        assert hash(C(1)) == hash(C(1, [2]))
+        assert 2 == C(1).double
+
+        with pytest.raises(TypeError, match="'x' must be <class 'int'>"):
+            C("1")
+
+    def test_stale(self, make_pkg):
+        """
+        Scripts that don't match anymore are generated at runtime.
+        """
+        name, pkg = make_pkg()
+        compile_package(name)
+        forget(name)
+
+        (pkg / "mod.py").write_text(
+            SOURCE.replace("y = attr.ib(", "z = attr.ib(")
+        )
+        codegen.enable_precompiled()
+        C = __import__(f"{name}.mod").mod.C
+
+        assert "C(x=1, z=[])" == repr(C(1))
+        assert "<attrs generated" in C.__init__.__code__.co_filename
+
+    def test_disabled(self, make_pkg):
+        """
+        Precompiled methods are ignored unless enabled.
+        """
+        name, _ = make_pkg()
+        compile_package(name)
+        forget(name)
+
+        C = __import__(f"{name}.mod").mod.C
+
+        assert "<attrs generated" in C.__init__.__code__.co_filename
+
+    def test_import_errors(self, make_pkg):
+        """
+        Submodules that fail to import are reported and skipped.
+        """
+        name, pkg = make_pkg()
+        (pkg / "broken.py").write_text("1 / 0")
+
+        _, _, errors = compile_package(name)
+
+        assert [f"{name}.broken"] == [n for n, _ in errors]
+        assert isinstance(errors[0][1], ZeroDivisionError)
+
+    def test_not_a_package(self, make_pkg):
+        """
+        Plain modules are rejected.
+        """
+        name, _ = make_pkg()
+
+        with pytest.raises(ValueError, match="is not a package"):
+            compile_package(f"{name}.mod")
+
+
+class TestMain:
+    def test_success(self, make_pkg, capsys):
+        """
+        Reports the number of written scripts.
+        """
+        name, pkg = make_pkg()
+
+        assert 0 == main([name])
+
+        out, err = capsys.readouterr()
+        assert out.startswith("Wrote ")
+        assert str(pkg / "_attrs_generated.py") in out
+        assert "" == err
+
+    def test_error(self, capsys):
+        """
+        Packages that can't be compiled result in an error and exit code 1.
+        """
+        assert 1 == main(["attrs_compile_does_not_exist"])
+
+        _, err = capsys.readouterr()
+        assert err.startswith("error: No module named")
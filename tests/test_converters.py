@@ -4,6 +4,7 @@
 Tests for `attr.converters`.
 """
 
+import functools
 import pickle
 
 import pytest
@@ -57,8 +58,10 @@ class TestConverter:
         (takes_self, takes_field), expect = scenario
 
         c = Converter(None, takes_self=takes_self, takes_field=takes_field)
+        globs = {}
 
-        assert expect == c._fmt_converter_call("le_name", "le_value")
+        assert expect == c._fmt_converter_call("le_name", "le_value", globs)
+        assert {"__attr_converter_le_name": None} == globs
 
     def test_works_as_adapter(self):
         """
@@ -295,3 +298,176 @@ class TestToBool:
         assert not to_bool("f")
         assert not to_bool("no")
         assert not to_bool("off")
+
+
+INLINED = [
+    (optional(int), ["1", None, "x"]),
+    (optional(to_bool), ["on", None, []]),
+    (default_if_none(42), [1, None]),
+    (default_if_none(factory=list), [(1,), None]),
+    (to_bool, [True, False, "y", "OFF", 1, 0.0, "maybe", [], 2]),
+    (pipe(), [1, None]),
+    (pipe(optional(int), default_if_none(0), str), ["1", None, "x"]),
+    (pipe(str, to_bool), [1, "0", 33]),
+]
+
+
+def outcome(func, *args):
+    """
+    Return what calling *func* with *args* returns or the type and the args
+    of the exception it raises.
+    """
+    try:
+        return func(*args)
+    except Exception as e:  # noqa: BLE001
+        return type(e), e.args
+
+
+class TestInlining:
+    """
+    Built-in converters are inlined into generated methods.
+    """
+
+    @pytest.mark.parametrize(("conv", "vals"), INLINED)
+    def test_init(self, conv, vals):
+        """
+        Inlined converters return the same values and raise the same errors as
+        calling them.
+        """
+        C = attr.make_class("C", {"x": attr.ib(converter=conv)})
+        a = attr.fields(C).x
+
+        for val in vals:
+            assert outcome(attr.setters.convert, None, a, val) == outcome(
+                lambda v: C(v).x, val
+            )
+
+    @pytest.mark.parametrize(("conv", "vals"), INLINED)
+    @pytest.mark.parametrize(
+        "on_setattr",
+        [attr.setters.convert, [attr.setters.convert], None],
+    )
+    def test_on_setattr(self, conv, vals, on_setattr):
+        """
+        The same is true for setters.convert and the default on_setattr
+        hooks.
+        """
+        if on_setattr is None:
+            C = attr.define(type("C", (), {"x": attr.ib(converter=conv)}))
+        else:
+            C = attr.make_class(
+                "C", {"x": attr.ib(converter=conv)}, on_setattr=on_setattr
+            )
+        a = attr.fields(C).x
+        c = C(vals[0])
+
+        def set_x(val):
+            c.x = val
+            return c.x
+
+        for val in vals:
+            assert outcome(attr.setters.convert, c, a, val) == outcome(
+                set_x, val
+            )
+
+    def test_helper_names_dont_collide(self):
+        """
+        The globals and temporaries an inlined converter needs don't clash
+        with the globals of fields whose names start with the converted
+        field's name.
+        """
+
+        @attr.define
+        class C:
+            x = attr.field(converter=optional(int))
+            x_c = attr.field(converter=str)
+            y = attr.field(converter=[optional(int), default_if_none(0)])
+            y_0 = attr.field(converter=to_bool)
+            y_0_v = attr.field(converter=float)
+
+        c = C("1", 5, None, "yes", 1)
+
+        assert (1, "5", 0, True, 1.0) == (c.x, c.x_c, c.y, c.y_0, c.y_0_v)
+
+        c.x = "2"
+        c.x_c = 6
+        c.y_0_v = "2"
+
+        assert (2, "6", 2.0) == (c.x, c.x_c, c.y_0_v)
+
+    def test_evaluated_once(self):
+        """
+        Inlined converters evaluate the value they convert only once, even if
+        they're nested.
+        """
+        calls = []
+
+        def count(val):
+            calls.append(val)
+            return val
+
+        C = attr.make_class(
+            "C",
+            {
+                "x": attr.ib(
+                    converter=[count, optional(to_bool), default_if_none(1)]
+                )
+            },
+        )
+
+        assert True is C("yes").x
+        assert 1 == C(None).x
+        assert ["yes", None] == calls
+
+    def test_takes_self_and_field(self):
+        """
+        Converters in pipes get the instance and the field, also on setattr.
+        """
+
+        def conv(val, inst, field):
+            return val, type(inst).__name__, field.name
+
+        @attr.define
+        class C:
+            x = attr.field(
+                converter=[
+                    optional(int),
+                    Converter(conv, takes_self=True, takes_field=True),
+                ]
+            )
+
+        c = C("1")
+
+        assert (1, "C", "x") == c.x
+
+        c.x = None
+
+        assert (None, "C", "x") == c.x
+
+    def test_wrapped_not_inlined(self):
+        """
+        Functions that wrap built-in converters using functools.wraps are
+        called.
+        """
+        conv = optional(int)
+
+        @functools.wraps(conv)
+        def wrapper(val):
+            return conv(val) or 42
+
+        C = attr.make_class(
+            "C", {"x": attr.ib(converter=wrapper)}, on_setattr=[]
+        )
+
+        assert 42 == C("0").x
+
+    def test_optional_converter_instance_not_inlined(self):
+        """
+        optional() of a Converter instance behaves the way it always did.
+        """
+        C = attr.make_class(
+            "C", {"x": attr.ib(converter=optional(Converter(int)))}
+        )
+
+        with pytest.raises(TypeError):
+            C("1")
@@ -998,41 +998,42 @@ class C:
 class TestFilenames:
     def test_filenames(self):
         """
-        The created dunder methods have a "consistent" filename.
+        The created dunder methods have a "consistent" filename that is
+        shared by all methods that are compiled together.
         """
         assert (
             OriginalC.__init__.__code__.co_filename
-            == "<attrs generated init tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             OriginalC.__eq__.__code__.co_filename
-            == "<attrs generated eq tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             OriginalC.__hash__.__code__.co_filename
-            == "<attrs generated hash tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             CopyC.__init__.__code__.co_filename
-            == "<attrs generated init tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             CopyC.__eq__.__code__.co_filename
-            == "<attrs generated eq tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             CopyC.__hash__.__code__.co_filename
-            == "<attrs generated hash tests.test_dunders.C>"
+            == "<attrs generated methods tests.test_dunders.C>"
         )
         assert (
             C.__init__.__code__.co_filename
-            == "<attrs generated init tests.test_dunders.C-1>"
+            == "<attrs generated methods tests.test_dunders.C-1>"
         )
         assert (
             C.__eq__.__code__.co_filename
-            == "<attrs generated eq tests.test_dunders.C-1>"
+            == "<attrs generated methods tests.test_dunders.C-1>"
         )
         assert (
             C.__hash__.__code__.co_filename
-            == "<attrs generated hash tests.test_dunders.C-1>"
+            == "<attrs generated methods tests.test_dunders.C-1>"
         )
@@ -124,3 +124,70 @@ class TestExclude:
         """
         e = exclude(*excl)
         assert e(fields(C).a, value) is False
+
+
+@pytest.mark.parametrize(
+    ("make", "kind", "outcome"),
+    [(include, "include", True), (exclude, "exclude", False)],
+)
+class TestIntrospection:
+    """
+    Tests for what `include` and `exclude` expose about themselves.
+    """
+
+    def test_attributes(self, make, kind, outcome):
+        """
+        The split up arguments are available as attributes.
+        """
+        f = make(int, "b", fields(C).a)
+
+        assert frozenset((int,)) == f.types
+        assert frozenset(("b",)) == f.names
+        assert frozenset((fields(C).a,)) == f.attributes
+
+    def test_equal(self, make, kind, outcome):
+        """
+        Filters for the same things are equal and hash equally, regardless of
+        the order of the arguments.
+        """
+        assert make(int, "a") == make("a", int)
+        assert hash(make(int, "a")) == hash(make("a", int))
+        assert make(int) != make(str)
+
+    def test_repr(self, make, kind, outcome):
+        """
+        The repr lists what the filter is for.
+        """
+        assert f"<{kind} filter for int, str, 'b', <Attribute 'a'>>" == repr(
+            make(str, fields(C).a, "b", int)
+        )
+        assert f"<{kind} filter for nothing>" == repr(make())
+
+    def test_plan(self, make, kind, outcome):
+        """
+        Attributes that are matched by name or as attributes have a fixed
+        outcome, all others too if no types are passed, otherwise it depends
+        on the type of the value.
+        """
+        a, b = fields(C)
+
+        assert outcome is make("a")._plan(a)
+        assert outcome is make(a)._plan(a)
+        assert (not outcome) is make("a")._plan(b)
+        assert (frozenset((int,)), outcome) == make(int, "a")._plan(b)
+
+    @pytest.mark.parametrize("value", [1, "x", None, True])
+    def test_plan_matches_call(self, make, kind, outcome, value):
+        """
+        The plan agrees with calling the filter.
+        """
+        f = make(int, "a")
+        for a in fields(C):
+            plan = f._plan(a)
+            if plan in (True, False):
+                expected = plan
+            else:
+                types, included = plan
+                expected = (value.__class__ in types) is included
+
+            assert expected is f(a, value)
@@ -4,7 +4,11 @@
 Tests for `attr._funcs`.
 """
 
+from __future__ import annotations
+
 import re
+import sys
+import typing
 
 from collections import OrderedDict
 from typing import Generic, NamedTuple, TypeVar
@@ -16,10 +20,30 @@ from hypothesis import strategies as st
 
 import attr
 
-from attr import asdict, assoc, astuple, evolve, fields, has
+from attr import (
+    as_mapping,
+    asdict,
+    asdict_many,
+    assoc,
+    astuple,
+    evolve,
+    fields,
+    from_columns,
+    from_dict,
+    from_rows,
+    has,
+    trusted,
+)
 from attr._compat import Mapping, Sequence
-from attr.exceptions import AttrsAttributeNotFoundError
-from attr.validators import instance_of
+from attr._funcs import (
+    _HOOKED_MAXSIZE,
+    _asdict_iterative,
+    _needs_row_validation,
+)
+from attr.exceptions import AttrsAttributeNotFoundError, NotAnAttrsClassError
+from attr.filters import exclude, include
+from attr.serializers import by_type
+from attr.validators import and_, ge, gt, in_, instance_of, le, lt, optional
 
 from .strategies import nested_classes, simple_classes
 
@@ -279,535 +303,2311 @@ class TestAsDict:
         with pytest.raises(TypeError, match=re.escape(message)):
             attr.asdict(instance, retain_collection_types=True)
 
+    @given(
+        nested_classes,
+        st.sampled_from(MAPPING_TYPES),
+        st.booleans(),
+        st.booleans(),
+        st.booleans(),
+    )
+    def test_iterative_identical(
+        self, cls, dict_class, retain, use_filter, use_serializer
+    ):
+        """
+        The iterative implementation returns the same as the recursive one
+        and calls the hooks in the same order.
+        """
+        calls = []
+
+        def filter(a, v):
+            calls.append(("filter", a.name))
+            return a.name != "a"
+
+        def serializer(inst, a, v):
+            calls.append(("serializer", a and a.name, v))
+            return v
+
+        kw = {
+            "recurse": True,
+            "filter": filter if use_filter else None,
+            "dict_factory": dict_class,
+            "retain_collection_types": retain,
+            "value_serializer": serializer if use_serializer else None,
+        }
+        obj = cls()
 
-class TestAsTuple:
-    """
-    Tests for `astuple`.
-    """
+        expected = asdict(obj, **kw)
+        expected_calls = calls[:]
+        calls.clear()
 
-    @given(st.sampled_from(SEQUENCE_TYPES))
-    def test_shallow(self, C, tuple_factory):
+        assert expected == _asdict_iterative(obj, **kw)
+        assert expected_calls == calls
+
+    @pytest.mark.parametrize("retain", [True, False])
+    def test_deep(self, retain):
         """
-        Shallow astuple returns correct dict.
+        Instances nested deeper than the recursion limit are converted
+        without raising RecursionError.
         """
-        assert tuple_factory([1, 2]) == astuple(
-            C(x=1, y=2), False, tuple_factory=tuple_factory
+
+        @attr.s
+        class Node:
+            child = attr.ib(default=None)
+
+        depth = sys.getrecursionlimit() + 100
+        node = None
+        for i in range(depth):
+            node = Node((node,)) if i % 2 else Node(node)
+
+        def walk(d):
+            # Comparing the whole result would hit the recursion limit.
+            for i in reversed(range(depth)):
+                assert ["child"] == list(d)
+                d = d["child"]
+                if i % 2:
+                    assert (tuple if retain else list) is d.__class__
+                    (d,) = d
+            assert d is None
+
+        walk(asdict(node, retain_collection_types=retain))
+        walk(
+            asdict(
+                node,
+                retain_collection_types=retain,
+                value_serializer=lambda inst, a, v: v,
+            )
         )
 
-    @given(st.sampled_from(SEQUENCE_TYPES))
-    def test_recurse(self, C, tuple_factory):
+    def test_cycle(self):
         """
-        Deep astuple returns correct tuple.
+        Cycles still raise RecursionError.
         """
-        assert tuple_factory(
-            [tuple_factory([1, 2]), tuple_factory([3, 4])]
-        ) == astuple(C(C(1, 2), C(3, 4)), tuple_factory=tuple_factory)
 
-    @given(nested_classes, st.sampled_from(SEQUENCE_TYPES))
-    def test_recurse_property(self, cls, tuple_class):
-        """
-        Property tests for recursive astuple.
-        """
-        obj = cls()
-        obj_tuple = astuple(obj, tuple_factory=tuple_class)
+        @attr.s
+        class C:
+            x = attr.ib(default=None)
 
-        def assert_proper_tuple_class(obj, obj_tuple):
-            assert isinstance(obj_tuple, tuple_class)
-            for index, field in enumerate(fields(obj.__class__)):
-                field_val = getattr(obj, field.name)
-                if has(field_val.__class__):
-                    # This field holds a class, recurse the assertions.
-                    assert_proper_tuple_class(field_val, obj_tuple[index])
+        c = C()
+        c.x = [{1: c}]
 
-        assert_proper_tuple_class(obj, obj_tuple)
+        with pytest.raises(RecursionError, match="Circular reference"):
+            asdict(c)
 
-    @given(nested_classes, st.sampled_from(SEQUENCE_TYPES))
-    def test_recurse_retain(self, cls, tuple_class):
+    def test_generated_cached(self):
         """
-        Property tests for asserting collection types are retained.
+        The functions generated for asdict are cached on the class for every
+        combination of arguments, subclasses get their own.
         """
-        obj = cls()
-        obj_tuple = astuple(
-            obj, tuple_factory=tuple_class, retain_collection_types=True
-        )
 
-        def assert_proper_col_class(obj, obj_tuple):
-            # Iterate over all attributes, and if they are lists or mappings
-            # in the original, assert they are the same class in the dumped.
-            for index, field in enumerate(fields(obj.__class__)):
-                field_val = getattr(obj, field.name)
-                if has(field_val.__class__):
-                    # This field holds a class, recurse the assertions.
-                    assert_proper_col_class(field_val, obj_tuple[index])
-                elif isinstance(field_val, (list, tuple)):
-                    # This field holds a sequence of something.
-                    expected_type = type(obj_tuple[index])
-                    assert type(field_val) is expected_type
-                    for obj_e, obj_tuple_e in zip(field_val, obj_tuple[index]):
-                        if has(obj_e.__class__):
-                            assert_proper_col_class(obj_e, obj_tuple_e)
-                elif isinstance(field_val, dict):
-                    orig = field_val
-                    tupled = obj_tuple[index]
-                    assert type(orig) is type(tupled)
-                    for obj_e, obj_tuple_e in zip(
-                        orig.items(), tupled.items()
-                    ):
-                        if has(obj_e[0].__class__):  # Dict key
-                            assert_proper_col_class(obj_e[0], obj_tuple_e[0])
-                        if has(obj_e[1].__class__):  # Dict value
-                            assert_proper_col_class(obj_e[1], obj_tuple_e[1])
+        @attr.s
+        class C:
+            x = attr.ib()
 
-        assert_proper_col_class(obj, obj_tuple)
+        @attr.s
+        class D(C):
+            y = attr.ib()
 
-    @given(st.sampled_from(SEQUENCE_TYPES))
-    def test_filter(self, C, tuple_factory):
-        """
-        Attributes that are supposed to be skipped are skipped.
-        """
-        assert tuple_factory([tuple_factory([1])]) == astuple(
-            C(C(1, 2), C(3, 4)),
-            filter=lambda a, v: a.name != "y",
-            tuple_factory=tuple_factory,
-        )
+        asdict(C(1))
+        asdict(C(1))
+        asdict(C(1), recurse=False)
+        asdict(C(1), dict_factory=OrderedDict)
 
-    @given(container=st.sampled_from(SEQUENCE_TYPES))
-    def test_lists_tuples(self, container, C):
-        """
-        If recurse is True, also recurse into lists.
-        """
-        assert (1, [(2, 3), (4, 5), "a"]) == astuple(
-            C(1, container([C(2, 3), C(4, 5), "a"]))
-        )
+        assert 3 == len(C.__attrs_serializers__)
+        assert {"x": 1, "y": 2} == asdict(D(1, 2))
+        assert 1 == len(D.__dict__["__attrs_serializers__"])
 
-    @given(st.sampled_from(SEQUENCE_TYPES))
-    def test_dicts(self, C, tuple_factory):
+    def test_not_an_attrs_class_not_cached(self):
         """
-        If recurse is True, also recurse into dicts.
+        Instances of non-attrs classes raise an error and leave no cache.
         """
-        res = astuple(C(1, {"a": C(4, 5)}), tuple_factory=tuple_factory)
-        assert tuple_factory([1, {"a": tuple_factory([4, 5])}]) == res
-        assert isinstance(res, tuple_factory)
 
-    @given(container=st.sampled_from(SEQUENCE_TYPES))
-    def test_lists_tuples_retain_type(self, container, C):
-        """
-        If recurse and retain_collection_types are True, also recurse
-        into lists and do not convert them into list.
-        """
-        assert (1, container([(2, 3), (4, 5), "a"])) == astuple(
-            C(1, container([C(2, 3), C(4, 5), "a"])),
-            retain_collection_types=True,
-        )
+        class C:
+            pass
 
-    @given(container=st.sampled_from(MAPPING_TYPES))
-    def test_dicts_retain_type(self, container, C):
-        """
-        If recurse and retain_collection_types are True, also recurse
-        into lists and do not convert them into list.
-        """
-        assert (1, container({"a": (4, 5)})) == astuple(
-            C(1, container({"a": C(4, 5)})), retain_collection_types=True
-        )
+        with pytest.raises(NotAnAttrsClassError):
+            asdict(C())
 
-    @given(simple_classes(), st.sampled_from(SEQUENCE_TYPES))
-    def test_roundtrip(self, cls, tuple_class):
+        assert not hasattr(C, "__attrs_serializers__")
+
+    @pytest.mark.parametrize("retain", [True, False])
+    def test_annotations_not_trusted(self, retain):
         """
-        Test dumping to tuple and back for Hypothesis-generated classes.
+        Values that don't match the declared types are converted all the
+        same.
         """
-        instance = cls()
-        tuple_instance = astuple(instance, tuple_factory=tuple_class)
-
-        assert isinstance(tuple_instance, tuple_class)
 
-        roundtrip_instance = cls(*tuple_instance)
+        @attr.s
+        class Inner:
+            y: int = attr.ib()
 
-        assert instance == roundtrip_instance
+        @attr.s
+        class C:
+            a: int = attr.ib()
+            b: list = attr.ib()
+            c: Inner = attr.ib()
 
-    @given(set_type=st.sampled_from((set, frozenset)))
-    def test_sets_no_retain(self, C, set_type):
-        """
-        Set types are converted to lists if retain_collection_types=False.
-        """
-        d = astuple(
-            C(1, set_type((1, 2, 3))),
-            retain_collection_types=False,
-            recurse=True,
-        )
+        inst = C(Inner(1), (Inner(2),), 3)
 
-        assert (1, [1, 2, 3]) == d
+        assert {
+            "a": {"y": 1},
+            "b": ({"y": 2},) if retain else [{"y": 2}],
+            "c": 3,
+        } == asdict(inst, retain_collection_types=retain)
 
-    def test_named_tuple_retain_type(self):
+    def test_recursive(self):
         """
-        Namedtuples can be serialized if retain_collection_types is True.
-
-        See #1164
+        Classes that refer to themselves are converted.
         """
 
-        class Coordinates(NamedTuple):
-            lat: float
-            lon: float
-
         @attr.s
-        class A:
-            coords: Coordinates = attr.ib()
+        class Node:
+            value: int = attr.ib()
+            next: Node | None = attr.ib(default=None)
+            children: list = attr.ib(factory=list)
 
-        instance = A(Coordinates(50.419019, 30.516225))
+        tree = Node(1, Node(2), [Node(3)])
 
-        assert (Coordinates(50.419019, 30.516225),) == attr.astuple(
-            instance, retain_collection_types=True
-        )
+        assert {
+            "value": 1,
+            "next": {"value": 2, "next": None, "children": []},
+            "children": [{"value": 3, "next": None, "children": []}],
+        } == asdict(tree)
 
-    def test_type_error_with_retain_type(self):
+    def test_keys(self):
         """
-        Serialization that fails with TypeError leaves the error through if
-        they're not tuples.
-
-        See #1164
+        Collections used as keys become tuples, nested instances dicts.
         """
 
-        message = "__new__() missing 1 required positional argument (astuple)"
-
-        class Coordinates(list):
-            def __init__(self, first, *rest):
-                if isinstance(first, list):
-                    raise TypeError(message)
-                super().__init__([first, *rest])
+        @attr.s(frozen=True)
+        class K:
+            k = attr.ib()
 
         @attr.s
-        class A:
-            coords: Coordinates = attr.ib()
-
-        instance = A(Coordinates(50.419019, 30.516225))
+        class C:
+            d = attr.ib()
 
-        with pytest.raises(TypeError, match=re.escape(message)):
-            attr.astuple(instance, retain_collection_types=True)
+        assert {"d": {(1, 2): [{"k": 1}]}} == asdict(
+            C({frozenset([1, 2]): [K(1)]})
+        )
+        assert {"d": {1: {"k": {"k": 1}}}} == asdict(C({1: K(K(1))}))
 
 
-class TestHas:
+class TestAsDictMany:
     """
-    Tests for `has`.
+    Tests for `asdict_many`.
     """
 
-    def test_positive(self, C):
+    @given(
+        st.lists(nested_classes, min_size=1, max_size=3),
+        st.sampled_from(MAPPING_TYPES),
+        st.booleans(),
+        st.booleans(),
+        st.booleans(),
+    )
+    def test_like_asdict(
+        self, classes, dict_class, recurse, retain, use_hooks
+    ):
+        """
+        The rows are the same as calling asdict on each instance, also for
+        mixed classes.
+        """
+        kw = {
+            "recurse": recurse,
+            "dict_factory": dict_class,
+            "retain_collection_types": retain,
+        }
+        if use_hooks:
+            kw["filter"] = lambda a, v: a.name != "a"
+            kw["value_serializer"] = lambda inst, a, v: v
+
+        insts = [cls() for cls in classes for _ in range(2)]
+
+        assert [asdict(i, **kw) for i in insts] == asdict_many(insts, **kw)
+
+    @pytest.mark.parametrize("use_hooks", [True, False])
+    @pytest.mark.parametrize("recurse", [True, False])
+    def test_columnar(self, C, use_hooks, recurse):
         """
-        Returns `True` on decorated classes.
+        If columnar is True, the values of each attribute are collected in a
+        list.
         """
-        assert has(C)
+        kw = {"filter": lambda a, v: True} if use_hooks else {}
+        insts = [C(1, C(2, 3)), C(4, [C(5, 6)])]
 
-    def test_positive_empty(self):
+        assert {
+            "x": [1, 4],
+            "y": [C(2, 3), [C(5, 6)]]
+            if not recurse
+            else [{"x": 2, "y": 3}, [{"x": 5, "y": 6}]],
+        } == asdict_many(insts, columnar=True, recurse=recurse, **kw)
+
+    def test_columnar_iterator(self, C):
         """
-        Returns `True` on decorated classes even if there are no attributes.
+        Instances can be passed as any iterable.
         """
+        rv = asdict_many(
+            (C(i, str(i)) for i in range(3)),
+            columnar=True,
+            dict_factory=OrderedDict,
+        )
 
-        @attr.s
-        class D:
-            pass
-
-        assert has(D)
+        assert OrderedDict([("x", [0, 1, 2]), ("y", ["0", "1", "2"])]) == rv
+        assert isinstance(rv, OrderedDict)
 
-    def test_negative(self):
+    def test_columnar_empty(self, C):
         """
-        Returns `False` on non-decorated classes.
+        No instances mean no columns.
         """
-        assert not has(object)
+        assert {} == asdict_many([], columnar=True)
+        assert [] == asdict_many(iter([]))
 
-    def test_generics(self):
+    def test_columnar_mixed(self, C):
         """
-        Works with generic classes.
+        Instances of different classes can be mixed if they have the same
+        keys.
         """
-        T = TypeVar("T")
+        D = attr.make_class("D", ["x", "y"])
 
-        @attr.define
-        class A(Generic[T]):
-            a: T
+        assert {"x": [1, 3], "y": [2, 4]} == asdict_many(
+            [C(1, 2), D(3, 4)], columnar=True
+        )
 
-        assert has(A)
+    def test_columnar_different_keys(self, C):
+        """
+        Rows with different keys can't be turned into columns.
+        """
+        D = attr.make_class("D", ["x"])
 
-        assert has(A[str])
-        # Verify twice, since there's caching going on.
-        assert has(A[str])
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "Instance 1 has the keys ['x'] but instance 0 has ['x', 'y']."
+            ),
+        ):
+            asdict_many([C(1, 2), D(3)], columnar=True)
 
-    def test_generics_negative(self):
+        with pytest.raises(ValueError, match="Instance 1 has the keys"):
+            asdict_many(
+                [C(1, 2), C(3, 4)],
+                columnar=True,
+                filter=lambda a, v: v != 4,
+            )
+
+    def test_deep(self):
         """
-        Returns `False` on non-decorated generic classes.
+        Instances that are nested too deeply for recursion are converted,
+        also in columns.
         """
-        T = TypeVar("T")
+        depth = sys.getrecursionlimit() + 100
+        node = Node(0)
+        for i in range(1, depth):
+            node = Node(i, [node])
 
-        class A(Generic[T]):
-            a: T
+        for rv in (
+            asdict_many([node])[0],
+            asdict_many([node], columnar=True)["children"][0][0],
+        ):
+            d = rv
+            while d["children"]:
+                (d,) = d["children"]
 
-        assert not has(A)
+            assert {"value": 0, "children": [], "parent": None} == d
 
-        assert not has(A[str])
-        # Verify twice, since there's caching going on.
-        assert not has(A[str])
+    def test_not_an_attrs_instance(self, C):
+        """
+        Raises NotAnAttrsClassError for instances of other classes.
+        """
+        for columnar in (True, False):
+            with pytest.raises(NotAnAttrsClassError):
+                asdict_many([C(1, 2), object()], columnar=columnar)
 
 
-class TestAssoc:
+class TestAsMapping:
     """
-    Tests for `assoc`.
+    Tests for `as_mapping`.
     """
 
-    @given(slots=st.booleans(), frozen=st.booleans())
-    def test_empty(self, slots, frozen):
+    @given(simple_classes())
+    def test_like_asdict(self, cls):
         """
-        Empty classes without changes get copied.
+        The view has the same keys, values, and order as asdict without
+        recursion.
         """
+        inst = cls()
+        m = as_mapping(inst)
 
-        @attr.s(slots=slots, frozen=frozen)
-        class C:
-            pass
+        assert asdict(inst, recurse=False) == dict(m)
+        assert list(asdict(inst, recurse=False)) == list(m)
+        assert len(fields(cls)) == len(m)
+        assert isinstance(m, Mapping)
 
-        i1 = C()
-        i2 = assoc(i1)
+    def test_lazy(self, C):
+        """
+        Values are read when they're accessed, so the view reflects changes
+        of the instance.
+        """
+        inst = C(1, 2)
+        m = as_mapping(inst)
 
-        assert i1 is not i2
-        assert i1 == i2
+        inst.x = 42
 
-    @given(simple_classes())
-    def test_no_changes(self, C):
+        assert 42 == m["x"]
+        assert {"x": 42, "y": 2} == m
+
+    def test_keys(self):
         """
-        No changes means a verbatim copy.
+        Only attribute names are keys, even if the attribute tuple class has
+        other attributes with the same name.
         """
-        i1 = C()
-        i2 = assoc(i1)
+
+        @attr.s
+        class C:
+            count = attr.ib(default=1)
+            x = attr.ib(default=2)
+
+        m = as_mapping(C())
+
+        assert 1 == m["count"]
+        assert "count" in m
+        for key in ("index", "__len__", "__class__", "z", 1, None, ("x",)):
+            assert key not in m
+            assert m.get(key) is None
+
+            with pytest.raises(KeyError):
+                m[key]
+
+    def test_slots_unset(self):
+        """
+        Accessing unset attributes raises AttributeError like getattr.
+        """
+
+        @attr.s(slots=True)
+        class C:
+            x = attr.ib(init=False)
+
+        m = as_mapping(C())
+
+        assert "x" in m
+
+        with pytest.raises(AttributeError):
+            m["x"]
+
+    @pytest.mark.parametrize("recurse", [True, False])
+    def test_recurse(self, C, recurse):
+        """
+        Nested instances are wrapped in views if recurse is True but
+        collections are left alone.
+        """
+        inner = C(1, [C(2, 3)])
+        m = as_mapping(C(inner, None), recurse=recurse)
+
+        if recurse:
+            assert {"x": 1, "y": [C(2, 3)]} == m["x"]
+            assert "as_mapping(C(x=1, y=[C(x=2, y=3)]))" == repr(m["x"])
+        else:
+            assert inner is m["x"]
+
+    def test_repr(self, C):
+        """
+        The repr shows the instance.
+        """
+        assert "as_mapping(C(x=1, y=2))" == repr(as_mapping(C(1, 2)))
+
+    def test_read_only(self, C):
+        """
+        The view can't be changed.
+        """
+        m = as_mapping(C(1, 2))
+
+        with pytest.raises(TypeError):
+            m["x"] = 42
+
+        with pytest.raises(AttributeError):
+            m.foo = 42
+
+    def test_not_an_attrs_instance(self):
+        """
+        Raises NotAnAttrsClassError for instances of other classes.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            as_mapping(object())
+
+
+class TestPlannedFilters:
+    """
+    Tests for applying `attr.filters.include` and `attr.filters.exclude` in
+    the generated functions of `asdict`, `astuple`, and `asdict_many`.
+    """
+
+    FILTERS = [
+        include("a", "c"),
+        include(int, str),
+        include(int, "b"),
+        include(),
+        exclude("a"),
+        exclude(int, "b"),
+        exclude(str),
+        exclude(),
+    ]
+
+    @given(
+        nested_classes,
+        st.sampled_from(FILTERS),
+        st.booleans(),
+        st.booleans(),
+        st.sampled_from(MAPPING_TYPES),
+    )
+    def test_like_called(self, cls, filter, recurse, retain, dict_factory):
+        """
+        The results are the same as if the filter is called for each value.
+        """
+        inst = cls()
+        kw = {"recurse": recurse, "retain_collection_types": retain}
+
+        def called(a, v):
+            return filter(a, v)
+
+        assert asdict(
+            inst, filter=called, dict_factory=dict_factory, **kw
+        ) == asdict(inst, filter=filter, dict_factory=dict_factory, **kw)
+        assert astuple(inst, filter=called, **kw) == astuple(
+            inst, filter=filter, **kw
+        )
+        assert asdict_many([inst], filter=called, **kw) == asdict_many(
+            [inst], filter=filter, **kw
+        )
+
+    @pytest.mark.parametrize(
+        "make_filter",
+        [
+            lambda: include("value", "children"),
+            lambda: include(int, list),
+            lambda: exclude(attr.fields(Node).parent),
+            lambda: exclude(type(None)),
+        ],
+    )
+    def test_not_called(self, monkeypatch, make_filter):
+        """
+        Once a filter is used again, it isn't called but planned once per
+        class.
+        """
+        filter = make_filter()
+        inst = Node(1, [Node(2)])
+
+        def convert():
+            assert {
+                "value": 1,
+                "children": [{"value": 2, "children": []}],
+            } == asdict(inst, filter=filter)
+            assert [1, [[2, []]]] == astuple(
+                inst, filter=filter, tuple_factory=list
+            )
+            assert {
+                "value": [1],
+                "children": [[{"value": 2, "children": []}]],
+            } == asdict_many([inst], filter=filter, columnar=True)
+
+        convert()
+        monkeypatch.setattr(type(filter), "__call__", pytest.fail)
+        convert()
+
+    def test_columnar_mixed(self, C):
+        """
+        Columns are collected from rows if some values are only included
+        depending on their types.
+        """
+        with pytest.raises(ValueError, match="Instance 1 has the keys"):
+            asdict_many(
+                [C(1, 2), C(3, "4")], filter=include(int), columnar=True
+            )
+
+        assert {"x": [1, 3], "y": [2, 4]} == asdict_many(
+            [C(1, 2), C(3, 4)], filter=include(int), columnar=True
+        )
+
+    def test_cached_per_filter(self):
+        """
+        Equal filters share the generated functions, which are only
+        generated once a filter is used again.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        asdict(C(1), filter=include("x"))
+        asdict(C(1), filter=include("x"))
+        asdict(C(1), filter=exclude("x"))
+
+        assert 1 == len(C.__attrs_serializers__)
+
+        asdict(C(1), filter=exclude("x"))
+
+        assert 2 == len(C.__attrs_serializers__)
+
+    def test_filters_per_call(self):
+        """
+        Filters that are created for every call don't generate functions.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        for i in range(50):
+            assert {"x": 1} == asdict(C(1), filter=exclude(f"y{i}"))
+            assert (1,) == astuple(C(1), filter=exclude(f"y{i}"))
+
+        assert "__attrs_serializers__" not in C.__dict__
+
+    def test_cache_bounded(self):
+        """
+        Only the most recently generated functions for filters are cached.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        filters = [exclude(f"y{i}") for i in range(_HOOKED_MAXSIZE + 10)]
+        for filter in filters:
+            asdict(C(1), filter=filter)
+            asdict(C(1), filter=filter)
+
+        assert [
+            (C, "asdict", True, False, True, filter, None)
+            for filter in filters[-_HOOKED_MAXSIZE:]
+        ] == list(C.__attrs_serializers__)
+
+    def test_other_filters_called(self, C):
+        """
+        Subclasses of the filters are called because they may behave
+        differently.
+        """
+        calls = []
+
+        class Include(type(include())):
+            __slots__ = ()
+
+            def __call__(self, a, v):
+                calls.append(a.name)
+                return True
+
+        assert {"x": 1, "y": 2} == asdict(
+            C(1, 2), filter=Include(frozenset(), frozenset(), frozenset())
+        )
+        assert ["x", "y"] == calls
+
+
+@attr.s
+class Typed:
+    """
+    A class with typed attributes for planning value serializers.
+    """
+
+    i: int = attr.ib(default=1)
+    s: typing.Optional[str] = attr.ib(default="s")
+    f: float = attr.ib(default=1.5)
+    items: typing.List[float] = attr.ib(factory=lambda: [1, 2.5, "x"])
+    tags: typing.Dict[str, int] = attr.ib(factory=lambda: {"a": 1})
+    node: typing.Optional[Typed] = attr.ib(default=None)
+    other = attr.ib(default=(1, "o"))
+
+
+attr.resolve_types(Typed)
+
+
+class TestPlannedSerializers:
+    """
+    Tests for calling `attr.serializers.by_type` in the generated functions
+    of `asdict` and `asdict_many`.
+    """
+
+    SERIALIZERS = [
+        by_type({int: str}),
+        by_type({str: str.upper, float: repr}),
+        by_type({object: repr}),
+        by_type({}),
+    ]
+
+    @given(
+        nested_classes,
+        st.sampled_from(SERIALIZERS),
+        st.sampled_from([None, include(int), exclude("a")]),
+        st.booleans(),
+        st.booleans(),
+        st.sampled_from(MAPPING_TYPES),
+    )
+    def test_like_called(
+        self, cls, value_serializer, filter, recurse, retain, dict_factory
+    ):
+        """
+        The results are the same as if the serializer is called for each
+        value.
+        """
+        inst = cls()
+        kw = {
+            "filter": filter,
+            "recurse": recurse,
+            "retain_collection_types": retain,
+            "dict_factory": dict_factory,
+        }
+
+        def called(inst, a, v):
+            return value_serializer(inst, a, v)
+
+        assert asdict(inst, value_serializer=called, **kw) == asdict(
+            inst, value_serializer=value_serializer, **kw
+        )
+        assert asdict_many(
+            [inst], value_serializer=called, columnar=True, **kw
+        ) == asdict_many(
+            [inst], value_serializer=value_serializer, columnar=True, **kw
+        )
+
+    @pytest.mark.parametrize("value_serializer", SERIALIZERS)
+    @pytest.mark.parametrize("recurse", [True, False])
+    def test_typed_like_called(self, value_serializer, recurse):
+        """
+        The results for classes with typed attributes are the same as if the
+        serializer is called for each value, also for values that don't
+        match the types.
+        """
+        inst = Typed(node=Typed(i="not an int", s=2, f=None))
+
+        def called(inst, a, v):
+            return value_serializer(inst, a, v)
+
+        assert asdict(
+            inst, recurse=recurse, value_serializer=called
+        ) == asdict(inst, recurse=recurse, value_serializer=value_serializer)
+
+    def test_not_called(self, monkeypatch):
+        """
+        Once it's used again, the serializer isn't called for values of the
+        declared classes of attributes that aren't in the table.
+        """
+        calls = []
+        value_serializer = by_type({float: str})
+        call = type(value_serializer).__call__
+
+        def spy(self, inst, a, v):
+            calls.append(v if a is None else a.name)
+            return call(self, inst, a, v)
+
+        asdict(Typed(), value_serializer=value_serializer)
+        monkeypatch.setattr(type(value_serializer), "__call__", spy)
+
+        assert {
+            "i": 1,
+            "s": "s",
+            "f": "1.5",
+            "items": [1, "2.5", "x"],
+            "tags": {"a": 1},
+            "node": None,
+            "other": [1, "o"],
+        } == asdict(Typed(), value_serializer=value_serializer)
+        # other isn't typed, so it's unknown what it is.
+        assert ["f", 1, 2.5, "x", "a", 1, "other", 1, "o"] == calls
+
+    def test_cached_per_serializer(self):
+        """
+        Equal serializers share the generated functions, which are only
+        generated once a serializer is used again.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        asdict(C(1), value_serializer=by_type({int: str}))
+        asdict(C(1), value_serializer=by_type({int: str}))
+        asdict(C(1), value_serializer=by_type({int: repr}))
+
+        assert 1 == len(C.__attrs_serializers__)
+
+    def test_serializers_per_call(self):
+        """
+        Serializers that are created for every call don't generate functions,
+        also if their functions can't be hashed.
+        """
+
+        @attr.s
+        class C:
+            x: int = attr.ib()
+            y: float = attr.ib()
+
+        for i in range(50):
+            assert {"x": str(i), "y": 1.0} == asdict(
+                C(i, 1.0), value_serializer=by_type({int: lambda v: f"{v}"})
+            )
+            assert {"x": i, "y": 1.0} == asdict(
+                C(i, 1.0), value_serializer=by_type({list: [].copy})
+            )
+
+        assert "__attrs_serializers__" not in C.__dict__
+
+    def test_other_serializers_called(self, C):
+        """
+        Subclasses of the serializer are called as they are because they may
+        behave differently.
+        """
+
+        class ByType(type(by_type({}))):
+            __slots__ = ()
+
+            def __call__(self, inst, a, v):
+                return a.name
+
+        assert {"x": "x", "y": "y"} == asdict(
+            C(1, 2), recurse=False, value_serializer=ByType({}, None)
+        )
+
+
+class TestAsTuple:
+    """
+    Tests for `astuple`.
+    """
+
+    @given(st.sampled_from(SEQUENCE_TYPES))
+    def test_shallow(self, C, tuple_factory):
+        """
+        Shallow astuple returns correct dict.
+        """
+        assert tuple_factory([1, 2]) == astuple(
+            C(x=1, y=2), False, tuple_factory=tuple_factory
+        )
+
+    @given(st.sampled_from(SEQUENCE_TYPES))
+    def test_recurse(self, C, tuple_factory):
+        """
+        Deep astuple returns correct tuple.
+        """
+        assert tuple_factory(
+            [tuple_factory([1, 2]), tuple_factory([3, 4])]
+        ) == astuple(C(C(1, 2), C(3, 4)), tuple_factory=tuple_factory)
+
+    @given(nested_classes, st.sampled_from(SEQUENCE_TYPES))
+    def test_recurse_property(self, cls, tuple_class):
+        """
+        Property tests for recursive astuple.
+        """
+        obj = cls()
+        obj_tuple = astuple(obj, tuple_factory=tuple_class)
+
+        def assert_proper_tuple_class(obj, obj_tuple):
+            assert isinstance(obj_tuple, tuple_class)
+            for index, field in enumerate(fields(obj.__class__)):
+                field_val = getattr(obj, field.name)
+                if has(field_val.__class__):
+                    # This field holds a class, recurse the assertions.
+                    assert_proper_tuple_class(field_val, obj_tuple[index])
+
+        assert_proper_tuple_class(obj, obj_tuple)
+
+    @given(nested_classes, st.sampled_from(SEQUENCE_TYPES))
+    def test_recurse_retain(self, cls, tuple_class):
+        """
+        Property tests for asserting collection types are retained.
+        """
+        obj = cls()
+        obj_tuple = astuple(
+            obj, tuple_factory=tuple_class, retain_collection_types=True
+        )
+
+        def assert_proper_col_class(obj, obj_tuple):
+            # Iterate over all attributes, and if they are lists or mappings
+            # in the original, assert they are the same class in the dumped.
+            for index, field in enumerate(fields(obj.__class__)):
+                field_val = getattr(obj, field.name)
+                if has(field_val.__class__):
+                    # This field holds a class, recurse the assertions.
+                    assert_proper_col_class(field_val, obj_tuple[index])
+                elif isinstance(field_val, (list, tuple)):
+                    # This field holds a sequence of something.
+                    expected_type = type(obj_tuple[index])
+                    assert type(field_val) is expected_type
+                    for obj_e, obj_tuple_e in zip(field_val, obj_tuple[index]):
+                        if has(obj_e.__class__):
+                            assert_proper_col_class(obj_e, obj_tuple_e)
+                elif isinstance(field_val, dict):
+                    orig = field_val
+                    tupled = obj_tuple[index]
+                    assert type(orig) is type(tupled)
+                    for obj_e, obj_tuple_e in zip(
+                        orig.items(), tupled.items()
+                    ):
+                        if has(obj_e[0].__class__):  # Dict key
+                            assert_proper_col_class(obj_e[0], obj_tuple_e[0])
+                        if has(obj_e[1].__class__):  # Dict value
+                            assert_proper_col_class(obj_e[1], obj_tuple_e[1])
+
+        assert_proper_col_class(obj, obj_tuple)
+
+    @given(st.sampled_from(SEQUENCE_TYPES))
+    def test_filter(self, C, tuple_factory):
+        """
+        Attributes that are supposed to be skipped are skipped.
+        """
+        assert tuple_factory([tuple_factory([1])]) == astuple(
+            C(C(1, 2), C(3, 4)),
+            filter=lambda a, v: a.name != "y",
+            tuple_factory=tuple_factory,
+        )
+
+    @given(container=st.sampled_from(SEQUENCE_TYPES))
+    def test_lists_tuples(self, container, C):
+        """
+        If recurse is True, also recurse into lists.
+        """
+        assert (1, [(2, 3), (4, 5), "a"]) == astuple(
+            C(1, container([C(2, 3), C(4, 5), "a"]))
+        )
+
+    @given(st.sampled_from(SEQUENCE_TYPES))
+    def test_dicts(self, C, tuple_factory):
+        """
+        If recurse is True, also recurse into dicts.
+        """
+        res = astuple(C(1, {"a": C(4, 5)}), tuple_factory=tuple_factory)
+        assert tuple_factory([1, {"a": tuple_factory([4, 5])}]) == res
+        assert isinstance(res, tuple_factory)
+
+    @given(container=st.sampled_from(SEQUENCE_TYPES))
+    def test_lists_tuples_retain_type(self, container, C):
+        """
+        If recurse and retain_collection_types are True, also recurse
+        into lists and do not convert them into list.
+        """
+        assert (1, container([(2, 3), (4, 5), "a"])) == astuple(
+            C(1, container([C(2, 3), C(4, 5), "a"])),
+            retain_collection_types=True,
+        )
+
+    @given(container=st.sampled_from(MAPPING_TYPES))
+    def test_dicts_retain_type(self, container, C):
+        """
+        If recurse and retain_collection_types are True, also recurse
+        into lists and do not convert them into list.
+        """
+        assert (1, container({"a": (4, 5)})) == astuple(
+            C(1, container({"a": C(4, 5)})), retain_collection_types=True
+        )
+
+    @given(simple_classes(), st.sampled_from(SEQUENCE_TYPES))
+    def test_roundtrip(self, cls, tuple_class):
+        """
+        Test dumping to tuple and back for Hypothesis-generated classes.
+        """
+        instance = cls()
+        tuple_instance = astuple(instance, tuple_factory=tuple_class)
+
+        assert isinstance(tuple_instance, tuple_class)
+
+        roundtrip_instance = cls(*tuple_instance)
+
+        assert instance == roundtrip_instance
+
+    @given(set_type=st.sampled_from((set, frozenset)))
+    def test_sets_no_retain(self, C, set_type):
+        """
+        Set types are converted to lists if retain_collection_types=False.
+        """
+        d = astuple(
+            C(1, set_type((1, 2, 3))),
+            retain_collection_types=False,
+            recurse=True,
+        )
+
+        assert (1, [1, 2, 3]) == d
+
+    def test_named_tuple_retain_type(self):
+        """
+        Namedtuples can be serialized if retain_collection_types is True.
+
+        See #1164
+        """
+
+        class Coordinates(NamedTuple):
+            lat: float
+            lon: float
+
+        @attr.s
+        class A:
+            coords: Coordinates = attr.ib()
+
+        instance = A(Coordinates(50.419019, 30.516225))
+
+        assert (Coordinates(50.419019, 30.516225),) == attr.astuple(
+            instance, retain_collection_types=True
+        )
+
+    def test_type_error_with_retain_type(self):
+        """
+        Serialization that fails with TypeError leaves the error through if
+        they're not tuples.
+
+        See #1164
+        """
+
+        message = "__new__() missing 1 required positional argument (astuple)"
+
+        class Coordinates(list):
+            def __init__(self, first, *rest):
+                if isinstance(first, list):
+                    raise TypeError(message)
+                super().__init__([first, *rest])
+
+        @attr.s
+        class A:
+            coords: Coordinates = attr.ib()
+
+        instance = A(Coordinates(50.419019, 30.516225))
+
+        with pytest.raises(TypeError, match=re.escape(message)):
+            attr.astuple(instance, retain_collection_types=True)
+
+    @pytest.mark.parametrize(
+        "tuple_factory", [tuple, list, lambda items: ("f", *items)]
+    )
+    @pytest.mark.parametrize("recurse", [True, False])
+    def test_generated(self, tuple_factory, recurse):
+        """
+        The generated functions are cached on the class and build the same
+        results for all kinds of tuple factories.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        @attr.s
+        class D:
+            c = attr.ib()
+            y = attr.ib(default=2)
+
+        c = C(1)
+        inner = tuple_factory([1]) if recurse else c
+
+        assert tuple_factory([inner, 2]) == astuple(
+            D(c), recurse=recurse, tuple_factory=tuple_factory
+        )
+        assert tuple_factory([1]) == astuple(c, tuple_factory=tuple_factory)
+        assert 1 == len(D.__attrs_serializers__)
+
+    def test_empty(self):
+        """
+        Classes without attributes become empty tuples.
+        """
+
+        @attr.s
+        class C:
+            pass
+
+        assert () == astuple(C())
+        assert () == astuple(C(), recurse=False)
+
+    @pytest.mark.parametrize("retain", [True, False])
+    def test_annotations_not_trusted(self, retain):
+        """
+        Values that don't match the declared types are converted all the
+        same.
+        """
+
+        @attr.s(frozen=True)
+        class Inner:
+            y: int = attr.ib()
+
+        @attr.s
+        class C:
+            a: int = attr.ib()
+            b: list = attr.ib()
+            c: dict = attr.ib()
+            d: Inner = attr.ib()
+
+        inst = C(Inner(1), (Inner(2), 3), {Inner(4): Inner(5)}, 6)
+
+        assert (
+            (1,),
+            ((2,), 3) if retain else [(2,), 3],
+            {(4,): (5,)},
+            6,
+        ) == astuple(inst, retain_collection_types=retain)
+
+    def test_not_an_attrs_class_not_cached(self):
+        """
+        Instances of non-attrs classes raise an error and leave no cache.
+        """
+
+        class C:
+            pass
+
+        with pytest.raises(NotAnAttrsClassError):
+            astuple(C())
+
+        assert not hasattr(C, "__attrs_serializers__")
+
+
+class TestHas:
+    """
+    Tests for `has`.
+    """
+
+    def test_positive(self, C):
+        """
+        Returns `True` on decorated classes.
+        """
+        assert has(C)
+
+    def test_positive_empty(self):
+        """
+        Returns `True` on decorated classes even if there are no attributes.
+        """
+
+        @attr.s
+        class D:
+            pass
+
+        assert has(D)
+
+    def test_negative(self):
+        """
+        Returns `False` on non-decorated classes.
+        """
+        assert not has(object)
+
+    def test_generics(self):
+        """
+        Works with generic classes.
+        """
+        T = TypeVar("T")
+
+        @attr.define
+        class A(Generic[T]):
+            a: T
+
+        assert has(A)
+
+        assert has(A[str])
+        # Verify twice, since there's caching going on.
+        assert has(A[str])
+
+    def test_generics_negative(self):
+        """
+        Returns `False` on non-decorated generic classes.
+        """
+        T = TypeVar("T")
+
+        class A(Generic[T]):
+            a: T
+
+        assert not has(A)
+
+        assert not has(A[str])
+        # Verify twice, since there's caching going on.
+        assert not has(A[str])
+
+
+class TestAssoc:
+    """
+    Tests for `assoc`.
+    """
+
+    @given(slots=st.booleans(), frozen=st.booleans())
+    def test_empty(self, slots, frozen):
+        """
+        Empty classes without changes get copied.
+        """
+
+        @attr.s(slots=slots, frozen=frozen)
+        class C:
+            pass
+
+        i1 = C()
+        i2 = assoc(i1)
+
+        assert i1 is not i2
+        assert i1 == i2
+
+    @given(simple_classes())
+    def test_no_changes(self, C):
+        """
+        No changes means a verbatim copy.
+        """
+        i1 = C()
+        i2 = assoc(i1)
+
+        assert i1 is not i2
+        assert i1 == i2
+
+    @given(simple_classes(), st.data())
+    def test_change(self, C, data):
+        """
+        Changes work.
+        """
+        # Take the first attribute, and change it.
+        assume(fields(C))  # Skip classes with no attributes.
+        field_names = [a.name for a in fields(C)]
+        original = C()
+        chosen_names = data.draw(st.sets(st.sampled_from(field_names)))
+        change_dict = {name: data.draw(st.integers()) for name in chosen_names}
+
+        changed = assoc(original, **change_dict)
+
+        for k, v in change_dict.items():
+            assert getattr(changed, k) == v
+
+    @given(simple_classes())
+    def test_unknown(self, C):
+        """
+        Wanting to change an unknown attribute raises an
+        AttrsAttributeNotFoundError.
+        """
+        # No generated class will have a four letter attribute.
+        with pytest.raises(AttrsAttributeNotFoundError) as e:
+            assoc(C(), aaaa=2)
+
+        assert (f"aaaa is not an attrs attribute on {C!r}.",) == e.value.args
+
+    def test_frozen(self):
+        """
+        Works on frozen classes.
+        """
+
+        @attr.s(frozen=True)
+        class C:
+            x = attr.ib()
+            y = attr.ib()
+
+        assert C(3, 2) == assoc(C(1, 2), x=3)
+
+
+class TestEvolve:
+    """
+    Tests for `evolve`.
+    """
+
+    @given(slots=st.booleans(), frozen=st.booleans())
+    def test_empty(self, slots, frozen):
+        """
+        Empty classes without changes get copied.
+        """
+
+        @attr.s(slots=slots, frozen=frozen)
+        class C:
+            pass
+
+        i1 = C()
+        i2 = evolve(i1)
+
+        assert i1 is not i2
+        assert i1 == i2
+
+    @given(simple_classes())
+    def test_no_changes(self, C):
+        """
+        No changes means a verbatim copy.
+        """
+        i1 = C()
+        i2 = evolve(i1)
 
         assert i1 is not i2
         assert i1 == i2
 
-    @given(simple_classes(), st.data())
-    def test_change(self, C, data):
+    @given(simple_classes(), st.data())
+    def test_change(self, C, data):
+        """
+        Changes work.
+        """
+        # Take the first attribute, and change it.
+        assume(fields(C))  # Skip classes with no attributes.
+        field_names = [a.name for a in fields(C)]
+        original = C()
+        chosen_names = data.draw(st.sets(st.sampled_from(field_names)))
+        # We pay special attention to private attributes, they should behave
+        # like in `__init__`.
+        change_dict = {
+            name.replace("_", ""): data.draw(st.integers())
+            for name in chosen_names
+        }
+        changed = evolve(original, **change_dict)
+        for name in chosen_names:
+            assert getattr(changed, name) == change_dict[name.replace("_", "")]
+
+    @given(simple_classes())
+    def test_unknown(self, C):
+        """
+        Wanting to change an unknown attribute raises an
+        AttrsAttributeNotFoundError.
+        """
+        # No generated class will have a four letter attribute.
+        with pytest.raises(TypeError) as e:
+            evolve(C(), aaaa=2)
+
+        if hasattr(C, "__attrs_init__"):
+            expected = (
+                "__attrs_init__() got an unexpected keyword argument 'aaaa'"
+            )
+        else:
+            expected = "__init__() got an unexpected keyword argument 'aaaa'"
+
+        assert e.value.args[0].endswith(expected)
+
+    def test_validator_failure(self):
+        """
+        TypeError isn't swallowed when validation fails within evolve.
+        """
+
+        @attr.s
+        class C:
+            a = attr.ib(validator=instance_of(int))
+
+        with pytest.raises(TypeError) as e:
+            evolve(C(a=1), a="some string")
+        m = e.value.args[0]
+
+        assert m.startswith("'a' must be <class 'int'>")
+
+    def test_private(self):
+        """
+        evolve() acts as `__init__` with regards to private attributes.
+        """
+
+        @attr.s
+        class C:
+            _a = attr.ib()
+
+        assert evolve(C(1), a=2)._a == 2
+
+        with pytest.raises(TypeError):
+            evolve(C(1), _a=2)
+
+        with pytest.raises(TypeError):
+            evolve(C(1), a=3, _a=2)
+
+    def test_non_init_attrs(self):
+        """
+        evolve() handles `init=False` attributes.
+        """
+
+        @attr.s
+        class C:
+            a = attr.ib()
+            b = attr.ib(init=False, default=0)
+
+        assert evolve(C(1), a=2).a == 2
+
+    def test_regression_attrs_classes(self):
+        """
+        evolve() can evolve fields that are instances of attrs classes.
+
+        Regression test for #804
+        """
+
+        @attr.s
+        class Cls1:
+            param1 = attr.ib()
+
+        @attr.s
+        class Cls2:
+            param2 = attr.ib()
+
+        obj2a = Cls2(param2="a")
+        obj2b = Cls2(param2="b")
+
+        obj1a = Cls1(param1=obj2a)
+
+        assert Cls1(param1=Cls2(param2="b")) == attr.evolve(
+            obj1a, param1=obj2b
+        )
+
+    def test_dicts(self):
+        """
+        evolve() can replace an attrs class instance with a dict.
+
+        See #806
+        """
+
+        @attr.s
+        class Cls1:
+            param1 = attr.ib()
+
+        @attr.s
+        class Cls2:
+            param2 = attr.ib()
+
+        obj2a = Cls2(param2="a")
+        obj2b = {"foo": 42, "param2": 42}
+
+        obj1a = Cls1(param1=obj2a)
+
+        assert Cls1({"foo": 42, "param2": 42}) == attr.evolve(
+            obj1a, param1=obj2b
+        )
+
+    def test_no_inst(self):
+        """
+        Missing inst argument raises a TypeError like Python would.
+        """
+        with pytest.raises(
+            TypeError, match=r"evolve\(\) takes 1 positional argument"
+        ):
+            evolve(x=1)
+
+    def test_too_many_pos_args(self):
+        """
+        More than one positional argument raises a TypeError like Python would.
+        """
+        with pytest.raises(
+            TypeError,
+            match=r"evolve\(\) takes 1 positional argument, but 2 were given",
+        ):
+            evolve(1, 2)
+
+    def test_can_change_inst(self):
+        """
+        If the instance is passed by positional argument, a field named `inst`
+        can be changed.
+        """
+
+        @attr.define
+        class C:
+            inst: int
+
+        assert C(42) == evolve(C(23), inst=42)
+
+
+class TestFromRows:
+    """
+    Tests for `from_rows`.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_like_init(self, slots, frozen, lazy):
+        """
+        Rows are converted, validated, and initialized like calling the class
+        with them.
+        """
+        calls = []
+
+        @attr.s(slots=slots, frozen=frozen, cache_hash=frozen, hash=frozen)
+        class C:
+            x = attr.ib(converter=int, validator=instance_of(int))
+            y = attr.ib(factory=tuple, converter=tuple)
+            _z = attr.ib(default=3, kw_only=True)
+            w = attr.ib(init=False, default="w")
+
+            def __attrs_pre_init__(self, x, y, *, z):
+                calls.append(("pre", x, y, z))
+
+            def __attrs_post_init__(self):
+                calls.append(("post", self.x))
+
+        rows = [("1", [1]), (2,), (3, [])]
+        expected = [C(*row) for row in rows]
+        init_calls = calls[:]
+        calls.clear()
+
+        result = from_rows(C, rows, lazy=lazy)
+
+        assert expected == list(result)
+        assert init_calls == calls
+        if frozen:
+            assert [hash(i) for i in expected] == [
+                hash(i) for i in from_rows(C, rows)
+            ]
+
+    def test_lazy(self):
+        """
+        lazy=True returns a generator that consumes the rows on demand.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+        rows = iter([(1,), (2,)])
+        it = from_rows(C, rows, lazy=True)
+
+        assert C(1) == next(it)
+        assert [(2,)] == list(rows)
+        assert [] == list(it)
+
+    def test_validate(self):
+        """
+        Invalid rows raise the errors of the validators unless validate is
+        False.
+        """
+
+        @attr.define
+        class C:
+            x: int = attr.field(validator=instance_of(int))
+
+        with pytest.raises(TypeError, match="'x' must be <class 'int'>"):
+            from_rows(C, [(1,), ("2",)])
+
+        assert [C(1), trusted(C)("2")] == from_rows(
+            C, [(1,), ("2",)], validate=False
+        )
+
+    def test_wrong_length(self):
+        """
+        Rows with too many or too few values raise a TypeError that isn't
+        chained to the failed unpacking.
+        """
+
+        @attr.define
+        class C:
+            x: int
+            y: int = 2
+
+        for row in [(), (1, 2, 3)]:
+            with pytest.raises(
+                TypeError,
+                match=r"C\(\) takes from 1 to 2 positional arguments but a "
+                f"row has {len(row)} values.",
+            ) as ei:
+                from_rows(C, [row])
+
+            assert None is ei.value.__context__
+
+    def test_short_rows(self):
+        """
+        Rows that are shorter than the positional arguments get the defaults
+        and factories of the missing ones, without running validators if
+        validate is False.
+        """
+
+        @attr.define
+        class C:
+            x: int = attr.field(validator=instance_of(int))
+            y: int = attr.field(default=2, validator=instance_of(int))
+            z: list = attr.field(factory=list)
+
+        rows = [("1",), ("1", "2"), ("1", "2", [3])]
+
+        assert [
+            trusted(C)("1", 2, []),
+            trusted(C)("1", "2", []),
+            trusted(C)("1", "2", [3]),
+        ] == from_rows(C, rows, validate=False)
+
+        with pytest.raises(TypeError, match="'x' must be <class 'int'>"):
+            from_rows(C, rows)
+
+    def test_iterable_rows(self):
+        """
+        Rows can be any iterables, including iterators.
+        """
+
+        @attr.define
+        class C:
+            x: int
+            y: int = 2
+
+        assert [C(1, 2), C(3, 4), C(5, 2)] == from_rows(
+            C, [iter([1]), [3, 4], range(5, 6)]
+        )
+
+    def test_custom_new(self):
+        """
+        A custom __new__ gets the values of the row and __init__ only runs
+        for instances of the class, like when calling the class.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+            def __new__(cls, x):
+                if x < 0:
+                    return None
+
+                return super().__new__(cls)
+
+        assert [C(1), None] == from_rows(C, [(1,), (-1,)])
+
+    def test_no_class_attributes(self):
+        """
+        Bulk constructors aren't attached to classes.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+        from_rows(C, [(1,)])
+
+        assert not any("from_rows" in name for name in dir(C))
+
+    def test_mandatory_kw_only(self):
+        """
+        Mandatory keyword-only arguments can't be filled from rows.
+        """
+
+        @attr.define
+        class C:
+            x: int
+            y: int = attr.field(kw_only=True)
+
+        with pytest.raises(TypeError, match="keyword-only argument"):
+            from_rows(C, [(1,)])
+
+    def test_names_of_locals(self):
+        """
+        Attributes may be called like the arguments of the loop.
+        """
+
+        @attr.define
+        class C:
+            cls: int
+            rows: int
+            validate: int
+            lazy: int
+
+        assert [C(1, 2, 3, 4)] == from_rows(C, [(1, 2, 3, 4)])
+
+    def test_custom_init(self):
+        """
+        Classes whose __init__ isn't written by attrs are called.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+            def __init__(self, x):
+                self.__attrs_init__(x * 2)
+
+        class D(attr.make_class("Base", ["x"])):
+            def __init__(self, x):
+                super().__init__(x + 1)
+
+        assert 2 == from_rows(C, [(1,)])[0].x
+        assert 2 == from_rows(D, [(1,)], lazy=True).__next__().x
+
+    def test_custom_init_validate(self):
+        """
+        validate=False is rejected if __init__ isn't written by attrs,
+        because its validators can't be skipped.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+            def __init__(self, x):
+                self.__attrs_init__(x)
+
+        with pytest.raises(
+            ValueError, match="validate=False needs an __init__ written"
+        ):
+            from_rows(C, [(1,)], validate=False)
+
+    def test_not_attrs_class(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            from_rows(object, [])
+
+
+@attr.s
+class Node:
+    """
+    A self-referencing class with string annotations for `from_dict`.
+    """
+
+    value: int = attr.ib()
+    children: typing.List[Node] = attr.ib(factory=list)
+    parent: typing.Optional[Node] = attr.ib(default=None)
+
+
+class TestFromDict:
+    """
+    Tests for `from_dict`.
+    """
+
+    def test_inverse_of_asdict(self):
+        """
+        Nested classes, collections, and optional values are structured such
+        that from_dict(cls, asdict(inst)) == inst.
+        """
+
+        @attr.s(frozen=True)
+        class Inner:
+            x: int = attr.ib()
+            t: typing.Tuple[int, ...] = attr.ib(default=())
+
+        @attr.s
+        class C:
+            inner: Inner = attr.ib()
+            inners: typing.List[Inner] = attr.ib()
+            maybe: typing.Optional[Inner] = attr.ib()
+            by_key: typing.Mapping[str, typing.List[Inner]] = attr.ib()
+            pair: typing.Tuple[Inner, int] = attr.ib()
+            seq: typing.Sequence[Inner] = attr.ib()
+            ints: typing.FrozenSet[int] = attr.ib()
+            s: typing.Set[Inner] = attr.ib()
+            plain: tuple = attr.ib()
+
+        inst = C(
+            Inner(1, (2, 3)),
+            [Inner(2)],
+            None,
+            {"a": [Inner(3)]},
+            (Inner(5), 5),
+            [Inner(6)],
+            frozenset([1, 2]),
+            {Inner(7)},
+            (1, 2),
+        )
+        attr.resolve_types(C, localns=locals())
+
+        assert inst == from_dict(C, asdict(inst))
+
+        inst.maybe = Inner(8)
+
+        assert inst == from_dict(C, asdict(inst))
+
+    def test_dict_keys(self):
+        """
+        Dict keys are structured, too.
+        """
+
+        @attr.s
+        class C:
+            d: typing.Dict[typing.FrozenSet[int], int] = attr.ib()
+
+        assert C({frozenset([1, 2]): 3}) == from_dict(C, {"d": {(1, 2): 3}})
+
+    def test_string_annotations(self):
+        """
+        String annotations are resolved, classes can refer to themselves.
+        """
+        tree = Node(1, [Node(2, [Node(3)])], Node(0))
+
+        assert tree == from_dict(Node, asdict(tree))
+
+    def test_unresolvable(self):
+        """
+        Annotations that can't be resolved raise a NameError.
+        """
+
+        @attr.s
+        class C:
+            x: Nope = attr.ib()  # noqa: F821
+
+        with pytest.raises(NameError):
+            from_dict(C, {"x": 1})
+
+    def test_aliases_and_defaults(self):
+        """
+        Keys are attribute names that are passed to __init__ by their
+        aliases, missing keys use the defaults, and other keys are ignored.
+        """
+
+        @attr.s
+        class C:
+            _x: int = attr.ib()
+            y: typing.List[int] = attr.ib(factory=list)
+            z: int = attr.ib(default=3, alias="zz")
+            w: int = attr.ib(init=False, default=4)
+
+        inst = from_dict(C, {"_x": 1, "z": 5, "w": 6, "other": 7})
+
+        assert C(1, [], 5) == inst
+        assert 4 == inst.w
+
+        with pytest.raises(TypeError, match=r"_x|x"):
+            from_dict(C, {})
+
+    @pytest.mark.parametrize("init", [True, False])
+    def test_kw_only(self, init):
+        """
+        Keyword-only arguments are passed by keyword, even if they come
+        first.  If attrs didn't write __init__, everything is.
+        """
+
+        @attr.s(init=init)
+        class C:
+            x: int = attr.ib(kw_only=True)
+            y: int = attr.ib()
+            z: int = attr.ib(default=3)
+
+            if not init:
+
+                def __init__(self, z=3, *, y, x):
+                    self.x = x
+                    self.y = y
+                    self.z = z
+
+        inst = from_dict(C, {"x": 1, "y": 2, "z": 4})
+
+        assert (1, 2, 4) == (inst.x, inst.y, inst.z)
+
+    def test_structurer_names_dont_collide(self):
+        """
+        The structurers of attributes whose names share prefixes don't
+        overwrite each other.
+        """
+
+        @attr.s
+        class A:
+            a: int = attr.ib()
+
+        @attr.s
+        class B:
+            b: str = attr.ib()
+
+        @attr.s
+        class C:
+            x: typing.Optional[A] = attr.ib()
+            x_o: B = attr.ib()
+            y: typing.List[A] = attr.ib()
+            y_e: typing.Dict[str, B] = attr.ib()
+            y_e_v: typing.Tuple[A, B] = attr.ib()
+
+        attr.resolve_types(C, localns=locals())
+
+        assert C(A(1), B("s"), [A(2)], {"k": B("t")}, (A(3), B("u"))) == (
+            from_dict(
+                C,
+                {
+                    "x": {"a": 1},
+                    "x_o": {"b": "s"},
+                    "y": [{"a": 2}],
+                    "y_e": {"k": {"b": "t"}},
+                    "y_e_v": ({"a": 3}, {"b": "u"}),
+                },
+            )
+        )
+
+    def test_converters(self):
+        """
+        Values of attributes with converters are passed to them as they are.
+        """
+
+        @attr.s
+        class Inner:
+            x: int = attr.ib()
+
+        @attr.s
+        class C:
+            inner: Inner = attr.ib(converter=lambda d: Inner(**d))
+
+        attr.resolve_types(C, localns=locals())
+
+        assert Inner(1) == from_dict(C, {"inner": {"x": 1}}).inner
+
+    def test_left_alone(self):
+        """
+        Values of other types, unions, and unannotated attributes are left
+        alone.
+        """
+
+        @attr.s
+        class Inner:
+            x = attr.ib()
+
+        @attr.s
+        class C:
+            a = attr.ib()
+            b: typing.Union[int, Inner] = attr.ib()
+            c: typing.Optional[int] = attr.ib()
+            d: typing.List[int] = attr.ib()
+            e: typing.Any = attr.ib()
+
+        attr.resolve_types(C, localns=locals())
+        d = [1]
+        inst = from_dict(C, {"a": {"x": 1}, "b": 1, "c": 2, "d": d, "e": 3})
+
+        assert C({"x": 1}, 1, 2, [1], 3) == inst
+        assert d is inst.d
+
+    @pytest.mark.skipif(
+        not hasattr(typing, "Annotated"), reason="Needs typing.Annotated."
+    )
+    def test_annotated(self):
+        """
+        Annotated types are structured like the types they annotate.
+        """
+
+        @attr.s
+        class Inner:
+            x: int = attr.ib()
+
+        @attr.s
+        class C:
+            inner: typing.Annotated[Inner, 42] = attr.ib()
+
+        attr.resolve_types(C, localns={"Inner": Inner})
+
+        assert C(Inner(1)) == from_dict(C, {"inner": {"x": 1}})
+
+    def test_cached(self):
+        """
+        The generated function is cached on the class.
+        """
+
+        @attr.s
+        class C:
+            x: int = attr.ib()
+
+        from_dict(C, {"x": 1})
+        fn = C.__attrs_serializers__[C, "from_dict"]
+
+        assert C(2) == fn({"x": 2})
+
+    def test_not_an_attrs_class(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            from_dict(object, {})
+
+
+class TestFromColumns:
+    """
+    Tests for `from_columns`.
+    """
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_like_init(self, lazy):
+        """
+        The i-th instance is initialized from the i-th value of every column,
+        missing columns use the defaults.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(converter=int, validator=instance_of(int))
+            y = attr.ib(factory=list)
+            z = attr.ib(default=3)
+            w = attr.ib(init=False, default="w")
+
+        result = from_columns(C, {"x": ["1", 2], "z": [4, 5]}, lazy=lazy)
+
+        assert [C(1, z=4), C(2, z=5)] == list(result)
+        assert lazy is not isinstance(result, list)
+
+        a, b = from_columns(C, {"x": [1, 2]})
+
+        assert a.y is not b.y
+
+    def test_validates(self):
         """
-        Changes work.
+        Validators run unless validate is False.
         """
-        # Take the first attribute, and change it.
-        assume(fields(C))  # Skip classes with no attributes.
-        field_names = [a.name for a in fields(C)]
-        original = C()
-        chosen_names = data.draw(st.sets(st.sampled_from(field_names)))
-        change_dict = {name: data.draw(st.integers()) for name in chosen_names}
 
-        changed = assoc(original, **change_dict)
+        @attr.s
+        class C:
+            x = attr.ib(validator=instance_of(int))
 
-        for k, v in change_dict.items():
-            assert getattr(changed, k) == v
+        with pytest.raises(TypeError, match="'x' must be"):
+            from_columns(C, {"x": [1, "2"]})
 
-    @given(simple_classes())
-    def test_unknown(self, C):
+        assert [1, "2"] == [
+            i.x for i in from_columns(C, {"x": [1, "2"]}, validate=False)
+        ]
+
+    def test_kw_only(self):
         """
-        Wanting to change an unknown attribute raises an
-        AttrsAttributeNotFoundError.
+        Columns of keyword-only attributes are passed by their aliases.
         """
-        # No generated class will have a four letter attribute.
-        with pytest.raises(AttrsAttributeNotFoundError) as e:
-            assoc(C(), aaaa=2)
 
-        assert (f"aaaa is not an attrs attribute on {C!r}.",) == e.value.args
+        @attr.s
+        class C:
+            x = attr.ib()
+            _y = attr.ib(kw_only=True)
 
-    def test_frozen(self):
+        assert [C(1, y=3), C(2, y=4)] == from_columns(
+            C, {"x": [1, 2], "_y": [3, 4]}
+        )
+
+    def test_kw_only_validate(self):
         """
-        Works on frozen classes.
+        Columns of keyword-only attributes don't run validators if validate
+        is False, and missing ones get their defaults.
         """
 
-        @attr.s(frozen=True)
+        @attr.s
         class C:
-            x = attr.ib()
-            y = attr.ib()
+            x = attr.ib(validator=instance_of(int))
+            y = attr.ib(kw_only=True, validator=instance_of(int))
+            z = attr.ib(kw_only=True, factory=list)
+            w = attr.ib(default=0, kw_only=True)
 
-        assert C(3, 2) == assoc(C(1, 2), x=3)
+        columns = {"y": ["3", 4], "x": ["1", 2]}
 
+        assert [
+            trusted(C)("1", y="3", z=[], w=0),
+            trusted(C)(2, y=4, z=[], w=0),
+        ] == from_columns(C, columns, validate=False)
 
-class TestEvolve:
-    """
-    Tests for `evolve`.
-    """
+        with pytest.raises(TypeError, match="'x' must be"):
+            from_columns(C, columns)
 
-    @given(slots=st.booleans(), frozen=st.booleans())
-    def test_empty(self, slots, frozen):
+    def test_kw_only_missing(self):
         """
-        Empty classes without changes get copied.
+        Missing columns of mandatory keyword-only attributes raise a
+        TypeError.
         """
 
-        @attr.s(slots=slots, frozen=frozen)
+        @attr.s
         class C:
-            pass
+            x = attr.ib()
+            y = attr.ib(kw_only=True)
 
-        i1 = C()
-        i2 = evolve(i1)
+        with pytest.raises(
+            TypeError, match="missing a column for the mandatory attribute 'y'"
+        ):
+            from_columns(C, {"x": [1]})
 
-        assert i1 is not i2
-        assert i1 == i2
+    def test_custom_init(self):
+        """
+        If attrs didn't write __init__, the class is called with keyword
+        arguments.
+        """
 
-    @given(simple_classes())
-    def test_no_changes(self, C):
+        @attr.s(init=False)
+        class C:
+            x = attr.ib()
+
+            def __init__(self, x):
+                self.x = x * 2
+
+        assert [2, 4] == [i.x for i in from_columns(C, {"x": [1, 2]})]
+
+        with pytest.raises(
+            ValueError, match="validate=False needs an __init__ written"
+        ):
+            from_columns(C, {"x": [1, 2]}, validate=False)
+
+    def test_no_columns(self):
         """
-        No changes means a verbatim copy.
+        Without columns, there are no instances.
         """
-        i1 = C()
-        i2 = evolve(i1)
 
-        assert i1 is not i2
-        assert i1 == i2
+        @attr.s
+        class C:
+            x = attr.ib(default=1)
 
-    @given(simple_classes(), st.data())
-    def test_change(self, C, data):
+        assert [] == from_columns(C, {})
+
+    def test_only_kw_only(self):
         """
-        Changes work.
+        Classes without positional arguments get one instance per value.
         """
-        # Take the first attribute, and change it.
-        assume(fields(C))  # Skip classes with no attributes.
-        field_names = [a.name for a in fields(C)]
-        original = C()
-        chosen_names = data.draw(st.sets(st.sampled_from(field_names)))
-        # We pay special attention to private attributes, they should behave
-        # like in `__init__`.
-        change_dict = {
-            name.replace("_", ""): data.draw(st.integers())
-            for name in chosen_names
-        }
-        changed = evolve(original, **change_dict)
-        for name in chosen_names:
-            assert getattr(changed, name) == change_dict[name.replace("_", "")]
 
-    @given(simple_classes())
-    def test_unknown(self, C):
+        @attr.s(kw_only=True)
+        class C:
+            x = attr.ib()
+
+        assert [C(x=1), C(x=2)] == from_columns(C, {"x": [1, 2]})
+
+    @pytest.mark.parametrize("name", ["nope", "w"])
+    def test_unknown_column(self, name):
         """
-        Wanting to change an unknown attribute raises an
-        AttrsAttributeNotFoundError.
+        Columns for attributes that can't be passed to __init__ raise a
+        TypeError.
         """
-        # No generated class will have a four letter attribute.
-        with pytest.raises(TypeError) as e:
-            evolve(C(), aaaa=2)
 
-        if hasattr(C, "__attrs_init__"):
-            expected = (
-                "__attrs_init__() got an unexpected keyword argument 'aaaa'"
-            )
-        else:
-            expected = "__init__() got an unexpected keyword argument 'aaaa'"
+        @attr.s
+        class C:
+            x = attr.ib()
+            w = attr.ib(init=False)
 
-        assert e.value.args[0].endswith(expected)
+        with pytest.raises(TypeError, match=repr(name)):
+            from_columns(C, {"x": [1], name: [2]})
 
-    def test_validator_failure(self):
+    def test_missing_mandatory(self):
         """
-        TypeError isn't swallowed when validation fails within evolve.
+        Missing columns of mandatory attributes raise a TypeError.
         """
 
         @attr.s
         class C:
-            a = attr.ib(validator=instance_of(int))
+            x = attr.ib()
+            y = attr.ib()
 
-        with pytest.raises(TypeError) as e:
-            evolve(C(a=1), a="some string")
-        m = e.value.args[0]
+        with pytest.raises(TypeError, match="'y'"):
+            from_columns(C, {"x": [1]})
 
-        assert m.startswith("'a' must be <class 'int'>")
+    def test_different_lengths(self):
+        """
+        Columns of different lengths raise a ValueError.
+        """
 
-    def test_private(self):
+        @attr.s
+        class C:
+            x = attr.ib()
+            y = attr.ib()
+
+        with pytest.raises(
+            ValueError, match=r"All columns must have the same length\."
+        ):
+            from_columns(C, {"x": [1, 2], "y": [1]})
+
+    def test_not_an_attrs_class(self):
         """
-        evolve() acts as `__init__` with regards to private attributes.
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            from_columns(object, {})
+
+    def test_numpy(self):
+        """
+        NumPy columns are turned into Python objects, their validators are
+        checked for the whole array, and invalid values raise the same errors
+        as __init__.
         """
+        np = pytest.importorskip("numpy")
 
         @attr.s
         class C:
-            _a = attr.ib()
+            x = attr.ib(validator=[instance_of(int), ge(0)])
+            y = attr.ib(validator=optional(instance_of(float)))
 
-        assert evolve(C(1), a=2)._a == 2
+        (a, b) = from_columns(
+            C, {"x": np.array([1, 2]), "y": np.array([1.5, 2.5])}
+        )
 
-        with pytest.raises(TypeError):
-            evolve(C(1), _a=2)
+        assert C(1, 1.5) == a
+        assert int is type(b.x)
+        assert float is type(b.y)
 
-        with pytest.raises(TypeError):
-            evolve(C(1), a=3, _a=2)
+        with pytest.raises(ValueError, match="'x' must be >= 0: -1"):
+            from_columns(C, {"x": np.array([1, -1]), "y": np.zeros(2)})
 
-    def test_non_init_attrs(self):
+        with pytest.raises(TypeError, match="'y' must be"):
+            from_columns(C, {"x": np.arange(2), "y": np.arange(2)})
+
+    def test_row_validation(self):
         """
-        evolve() handles `init=False` attributes.
+        Validators have to run per instance unless all of them can be checked
+        for whole NumPy arrays and pass.
         """
+        np = pytest.importorskip("numpy")
 
         @attr.s
         class C:
-            a = attr.ib()
-            b = attr.ib(init=False, default=0)
+            x = attr.ib(validator=and_(instance_of(int), lt(10)))
+            y = attr.ib()
 
-        assert evolve(C(1), a=2).a == 2
+        ints = np.arange(3)
+
+        assert not _needs_row_validation(fields(C), {"x": ints})
+        assert _needs_row_validation(fields(C), {"x": ints + 10})
+        assert _needs_row_validation(fields(C), {"x": ints.astype(float)})
+        assert _needs_row_validation(fields(C), {"x": ints.tolist()})
+        assert _needs_row_validation(fields(C), {"x": ints.reshape(3, 1)})
+        assert _needs_row_validation(fields(C), {"y": ints})
+
+    @pytest.mark.parametrize(
+        ("validator", "array", "expected"),
+        [
+            (instance_of(int), [1, 2], True),
+            (instance_of(int), [True], True),
+            (instance_of(int), [1.0], False),
+            (instance_of((int, float)), [1.0], True),
+            (instance_of(str), ["a"], True),
+            (instance_of(float), [], True),
+            (gt(0), [1, 2], True),
+            (gt(0), [0, 1], False),
+            (le(1.5), [1.5], True),
+            (le(1.5), ["a"], None),
+            (optional(lt(3)), [1], True),
+            (in_([1]), [1], None),
+            (and_(gt(0), in_([1])), [1], None),
+            (and_(gt(0), in_([1])), [0], False),
+        ],
+    )
+    def test_check_array(self, validator, array, expected):
+        """
+        Built-in validators know whether all elements of an array pass.
+        """
+        np = pytest.importorskip("numpy")
+
+        assert expected is attr._make._check_array(validator, np.array(array))
+
+
+class TestTrusted:
+    """
+    Tests for `trusted`.
+    """
 
-    def test_regression_attrs_classes(self):
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_skips_everything(self, slots, frozen):
         """
-        evolve() can evolve fields that are instances of attrs classes.
-
-        Regression test for #804
+        Arguments are assigned as they are, without converters, validators,
+        on_setattr hooks, and pre- or post-init.
         """
+        calls = []
 
-        @attr.s
-        class Cls1:
-            param1 = attr.ib()
+        @attr.s(slots=slots, frozen=frozen)
+        class C:
+            x = attr.ib(converter=int, validator=instance_of(int))
+            _y = attr.ib(kw_only=True)
 
-        @attr.s
-        class Cls2:
-            param2 = attr.ib()
+            def __attrs_pre_init__(self):
+                calls.append("pre")
 
-        obj2a = Cls2(param2="a")
-        obj2b = Cls2(param2="b")
+            def __attrs_post_init__(self):
+                calls.append("post")
 
-        obj1a = Cls1(param1=obj2a)
+        i = trusted(C)("1", y="2")
 
-        assert Cls1(param1=Cls2(param2="b")) == attr.evolve(
-            obj1a, param1=obj2b
-        )
+        assert ("1", "2") == (i.x, i._y)
+        assert [] == calls
+        assert i == trusted(C)("1", y="2")
 
-    def test_dicts(self):
+    def test_post_init(self):
+        """
+        __attrs_post_init__ is called if requested.
         """
-        evolve() can replace an attrs class instance with a dict.
 
-        See #806
+        @attr.define
+        class C:
+            x: int
+
+            def __attrs_post_init__(self):
+                self.x += 1
+
+        assert 3 == trusted(C, post_init=True)(2).x
+        assert 2 == trusted(C)(2).x
+
+    def test_post_init_missing(self):
+        """
+        post_init is ignored if the class has no __attrs_post_init__.
         """
 
-        @attr.s
-        class Cls1:
-            param1 = attr.ib()
+        @attr.define
+        class C:
+            x: int
 
-        @attr.s
-        class Cls2:
-            param2 = attr.ib()
+        assert trusted(C) == trusted(C, post_init=True)
 
-        obj2a = Cls2(param2="a")
-        obj2b = {"foo": 42, "param2": 42}
+    def test_defaults(self):
+        """
+        Omitted arguments get their defaults, including attributes with
+        init=False.  Factories are only called for omitted arguments.
+        """
+        calls = []
 
-        obj1a = Cls1(param1=obj2a)
+        def factory(self):
+            calls.append(self.x)
+            return [self.x]
 
-        assert Cls1({"foo": 42, "param2": 42}) == attr.evolve(
-            obj1a, param1=obj2b
-        )
+        @attr.define
+        class C:
+            x: int = 1
+            y: list = attr.Factory(factory, takes_self=True)
+            z: str = attr.field(init=False, default="z")
 
-    def test_no_inst(self):
+        assert C(1, [1]) == trusted(C)()
+        assert [1] == calls
+        assert "z" == trusted(C)(2, [3]).z
+        assert [1] == calls
+
+    def test_on_setattr_bypassed(self):
         """
-        Missing inst argument raises a TypeError like Python would.
+        __setattr__ is bypassed for classes with on_setattr hooks.
         """
-        with pytest.raises(
-            TypeError, match=r"evolve\(\) takes 1 positional argument"
-        ):
-            evolve(x=1)
 
-    def test_too_many_pos_args(self):
+        @attr.define
+        class C:
+            x: int = attr.field(
+                on_setattr=lambda *_: pytest.fail("on_setattr called")
+            )
+
+        assert 1 == trusted(C)(1).x
+
+    def test_cache_hash(self):
         """
-        More than one positional argument raises a TypeError like Python would.
+        The hash cache is initialized.
         """
-        with pytest.raises(
-            TypeError,
-            match=r"evolve\(\) takes 1 positional argument, but 2 were given",
-        ):
-            evolve(1, 2)
 
-    def test_can_change_inst(self):
+        @attr.frozen(cache_hash=True)
+        class C:
+            x: int
+
+        assert hash(C(1)) == hash(trusted(C)(1))
+
+    def test_generated_on_demand(self):
         """
-        If the instance is passed by positional argument, a field named `inst`
-        can be changed.
+        The constructor is generated on first request and cached with the
+        other generated functions instead of being stored on the class.
         """
 
         @attr.define
         class C:
-            inst: int
+            x: int
 
-        assert C(42) == evolve(C(23), inst=42)
+        assert "__attrs_serializers__" not in C.__dict__
+        assert not any("trusted" in name for name in dir(C))
+
+        ctor = trusted(C)
+
+        assert ctor is trusted(C)
+        assert [(C, "trusted", False)] == list(C.__attrs_serializers__)
+        assert not any("trusted" in name for name in dir(C))
+
+    def test_subclass(self):
+        """
+        Plain subclasses get instances of themselves.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+        class D(C):
+            pass
+
+        assert D is type(trusted(D)(1))
+        assert C is type(trusted(C)(1))
+
+    def test_slotted_subclass_of_dict_class(self):
+        """
+        Attributes are set correctly if some live in slots and some in the
+        instance dict.
+        """
+
+        @attr.define(slots=False)
+        class Base:
+            x: int = attr.field(converter=int)
+
+        @attr.define
+        class C(Base):
+            y: int = attr.field(converter=int)
+
+        i = trusted(C)("1", "2")
+
+        assert ("1", "2") == (i.x, i.y)
+        assert {"x": "1"} == i.__dict__
+
+    def test_exception(self):
+        """
+        Exceptions get their args.
+        """
+
+        @attr.define
+        class E(Exception):
+            x: int
+            y: int = 2
+
+        e = trusted(E)(1)
+
+        assert (1, 2) == e.args
+        assert (1, 2) == (e.x, e.y)
+
+    def test_not_attrs_class(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            trusted(object)
@@ -1,5 +1,38 @@
 # SPDX-License-Identifier: MIT
 
+import subprocess
+import sys
+
+import pytest
+
+import attr
+import attrs
+
+from attr._version_info import VersionInfo
+
+
+LAZY = ["converters", "filters", "profiling", "serializers", "validators"]
+
+
+def imported_by(code):
+    """
+    Run *code* in a fresh interpreter and return the modules it imported.
+    """
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; before = set(sys.modules); "
+                f"{code}; "
+                "print('\\n'.join(sorted(set(sys.modules) - before)))"
+            ),
+        ],
+        text=True,
+    )
+
+    return set(out.splitlines())
+
 
 class TestImportStar:
     def test_from_attr_import_star(self):
@@ -9,3 +42,66 @@ class TestImportStar:
         # attr_import_star contains `from attr import *`, which cannot
         # be done here because *-imports are only allowed on module level.
         from . import attr_import_star  # noqa: F401
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize("package", ["attr", "attrs"])
+    def test_import_is_cheap(self, package):
+        """
+        Importing the package doesn't import rarely used submodules and
+        expensive standard library modules.
+        """
+        new = imported_by(f"import {package}")
+
+        assert package in new
+        for mod in LAZY:
+            assert f"attr.{mod}" not in new
+            assert f"attrs.{mod}" not in new
+        assert "attr._version_info" not in new
+        assert "inspect" not in new
+        assert "platform" not in new
+
+    def test_access_imports(self):
+        """
+        Accessing a lazy name imports it.
+        """
+        new = imported_by("import attrs; attrs.validators.instance_of")
+
+        assert {"attr.validators", "attrs.validators"} <= new
+
+    @pytest.mark.parametrize("mod", [attr, attrs])
+    @pytest.mark.parametrize("name", [*LAZY, "cmp_using"])
+    def test_lazy_names(self, mod, name):
+        """
+        Lazy names are available like eagerly imported ones, are stored in
+        the package after the first access, and take part in star imports.
+        """
+        value = getattr(mod, name)
+
+        assert value is vars(mod)[name]
+        assert value is getattr(mod, name)
+        assert name in mod.__all__
+
+    def test_submodules(self):
+        """
+        The lazy submodules of attrs are its own.
+        """
+        assert "attrs.validators" == attrs.validators.__name__
+        assert "attr.validators" == attr.validators.__name__
+        assert attr.cmp_using is attrs.cmp_using
+
+    def test_version_info_class(self):
+        """
+        attr.VersionInfo is still available.
+        """
+        assert VersionInfo is attr.VersionInfo
+
+    @pytest.mark.parametrize("mod", [attr, attrs])
+    def test_unknown(self, mod):
+        """
+        Unknown names still raise AttributeError.
+        """
+        with pytest.raises(
+            AttributeError, match=f"module {mod.__name__} has no attribute foo"
+        ):
+            mod.foo
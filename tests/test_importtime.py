@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr.importtime`.
+"""
+
+import itertools
+import sys
+
+import pytest
+
+from attr import profiling
+from attr.importtime import _measure, main
+
+
+_counter = itertools.count()
+
+SOURCE = """
+import attr
+
+@attr.s(unsafe_hash=True, slots=True)
+class Slow:
+    x = attr.ib()
+    y = attr.ib(default=42)
+
+Cs = [attr.make_class(f"C{i}", ["a"]) for i in range(3)]
+"""
+
+
+@pytest.fixture(name="make_mod")
+def _make_mod(tmp_path, monkeypatch):
+    """
+    Return a function that writes a fresh module with *source* and returns
+    its name.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = []
+
+    def make_mod(source=SOURCE):
+        name = f"attrs_importtime_mod_{next(_counter)}"
+        names.append(name)
+        (tmp_path / f"{name}.py").write_text(source)
+
+        return name
+
+    yield make_mod
+
+    profiling.reset()
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+class TestMeasure:
+    def test_report(self, make_mod):
+        """
+        The report covers all classes, the generated scripts and their
+        source, and the time spent in attrs is part of the import.
+        """
+        name = make_mod()
+
+        report = _measure(name)
+
+        assert 4 == len(report.records)
+        assert {f"{name}.Slow", f"{name}.C0", f"{name}.C1", f"{name}.C2"} == {
+            r.name for r in report.records
+        }
+        assert 0 < report.attrs_time <= report.elapsed
+        # One script with all methods per class.
+        assert 4 == report.scripts
+        assert 0 < report.compiled <= report.scripts
+        assert report.linecache_bytes > 0
+
+    def test_already_imported(self, make_mod):
+        """
+        Modules that have been imported already can't be measured.
+        """
+        name = make_mod()
+        __import__(name)
+
+        with pytest.raises(ValueError, match="has already been imported"):
+            _measure(name)
+
+
+class TestMain:
+    def test_success(self, make_mod, capsys):
+        """
+        Prints the summary and the slowest classes.
+        """
+        name = make_mod()
+
+        assert 0 == main([name, "-n", "2"])
+
+        out, err = capsys.readouterr()
+        lines = out.splitlines()
+
+        assert lines[0].startswith(f"Imported {name} in ")
+        assert "creating 4 classes" in lines[1]
+        assert lines[2].startswith("Generated 4 scripts, compiled ")
+        assert "Slowest classes (top 2):" == lines[4]
+        assert 8 == len(lines)
+        assert "" == err
+
+    def test_error(self, capsys):
+        """
+        Modules that can't be imported result in an error and exit code 1.
+        """
+        assert 1 == main(["attrs_importtime_does_not_exist"])
+
+        _, err = capsys.readouterr()
+        assert err.startswith("error: No module named")
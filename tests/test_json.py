@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._json`.
+"""
+
+import enum
+import io
+import json
+
+from collections import OrderedDict
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+import attr
+
+from attr import _json, asdict, dump_json, iter_json
+
+from .strategies import nested_classes
+
+
+def dumps(obj, **kw):
+    """
+    Return what iter_json is expected to produce for *obj*.
+    """
+    ensure_ascii = kw.pop("ensure_ascii", True)
+    if attr.has(obj.__class__):
+        obj = asdict(obj, **kw)
+    else:
+        obj = [asdict(i, **kw) for i in obj]
+
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii)
+
+
+@attr.s
+class Inner:
+    x = attr.ib()
+    _y = attr.ib(default="ü")
+
+
+@attr.s
+class Outer:
+    inner = attr.ib()
+    items = attr.ib(factory=list)
+    mapping = attr.ib(factory=dict)
+
+
+@attr.s
+class Empty:
+    pass
+
+
+@attr.define
+class Annotated:
+    i: int
+    f: float
+    s: str
+    b: bool
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class Name(str):
+    __slots__ = ()
+
+
+class TestIterJSON:
+    @given(nested_classes, st.booleans())
+    def test_like_asdict(self, cls, ensure_ascii):
+        """
+        iter_json produces the same as json.dumps after asdict.
+        """
+        obj = cls()
+
+        assert dumps(obj, ensure_ascii=ensure_ascii) == "".join(
+            iter_json(obj, ensure_ascii=ensure_ascii)
+        )
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            Inner(1),
+            Empty(),
+            Outer(Empty()),
+            Outer(
+                Inner(1.5),
+                [Inner(None), (1, 2), {3}, frozenset(), [[Empty()]]],
+                OrderedDict([("a", Inner(True)), ("b", [])]),
+            ),
+            Outer(
+                Inner(float("nan")),
+                [float("inf"), -float("inf"), -0.0, 10**30],
+                {1: "a", 2.5: "b", None: "c", False: "d", "é": "e"},
+            ),
+            Outer(Inner(Color.RED), [Name("n"), Color.RED], {Name("k"): 1}),
+            Annotated(1, 2.0, "s", False),
+            Annotated(True, 1, Name("s"), Color.RED),
+        ],
+    )
+    def test_values(self, obj):
+        """
+        Containers, nested instances, special floats, dict keys that aren't
+        strings, and subclasses of scalars are encoded like json.dumps does.
+        """
+        assert dumps(obj) == "".join(iter_json(obj))
+
+    def test_ensure_ascii(self):
+        """
+        Non-ASCII characters are only escaped if ensure_ascii is True.
+        """
+        obj = Outer(Inner("ä"), mapping={"ö": 1})
+
+        assert dumps(obj, ensure_ascii=False) == "".join(
+            iter_json(obj, ensure_ascii=False)
+        )
+        assert "ä" not in "".join(iter_json(obj))
+
+    def test_containers(self):
+        """
+        Lists, tuples, and dicts of instances can be passed.
+        """
+        objs = [Inner(1), Inner(2)]
+
+        assert dumps(objs) == "".join(iter_json(objs))
+        assert dumps(objs) == "".join(iter_json(tuple(objs)))
+        assert '{"a":{"x":1,"_y":"\\u00fc"}}' == "".join(
+            iter_json({"a": Inner(1)})
+        )
+
+    def test_by_alias(self):
+        """
+        If by_alias is True, the aliases are used as keys.
+        """
+        assert '{"x":1,"y":"\\u00fc"}' == "".join(
+            iter_json(Inner(1), by_alias=True)
+        )
+        assert '{"x":1,"_y":"\\u00fc"}' == "".join(iter_json(Inner(1)))
+        assert '{"x":1,"y":"\\u00fc"}' == "".join(
+            iter_json(Inner(1), by_alias=True, filter=lambda a, v: True)
+        )
+
+    def test_hooks(self):
+        """
+        filter and value_serializer are called like asdict calls them.
+        """
+        obj = Outer(
+            Inner(1, "a"),
+            [Inner(2), 3, (4,)],
+            {"k": 5, 6: Inner(7)},
+        )
+
+        def filter(a, v):
+            return a.name != "_y"
+
+        def serializer(inst, a, v):
+            return str(v) if isinstance(v, int) else v
+
+        for kw in (
+            {"filter": filter},
+            {"value_serializer": serializer},
+            {"filter": filter, "value_serializer": serializer},
+        ):
+            assert dumps(obj, **kw) == "".join(iter_json(obj, **kw))
+
+    def test_hooks_call_order(self):
+        """
+        The hooks are called in the same order as by asdict.
+        """
+        obj = Outer(Inner(1), [2, Inner(3)], {"k": (4,)})
+
+        def record(calls):
+            def filter(a, v):
+                calls.append(("filter", a.name))
+                return True
+
+            def serializer(inst, a, v):
+                calls.append(("serializer", a and a.name, v))
+                return v
+
+            return {"filter": filter, "value_serializer": serializer}
+
+        expected = []
+        asdict(obj, **record(expected))
+        calls = []
+        "".join(iter_json(obj, **record(calls)))
+
+        assert expected == calls
+
+    def test_chunks(self, monkeypatch):
+        """
+        Long containers are yielded in several chunks.
+        """
+        monkeypatch.setattr(_json, "_CHUNK_PIECES", 10)
+        obj = Outer(Inner(1), [Inner(i) for i in range(100)])
+
+        chunks = list(iter_json(obj))
+
+        assert len(chunks) > 10
+        assert dumps(obj) == "".join(chunks)
+
+    def test_lazy(self):
+        """
+        Nothing is encoded before the first chunk is requested.
+        """
+        it = iter_json(Inner(object()))
+
+        with pytest.raises(TypeError):
+            next(it)
+
+    @pytest.mark.parametrize(
+        ("obj", "msg"),
+        [
+            (
+                Inner(object()),
+                "Object of type object is not JSON serializable",
+            ),
+            (
+                Outer(Inner(1), mapping={(1,): 2}),
+                "keys must be str, int, float, bool or None, not tuple",
+            ),
+            (
+                Outer(Inner(1), mapping={b"k": 2}),
+                "keys must be str, int, float, bool or None, not bytes",
+            ),
+        ],
+    )
+    def test_not_serializable(self, obj, msg):
+        """
+        Values and keys that JSON can't represent raise TypeErrors.
+        """
+        with pytest.raises(TypeError, match=msg):
+            "".join(iter_json(obj))
+
+        with pytest.raises(TypeError, match=msg):
+            "".join(iter_json(obj, filter=lambda a, v: True))
+
+    def test_emitter_cached(self):
+        """
+        The generated emitter is created once per class and arguments.
+        """
+
+        @attr.define
+        class C:
+            x: int
+
+        "".join(iter_json(C(1)))
+        "".join(iter_json(C(2)))
+        "".join(iter_json(C(3), by_alias=True))
+
+        assert [
+            (C, "json", False, True),
+            (C, "json", True, True),
+        ] == list(C.__attrs_serializers__)
+
+
+class TestDumpJSON:
+    def test_writes(self):
+        """
+        The chunks are written to the file object.
+        """
+        fp = io.StringIO()
+
+        dump_json(
+            [Inner(1), Inner("ß")], fp, by_alias=True, ensure_ascii=False
+        )
+
+        assert '[{"x":1,"y":"ü"},{"x":"ß","y":"ü"}]' == fp.getvalue()
+
+    def test_lazy_export(self):
+        """
+        iter_json and dump_json are available from both attr and attrs.
+        """
+        import attrs
+
+        assert attrs.iter_json is attr.iter_json is iter_json
+        assert attrs.dump_json is attr.dump_json is dump_json
@@ -9,6 +9,7 @@ import functools
 import gc
 import inspect
 import itertools
+import linecache
 import sys
 
 from operator import attrgetter
@@ -21,7 +22,7 @@ from hypothesis.strategies import booleans, integers, lists, sampled_from, text
 
 import attr
 
-from attr import _config
+from attr import _config, _make
 from attr._compat import PY_3_10_PLUS, PY_3_14_PLUS
 from attr._make import (
     Attribute,
@@ -29,10 +30,13 @@ from attr._make import (
     _AndValidator,
     _Attributes,
     _ClassBuilder,
+    _collect_base_attrs,
+    _collect_base_attrs_broken,
     _CountingAttr,
     _determine_attrib_eq_order,
     _determine_attrs_eq_order,
     _determine_whether_to_implement,
+    _LazyMethod,
     _transform_attrs,
     and_,
     fields,
@@ -467,6 +471,245 @@ class TestTransformAttrs:
         assert True is f(C).b.inherited
         assert False is f(C).c.inherited
 
+    def test_attr_tuple_class_shared(self):
+        """
+        Classes with the same name and attribute names share the class that
+        holds their attributes, which isn't compiled from source.
+        """
+        C1 = make_class("C", ["a", "b"])
+        C2 = make_class("C", ["a", "b"])
+        D = make_class("D", ["a", "b"])
+
+        fields_type = type(fields(C1))
+
+        assert fields_type is type(fields(C2))
+        assert fields_type is not type(fields(D))
+        assert "CAttributes" == fields_type.__name__
+        assert fields(C1) is not fields(C2)
+        assert fields(C1).b is fields(C1)[1]
+        assert fields(C2).b is fields(C2)[1]
+
+    def test_attr_tuple_class_not_compiled(self, monkeypatch):
+        """
+        The class that holds the attributes isn't compiled from source.
+        """
+
+        def fail(*args, **kw):
+            raise AssertionError
+
+        monkeypatch.setattr(_make, "_compile_and_eval", fail)
+
+        AttrsClass = _make._make_attr_tuple_class("Fresh", ["x", "y"])
+
+        assert "FreshAttributes" == AttrsClass.__name__
+        assert 2 == AttrsClass((1, 2)).y
+        assert () == AttrsClass.__slots__
+
+    def test_attr_tuple_class_error(self):
+        """
+        Misspelled attribute names mention the class.
+        """
+        C = make_class("C", ["password"])
+
+        with pytest.raises(
+            AttributeError, match="'CAttributes' object has no attribute"
+        ):
+            fields(C).passwd
+
+
+def walk_mro(cls, taken_attr_names):
+    """
+    Collect the base attributes of *cls* by walking its whole MRO, like
+    `_collect_base_attrs` did before inherited views were cached.
+    """
+    base_attrs = []
+    base_attr_map = {}
+    for base_cls in reversed(cls.__mro__[1:-1]):
+        for a in getattr(base_cls, "__attrs_attrs__", []):
+            if a.inherited or a.name in taken_attr_names:
+                continue
+
+            base_attrs.append(a.evolve(inherited=True))
+            base_attr_map[a.name] = base_cls
+
+    filtered = []
+    seen = set()
+    for a in reversed(base_attrs):
+        if a.name not in seen:
+            filtered.insert(0, a)
+            seen.add(a.name)
+
+    return filtered, base_attr_map
+
+
+def walk_mro_broken(cls, taken_attr_names):
+    """
+    Like `walk_mro`, but like `_collect_base_attrs_broken`.
+    """
+    taken_attr_names = set(taken_attr_names)
+    base_attrs = []
+    base_attr_map = {}
+    for base_cls in cls.__mro__[1:-1]:
+        for a in getattr(base_cls, "__attrs_attrs__", []):
+            if a.name in taken_attr_names:
+                continue
+
+            taken_attr_names.add(a.name)
+            base_attrs.append(a.evolve(inherited=True))
+            base_attr_map[a.name] = base_cls
+
+    return base_attrs, base_attr_map
+
+
+class TestInheritedView:
+    """
+    Tests for the cached inherited views behind `_collect_base_attrs`.
+    """
+
+    def test_cached(self):
+        """
+        Creating a subclass caches the view of its base and subclasses get
+        their own copies of the inherited attributes.
+        """
+
+        @attr.define
+        class Base:
+            x: int
+
+        assert "__attrs_inherited_view__" not in Base.__dict__
+
+        @attr.define
+        class Sub1(Base):
+            y: int
+
+        @attr.define
+        class Sub2(Base):
+            pass
+
+        view, _ = Base.__dict__["__attrs_inherited_view__"][2][True]
+
+        assert fields(Sub1).x == fields(Sub2).x == view[0]
+        assert fields(Sub1).x is not fields(Sub2).x
+        assert fields(Sub1).x is not view[0]
+        assert "__attrs_inherited_view__" not in Sub1.__dict__
+
+    def test_deep(self):
+        """
+        Deep hierarchies collect all attributes, each class only walks its
+        direct base.
+        """
+        classes = [attr.make_class("C0", ["a0"], collect_by_mro=True)]
+        for i in range(1, 30):
+            classes.append(
+                attr.make_class(
+                    f"C{i}",
+                    {f"a{i}": attr.ib(), "a0": attr.ib(default=i)},
+                    bases=(classes[-1],),
+                    collect_by_mro=True,
+                )
+            )
+
+        assert [f"a{i}" for i in range(1, 30)] + ["a0"] == [
+            a.name for a in fields(classes[-1])
+        ]
+        assert 29 == fields(classes[-1]).a0.default
+        assert fields(classes[-1]).a1.inherited
+        assert all(
+            "__attrs_inherited_view__" in c.__dict__ for c in classes[:-1]
+        )
+
+    @pytest.mark.parametrize(
+        ("collect_by_mro", "collect", "walk"),
+        [
+            (True, _collect_base_attrs, walk_mro),
+            (False, _collect_base_attrs_broken, walk_mro_broken),
+        ],
+    )
+    def test_matches_walking_mro(self, collect_by_mro, collect, walk):
+        """
+        Diamonds, mixins, and classes that aren't attrs classes give the same
+        result as walking the whole MRO.
+        """
+
+        @attr.s(collect_by_mro=collect_by_mro)
+        class A:
+            a = attr.ib(default="A")
+            x = attr.ib(default="A")
+
+        @attr.s(collect_by_mro=collect_by_mro)
+        class B(A):
+            b = attr.ib(default="B")
+            x = attr.ib(default="B")
+
+        @attr.s(collect_by_mro=collect_by_mro)
+        class C(A):
+            c = attr.ib(default="C")
+            a = attr.ib(default="C")
+
+        class Plain(C):
+            pass
+
+        class Mixin:
+            pass
+
+        @attr.s(collect_by_mro=collect_by_mro)
+        class D(Mixin, B, Plain):
+            d = attr.ib(default="D")
+
+        @attr.s(collect_by_mro=collect_by_mro)
+        class E(D):
+            x = attr.ib(default="E")
+
+        for cls in (B, C, D, E):
+            for taken in (set(), {"x"}, {"a", "d"}):
+                assert walk(cls, taken) == collect(cls, taken)
+
+    def test_resolve_types(self):
+        """
+        Subclasses created after resolve_types see the resolved types, just
+        like their base does.
+        """
+
+        @attr.define
+        class Base:
+            x: "int"
+
+        @attr.define
+        class Sub1(Base):
+            pass
+
+        attr.resolve_types(Base)
+
+        @attr.define
+        class Sub2(Base):
+            pass
+
+        assert "int" == fields(Sub1).x.type
+        assert int is fields(Sub2).x.type
+
+    def test_resolve_types_doesnt_leak(self):
+        """
+        Resolving the types of a subclass doesn't change the inherited
+        attributes of its siblings.
+        """
+
+        @attr.define
+        class Base:
+            x: "int"
+
+        @attr.define
+        class Sub1(Base):
+            pass
+
+        @attr.define
+        class Sub2(Base):
+            pass
+
+        attr.resolve_types(Sub1)
+
+        assert int is fields(Sub1).x.type
+        assert "int" == fields(Sub2).x.type
+
 
 class TestAttributes:
     """
@@ -1685,6 +1928,7 @@ class TestClassBuilder:
             None,
             False,
             None,
+            False,
         )
 
         assert "<_ClassBuilder(cls=C)>" == repr(b)
@@ -1712,6 +1956,7 @@ class TestClassBuilder:
             None,
             False,
             None,
+            False,
         )
 
         cls = (
@@ -1767,6 +2012,57 @@ class TestClassBuilder:
         organic_prefix = C.organic.__qualname__.rsplit(".", 1)[0]
         assert organic_prefix + "." + meth_name == meth_C.__qualname__
 
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_methods_compiled_together(self, slots):
+        """
+        All generated methods of a class come from one script that is
+        registered with linecache once.
+        """
+
+        @attr.s(slots=slots, unsafe_hash=True)
+        class C:
+            x = attr.ib()
+
+        filename = C.__init__.__code__.co_filename
+
+        assert filename.startswith("<attrs generated methods ")
+        assert {filename} == {
+            C.__eq__.__code__.co_filename,
+            C.__hash__.__code__.co_filename,
+            C.__repr__.__code__.co_filename,
+        }
+        assert "def __repr__(self):" in "".join(linecache.getlines(filename))
+
+    def test_module_globals_dont_shadow(self, monkeypatch):
+        """
+        Names in the module of the class don't shadow the globals of the
+        generated methods.
+        """
+        monkeypatch.setitem(globals(), "_compat", None)
+        monkeypatch.setitem(globals(), "_type_hash", None)
+
+        @attr.s(unsafe_hash=True)
+        class C:
+            x = attr.ib()
+
+        assert "C(x=1)" == repr(C(1))
+        assert hash(C(1)) == hash(C(1))
+
+    def test_module_globals_not_copied(self):
+        """
+        The generated methods use the namespace of the module as their
+        globals without copying it or writing to it.
+        """
+        keys = set(globals())
+
+        @attr.s(unsafe_hash=True)
+        class C:
+            x = attr.ib(default=1)
+
+        assert C.__init__.__globals__ is globals()
+        assert C.__eq__.__globals__ is globals()
+        assert keys == set(globals())
+
     def test_handles_missing_meta_on_class(self):
         """
         If the class hasn't a __module__ or __qualname__, the method hasn't
@@ -1791,6 +2087,7 @@ class TestClassBuilder:
             on_setattr=None,
             has_custom_setattr=False,
             field_transformer=None,
+            lazy_methods=False,
         )
         b._cls = {}  # no __module__; no __qualname__
 
@@ -1922,6 +2219,115 @@ class TestClassBuilder:
         assert actual == expected
 
 
+class TestLazyMethods:
+    """
+    Tests for generating methods on first access.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_replaced_on_first_access(self, slots):
+        """
+        Lazy methods are stand-ins until they're accessed and then replace
+        themselves -- and the other methods of their group -- on the class.
+        """
+
+        @attr.s(slots=slots, order=True, unsafe_hash=True, lazy_methods=True)
+        class C:
+            x = attr.ib()
+
+        for name in ("__repr__", "__hash__", "__lt__", "__ge__"):
+            assert isinstance(C.__dict__[name], _LazyMethod)
+
+        assert C(1) < C(2)
+
+        for name in ("__lt__", "__le__", "__gt__", "__ge__"):
+            assert not isinstance(C.__dict__[name], _LazyMethod)
+        assert isinstance(C.__dict__["__repr__"], _LazyMethod)
+
+        assert "C(x=1)" == repr(C(1))
+        assert hash(C(1)) == hash(C(1))
+        assert C.__dict__["__repr__"] is C.__repr__
+        assert (
+            f"{C.__qualname__}.__repr__" == C.__dict__["__repr__"].__qualname__
+        )
+
+    def test_same_behavior(self):
+        """
+        Lazy methods behave like eagerly generated ones.
+        """
+
+        @attr.s(order=True, unsafe_hash=True, str=True, lazy_methods=True)
+        class Lazy:
+            x = attr.ib()
+
+        @attr.s(order=True, unsafe_hash=True, str=True, lazy_methods=False)
+        class Eager:
+            x = attr.ib()
+
+        for C in (Lazy, Eager):
+            assert f"{C.__name__}(x=1)" == str(C(1))
+            assert C(1) <= C(1)
+            assert C(2) > C(1)
+            assert NotImplemented == C(1).__lt__(42)
+            assert hash(C(1)) == hash(C(1))
+
+        assert type(Lazy.__dict__["__hash__"]) is type(
+            Eager.__dict__["__hash__"]
+        )
+
+    def test_inherited(self):
+        """
+        Accessing a lazy method through a subclass installs it on the class
+        that defines it.
+        """
+
+        @attr.s(lazy_methods=True)
+        class Base:
+            x = attr.ib()
+
+        @attr.s(repr=False)
+        class Sub(Base):
+            pass
+
+        assert "Sub(x=1)" == repr(Sub(1))
+        assert "__repr__" not in Sub.__dict__
+        assert not isinstance(Base.__dict__["__repr__"], _LazyMethod)
+
+    def test_global(self, monkeypatch):
+        """
+        If *lazy_methods* isn't passed, the global setting is used.
+        """
+        monkeypatch.setattr(attr.codegen, "_lazy_methods", True)
+
+        @attr.define
+        class C:
+            x: int
+
+        @attr.define(lazy_methods=False)
+        class D:
+            x: int
+
+        assert isinstance(C.__dict__["__repr__"], _LazyMethod)
+        assert not isinstance(D.__dict__["__repr__"], _LazyMethod)
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [("_captured_scripts", []), ("_use_precompiled", True)],
+    )
+    def test_eager_with_precompiled(self, monkeypatch, name, value):
+        """
+        Methods are generated eagerly while scripts are captured for
+        precompilation or precompiled methods are used.
+        """
+        monkeypatch.setattr(attr.codegen, name, value)
+
+        @attr.s(lazy_methods=True)
+        class C:
+            x = attr.ib()
+
+        assert not isinstance(C.__dict__["__repr__"], _LazyMethod)
+
+
 class TestInitAlias:
     """
     Tests for Attribute alias handling.
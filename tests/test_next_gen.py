@@ -436,6 +436,23 @@ class TestAsDict:
         )
 
 
+class TestAsDictMany:
+    def test_smoke(self):
+        """
+        `attrs.asdict_many` only changes defaults, so we just call it and
+        compare.
+        """
+        insts = [C("foo", (1,)), C("bar", 2)]
+
+        assert attrs.asdict_many(insts) == _attr.asdict_many(
+            insts, retain_collection_types=True
+        )
+        assert attrs.asdict_many(insts, columnar=True) == {
+            "x": ["foo", "bar"],
+            "y": [(1,), 2],
+        }
+
+
 class TestImports:
     """
     Verify our re-imports and mirroring works.
@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr.profiling`.
+"""
+
+import pytest
+
+import attr
+
+from attr import _make, profiling
+
+
+@pytest.fixture(name="prof")
+def _prof():
+    """
+    Enable profiling for the duration of a test.
+    """
+    profiling.enable()
+
+    yield profiling
+
+    profiling.disable()
+    profiling.reset()
+
+
+class TestProfiling:
+    def test_disabled_by_default(self):
+        """
+        Nothing is wrapped or recorded unless enabled.
+        """
+        attr.make_class("C", ["x"])
+
+        assert not hasattr(_make._transform_attrs, "__wrapped__")
+        assert [] == profiling.class_creation_report()
+
+    def test_records_phases(self, prof):
+        """
+        Each class gets a record with the time spent in each phase.
+        """
+
+        @attr.s(slots=True, unsafe_hash=True, order=True)
+        class C:
+            x = attr.ib()
+
+        (rec,) = prof.class_creation_report()
+
+        assert (
+            f"{__name__}.TestProfiling.test_records_phases.<locals>.C"
+            == rec.name
+        )
+        assert {
+            "transform_attrs",
+            "collect_base_attrs",
+            "make_init",
+            "make_eq",
+            "make_hash",
+            "make_repr",
+            "make_order",
+            "make_getstate_setstate",
+            "compile",
+            "create_slots_class",
+            "closure_cells",
+        } == set(rec.phases)
+        assert all(t >= 0 for t in rec.phases.values())
+        assert rec.phases["transform_attrs"] <= rec.total
+        assert rec.phases["closure_cells"] <= rec.phases["create_slots_class"]
+
+    def test_init_subclass(self, prof):
+        """
+        __attrs_init_subclass__ is accounted to the subclass.
+        """
+
+        @attr.define
+        class Base:
+            @classmethod
+            def __attrs_init_subclass__(cls):
+                pass
+
+        @attr.define
+        class Sub(Base):
+            pass
+
+        recs = {
+            r.name.rsplit(".", 1)[-1]: r for r in prof.class_creation_report()
+        }
+
+        assert "attrs_init_subclass" in recs["Sub"].phases
+        assert "attrs_init_subclass" not in recs["Base"].phases
+        assert "patch_original_class" not in recs["Sub"].phases
+
+    def test_nested(self, prof):
+        """
+        Classes created while another one is created get their own records.
+        """
+
+        @attr.define
+        class Base:
+            @classmethod
+            def __attrs_init_subclass__(cls):
+                attr.make_class("Inner", ["y"])
+
+        @attr.define
+        class Sub(Base):
+            x: int
+
+        names = [
+            r.name.rsplit(".", 1)[-1] for r in prof.class_creation_report()
+        ]
+
+        assert ["Base", "Inner", "Sub"] == sorted(names)
+
+    def test_sorted_and_limit(self, prof):
+        """
+        The report is sorted by total time and can be limited.
+        """
+        for i in range(5):
+            attr.make_class(f"C{i}", [f"a{j}" for j in range(i * 10)])
+
+        report = prof.class_creation_report()
+        totals = [r.total for r in report]
+
+        assert 5 == len(report)
+        assert sorted(totals, reverse=True) == totals
+        assert report[:2] == prof.class_creation_report(limit=2)
+
+    def test_failing_class(self, prof):
+        """
+        Classes that fail to be created don't leave records behind and don't
+        confuse the attribution of later ones.
+        """
+        with pytest.raises(ValueError):
+
+            @attr.s(frozen=True, on_setattr=attr.setters.validate)
+            class Broken:
+                x = attr.ib()
+
+        attr.make_class("C", ["x"])
+
+        (rec,) = prof.class_creation_report()
+
+        assert rec.name.endswith(".C")
+        assert "make_repr" in rec.phases
+
+    def test_total_counts_nested_once(self, prof):
+        """
+        Nested class creations are only counted once in the total time, in
+        their outermost class.
+        """
+
+        @attr.define
+        class Base:
+            @classmethod
+            def __attrs_init_subclass__(cls):
+                attr.make_class("Inner", ["y"])
+
+        @attr.define
+        class Sub(Base):
+            x: int
+
+        recs = {
+            r.name.rsplit(".", 1)[-1]: r for r in prof.class_creation_report()
+        }
+
+        assert recs["Base"].total + recs["Sub"].total == pytest.approx(
+            prof.class_creation_time()
+        )
+
+        prof.reset()
+
+        assert 0.0 == prof.class_creation_time()
+
+    def test_disable_keeps_records(self, prof):
+        """
+        Disabling stops recording and restores the original functions, but
+        the records can still be queried until they're reset.
+        """
+        transform_attrs = _make._transform_attrs
+        attr.make_class("C", ["x"])
+        prof.disable()
+
+        assert transform_attrs is not _make._transform_attrs
+        assert not hasattr(_make._transform_attrs, "__wrapped__")
+
+        attr.make_class("D", ["x"])
+
+        assert 1 == len(prof.class_creation_report())
+
+        prof.reset()
+
+        assert [] == prof.class_creation_report()
+
+    def test_enable_twice(self, prof):
+        """
+        Enabling again discards old records but doesn't wrap twice.
+        """
+        attr.make_class("C", ["x"])
+        transform_attrs = _make._transform_attrs
+
+        prof.enable()
+
+        assert [] == prof.class_creation_report()
+        assert transform_attrs is _make._transform_attrs
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr.serializers`.
+"""
+
+import typing
+
+import pytest
+
+import attr
+
+from attr import fields
+from attr.serializers import _declared_classes, by_type
+
+
+class Base:
+    pass
+
+
+class Sub(Base):
+    pass
+
+
+@attr.s
+class C:
+    a: int = attr.ib()
+    b: "typing.Optional[Base]" = attr.ib()
+    c: typing.Optional[Sub] = attr.ib()
+    d: typing.List[int] = attr.ib()
+    e = attr.ib()
+
+
+class TestDeclaredClasses:
+    """
+    Tests for `_declared_classes`.
+    """
+
+    @pytest.mark.parametrize(
+        ("type_", "classes"),
+        [
+            (int, [int]),
+            (typing.Optional[Sub], [Sub, type(None)]),
+            (typing.Union[int, str], [int, str]),
+            (typing.List[int], [list]),
+            (typing.Dict[str, typing.List[int]], [dict]),
+            (typing.Union[typing.Tuple[int, int], None], [tuple, type(None)]),
+        ],
+    )
+    def test_classes(self, type_, classes):
+        """
+        Classes, generic aliases, and unions of those declare classes.
+        """
+        assert classes == _declared_classes(type_)
+
+    @pytest.mark.parametrize(
+        "type_",
+        [
+            None,
+            "int",
+            typing.Any,
+            typing.Optional[typing.Any],
+            typing.Literal[1],
+        ],
+    )
+    def test_unknown(self, type_):
+        """
+        Anything else doesn't tell which classes the values are of.
+        """
+        assert None is _declared_classes(type_)
+
+
+class TestByType:
+    """
+    Tests for `by_type`.
+    """
+
+    def test_dispatch(self):
+        """
+        Values are converted using the function for their class, values of
+        other classes are returned as they are.
+        """
+        s = by_type({int: str, Base: type})
+
+        assert "1" == s(None, None, 1)
+        assert Base is s(None, None, Base())
+        assert 1.0 == s(None, None, 1.0)
+
+    def test_mro(self):
+        """
+        Subclasses use the function of their closest base class in the table.
+        """
+        sub = Sub()
+
+        assert "base" == by_type({Base: lambda _: "base"})(None, None, sub)
+        assert "sub" == by_type(
+            {Base: lambda _: "base", Sub: lambda _: "sub"}
+        )(None, None, sub)
+        assert True is by_type({int: lambda v: v + 1, bool: lambda v: v})(
+            None, None, True
+        )
+        assert "o" == by_type({object: lambda _: "o"})(None, None, None)
+
+    def test_cache(self):
+        """
+        Each class is only looked up once.
+        """
+        s = by_type({Base: lambda _: "base"})
+        s(None, None, Sub())
+        s(None, None, 1)
+
+        assert {Sub: s.table[Base], int: None} == s._cache
+
+    def test_table_copied(self):
+        """
+        The table is copied, so changing the passed dict later doesn't
+        change the serializer.
+        """
+        table = {int: str}
+        s = by_type(table)
+        table[int] = float
+
+        assert {int: str} == s.table
+        assert "1" == s(None, None, 1)
+
+    def test_not_a_class(self):
+        """
+        Keys that aren't classes raise a TypeError.
+        """
+        with pytest.raises(
+            TypeError, match=r"Keys of the table must be classes, not 'int'\."
+        ):
+            by_type({"int": str})
+
+    def test_equal(self):
+        """
+        Serializers for the same table are equal and hash equally, so they
+        share the generated functions.
+        """
+        assert by_type({int: str, str: len}) == by_type({str: len, int: str})
+        assert hash(by_type({int: str})) == hash(by_type({int: str}))
+        assert by_type({int: str}) != by_type({int: repr})
+
+    def test_unhashable_function(self):
+        """
+        If a function can't be hashed, the serializer only equals itself.
+        """
+
+        @attr.s(eq=True, hash=False)
+        class Fn:
+            def __call__(self, value):
+                return "fn"
+
+        s = by_type({int: Fn()})
+
+        assert s == s
+        assert s != by_type({int: Fn()})
+        assert "fn" == s(None, None, 1)
+
+    def test_repr(self):
+        """
+        The repr lists the classes in the table.
+        """
+        assert "<by_type serializer for Base, int>" == repr(
+            by_type({int: str, Base: str})
+        )
+        assert "<by_type serializer for nothing>" == repr(by_type({}))
+
+    def test_plan(self):
+        """
+        The plan are the declared classes that aren't in the table, or
+        None if there are none or the type doesn't tell.
+        """
+        a, b, c, d, e = fields(C)
+        s = by_type({Base: str, list: tuple})
+
+        assert frozenset((int,)) == s._plan(a)
+        assert None is s._plan(b)
+        assert frozenset((type(None),)) == s._plan(c)
+        assert None is s._plan(d)
+        assert None is s._plan(e)
+
+    @pytest.mark.parametrize("value", [1, "x", None, Sub(), [1]])
+    def test_plan_matches_call(self, value):
+        """
+        Values of the classes in the plan are returned unchanged by calling
+        the serializer.
+        """
+        s = by_type({Base: str, list: tuple})
+        for a in fields(C):
+            plan = s._plan(a)
+            if plan is not None and value.__class__ in plan:
+                assert value is s(None, a, value)
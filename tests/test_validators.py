@@ -1074,8 +1074,7 @@ class TestNot_:
         v = not_(wrapped)
 
         assert (
-            f"<not_ validator wrapping {wrapped!r}, "
-            f"capturing {v.exc_types!r}>"
+            f"<not_ validator wrapping {wrapped!r}, capturing {v.exc_types!r}>"
         ) == repr(v)
 
     def test_success_because_fails(self):
@@ -1312,3 +1311,219 @@ class TestOr:
             "<or validator wrapping (<instance_of validator for type "
             "<class 'int'>>, <instance_of validator for type <class 'str'>>)>"
         ) == repr(v)
+
+
+INLINED = [
+    (instance_of(int), 1, "1"),
+    (instance_of((int, float)), 1.0, "1"),
+    (in_([1, 2]), 1, 3),
+    (in_("abc"), "a", 1),
+    (lt(3), 2, 3),
+    (le(3), 3, 4),
+    (ge(3), 3, 2),
+    (gt(3), 4, 3),
+    (max_len(2), "ab", "abc"),
+    (min_len(2), "ab", "a"),
+    (optional(instance_of(int)), None, "1"),
+    (optional([instance_of(int), lt(3)]), None, 3),
+    (and_(instance_of(int), gt(0), lt(3)), 2, 0),
+]
+
+
+def raised(func, *args):
+    """
+    Return the type, the args, and the context of the exception that calling
+    *func* with *args* raises.
+    """
+    with pytest.raises(Exception) as ei:
+        func(*args)
+
+    return type(ei.value), ei.value.args, ei.value.__context__
+
+
+class TestInlining:
+    """
+    Built-in validators are inlined into generated methods.
+    """
+
+    @pytest.mark.parametrize(("v", "good", "bad"), INLINED)
+    def test_init(self, v, good, bad):
+        """
+        Valid values pass and invalid ones raise the same errors as calling
+        the validator.
+        """
+        C = attr.make_class("C", {"x": attr.ib(validator=v)})
+
+        assert good == C(good).x
+        assert raised(v, None, fields(C).x, bad) == raised(C, bad)
+
+    @pytest.mark.parametrize(("v", "good", "bad"), INLINED)
+    @pytest.mark.parametrize(
+        "on_setattr",
+        [
+            attr.setters.validate,
+            [attr.setters.convert, attr.setters.validate],
+            None,
+        ],
+    )
+    def test_on_setattr(self, v, good, bad, on_setattr):
+        """
+        The same is true for setters.validate and the default on_setattr
+        hooks.
+        """
+        if on_setattr is None:
+            C = attr.define(type("C", (), {"x": attr.ib(validator=v)}))
+        else:
+            C = attr.make_class(
+                "C", {"x": attr.ib(validator=v)}, on_setattr=on_setattr
+            )
+        c = C(good)
+
+        c.x = good
+
+        assert good == c.x
+        assert raised(v, None, fields(C).x, bad) == raised(
+            setattr, c, "x", bad
+        )
+
+    def test_helper_names_dont_collide(self):
+        """
+        The globals an inlined validator needs don't clash with the globals of
+        fields whose names start with the validated field's name.
+        """
+        C = attr.make_class(
+            "C",
+            {
+                "x": attr.ib(validator=instance_of(int)),
+                "x_type": attr.ib(validator=instance_of(str)),
+            },
+            on_setattr=attr.setters.validate,
+        )
+        c = C(1, "a")
+        c.x_type = "b"
+
+        assert (1, "b") == (c.x, c.x_type)
+
+        with pytest.raises(TypeError, match="'x_type' must be <class 'str'>"):
+            C(1, 2)
+        with pytest.raises(TypeError, match="'x' must be <class 'int'>"):
+            c.x = "1"
+
+    def test_and_helper_names_dont_collide(self):
+        """
+        The validators that `and_` combines don't clash with the validators of
+        fields whose names start with the validated field's name.
+        """
+        C = attr.make_class(
+            "C",
+            {
+                "x": attr.ib(validator=[instance_of(int), ge(0)]),
+                "x_0": attr.ib(validator=instance_of(str)),
+                "x_1": attr.ib(validator=lt(0)),
+            },
+            on_setattr=attr.setters.validate,
+        )
+        c = C(1, "a", -1)
+
+        with pytest.raises(ValueError, match="'x' must be >= 0: -1"):
+            C(-1, "a", -1)
+        with pytest.raises(TypeError, match="'x_0' must be <class 'str'>"):
+            C(1, 1, -1)
+        with pytest.raises(ValueError, match="'x_1' must be < 0: 1"):
+            c.x_1 = 1
+        with pytest.raises(TypeError, match="'x' must be <class 'int'>"):
+            c.x = "1"
+
+    def test_converter_on_setattr(self):
+        """
+        The default on_setattr hooks convert before validating.
+        """
+
+        @attr.define
+        class C:
+            x: int = attr.field(converter=int, validator=lt(3))
+
+        c = C("1")
+        c.x = "2"
+
+        assert 2 == c.x
+
+        with pytest.raises(ValueError, match="'x' must be < 3: 3"):
+            c.x = "3"
+
+    def test_not_called_if_valid(self, monkeypatch):
+        """
+        Inlined validators are only called for invalid values.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=instance_of(int))},
+            on_setattr=attr.setters.validate,
+        )
+        c = C(1)
+
+        def fail(self, inst, attr, value):
+            raise ValueError("called")
+
+        monkeypatch.setattr(
+            validator_module._InstanceOfValidator, "__call__", fail
+        )
+
+        C(2)
+        c.x = 3
+
+        with pytest.raises(ValueError, match="called"):
+            c.x = "3"
+
+    def test_disabled(self):
+        """
+        Inlined validators respect disabled validators.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=instance_of(int))},
+            on_setattr=attr.setters.validate,
+        )
+
+        with validator_module.disabled():
+            c = C("1")
+            c.x = "2"
+
+        assert "2" == c.x
+
+    def test_subclasses_not_inlined(self):
+        """
+        Subclasses of built-in validators are called since they may change
+        what the validator does.
+        """
+
+        class LenientInstanceOf(validator_module._InstanceOfValidator):
+            def __call__(self, inst, attr, value):
+                pass
+
+        C = attr.make_class(
+            "C", {"x": attr.ib(validator=LenientInstanceOf(int))}
+        )
+
+        assert "1" == C("1").x
+
+    def test_custom_compare_func_not_inlined(self):
+        """
+        Number validators with an unexpected compare function are called.
+        """
+        v = validator_module._NumberValidator(3, "<", lambda a, b: True)
+        C = attr.make_class("C", {"x": attr.ib(validator=v)})
+
+        assert 4 == C(4).x
+
+    def test_empty_and(self):
+        """
+        and_ without validators works.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=and_())},
+            on_setattr=attr.setters.validate,
+        )
+
+        C(1).x = 2